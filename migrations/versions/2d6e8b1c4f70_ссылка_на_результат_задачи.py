@@ -0,0 +1,28 @@
+"""ссылка на результат задачи
+
+Revision ID: 2d6e8b1c4f70
+Revises: 7c3f0a5d2e61
+Create Date: 2026-10-18 17:48:26.913054
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d6e8b1c4f70"
+down_revision: str | Sequence[str] | None = "7c3f0a5d2e61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tasks", sa.Column("result_ref", sa.String(length=80), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tasks", "result_ref")
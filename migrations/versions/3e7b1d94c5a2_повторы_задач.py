@@ -0,0 +1,36 @@
+"""повторы задач
+
+Revision ID: 3e7b1d94c5a2
+Revises: 9a4c6f27e1b8
+Create Date: 2026-10-18 14:21:43.118207
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e7b1d94c5a2"
+down_revision: str | Sequence[str] | None = "9a4c6f27e1b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "tasks",
+        sa.Column("retry_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "tasks",
+        sa.Column("max_retries", sa.Integer(), server_default="3", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tasks", "max_retries")
+    op.drop_column("tasks", "retry_count")
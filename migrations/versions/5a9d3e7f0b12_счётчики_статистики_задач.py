@@ -0,0 +1,62 @@
+"""счётчики статистики задач
+
+Revision ID: 5a9d3e7f0b12
+Revises: 2d6e8b1c4f70
+Create Date: 2026-10-18 18:31:04.551870
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5a9d3e7f0b12"
+down_revision: str | Sequence[str] | None = "2d6e8b1c4f70"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+task_priority = postgresql.ENUM("LOW", "MEDIUM", "HIGH", name="task_priority", create_type=False)
+task_status = postgresql.ENUM(
+    "NEW",
+    "SCHEDULED",
+    "PENDING",
+    "IN_PROGRESS",
+    "COMPLETED",
+    "FAILED",
+    "CANCELLED",
+    name="task_status",
+    create_type=False,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "task_counters",
+        sa.Column("priority", task_priority, nullable=False),
+        sa.Column("status", task_status, nullable=False),
+        sa.Column("count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("priority", "status"),
+    )
+    op.create_table(
+        "task_latency_buckets",
+        sa.Column("metric", sa.String(length=32), nullable=False),
+        sa.Column("priority", task_priority, nullable=False),
+        sa.Column("bucket", sa.Integer(), nullable=False),
+        sa.Column("count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("metric", "priority", "bucket"),
+    )
+    # Однократный пересчёт существующих задач; дальше счётчики поддерживаются инкрементально
+    op.execute(
+        "INSERT INTO task_counters (priority, status, count) "
+        "SELECT priority, status, count(*) FROM tasks GROUP BY priority, status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("task_latency_buckets")
+    op.drop_table("task_counters")
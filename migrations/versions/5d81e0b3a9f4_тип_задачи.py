@@ -0,0 +1,31 @@
+"""тип задачи
+
+Revision ID: 5d81e0b3a9f4
+Revises: c270d950d026
+Create Date: 2026-10-18 11:02:17.530214
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d81e0b3a9f4"
+down_revision: str | Sequence[str] | None = "c270d950d026"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "tasks",
+        sa.Column("type", sa.String(length=64), server_default="default", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tasks", "type")
@@ -0,0 +1,49 @@
+"""периодические расписания
+
+Revision ID: 7c3f0a5d2e61
+Revises: e4a92c6b1f35
+Create Date: 2026-10-18 17:05:11.402816
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3f0a5d2e61"
+down_revision: str | Sequence[str] | None = "e4a92c6b1f35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "task_schedules",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("cron", sa.String(length=128), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("type", sa.String(length=64), server_default="default", nullable=False),
+        sa.Column(
+            "priority",
+            postgresql.ENUM("LOW", "MEDIUM", "HIGH", name="task_priority", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("max_retries", sa.Integer(), server_default="3", nullable=False),
+        sa.Column("enabled", sa.Boolean(), server_default="true", nullable=False),
+        sa.Column("next_fire_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_fired_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("task_schedules")
@@ -0,0 +1,28 @@
+"""контекст трассировки в outbox
+
+Revision ID: 8b2f6c4d1a93
+Revises: 5a9d3e7f0b12
+Create Date: 2026-10-18 21:05:12.340518
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2f6c4d1a93"
+down_revision: str | Sequence[str] | None = "5a9d3e7f0b12"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("task_outbox", sa.Column("traceparent", sa.String(length=55), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("task_outbox", "traceparent")
@@ -0,0 +1,42 @@
+"""индексы для списка задач
+
+Revision ID: 9a4c6f27e1b8
+Revises: 5d81e0b3a9f4
+Create Date: 2026-10-18 12:20:45.902118
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4c6f27e1b8"
+down_revision: str | Sequence[str] | None = "5d81e0b3a9f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = {
+    "ix_tasks_created_at_id": ["created_at", "id"],
+    "ix_tasks_status_created_at_id": ["status", "created_at", "id"],
+    "ix_tasks_priority_created_at_id": ["priority", "created_at", "id"],
+    "ix_tasks_status_priority_created_at_id": ["status", "priority", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY не блокирует запись в большую таблицу,
+    # но не может выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name, "tasks", columns, postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(name, table_name="tasks", postgresql_concurrently=True, if_exists=True)
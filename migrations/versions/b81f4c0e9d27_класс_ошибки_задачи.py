@@ -0,0 +1,43 @@
+"""класс ошибки задачи
+
+Revision ID: b81f4c0e9d27
+Revises: 3e7b1d94c5a2
+Create Date: 2026-10-18 15:07:12.640391
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b81f4c0e9d27"
+down_revision: str | Sequence[str] | None = "3e7b1d94c5a2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tasks", sa.Column("error_type", sa.String(length=128), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_status_finished_at_id",
+            "tasks",
+            ["status", "finished_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_status_finished_at_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("tasks", "error_type")
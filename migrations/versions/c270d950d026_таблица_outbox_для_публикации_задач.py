@@ -0,0 +1,40 @@
+"""таблица outbox для публикации задач
+
+Revision ID: c270d950d026
+Revises: aeaca44a5e65
+Create Date: 2026-10-18 10:12:40.118392
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c270d950d026"
+down_revision: str | Sequence[str] | None = "aeaca44a5e65"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "task_outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("task_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "priority",
+            postgresql.ENUM("LOW", "MEDIUM", "HIGH", name="task_priority", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("task_outbox")
@@ -0,0 +1,51 @@
+"""отложенные задачи
+
+Revision ID: e4a92c6b1f35
+Revises: b81f4c0e9d27
+Create Date: 2026-10-18 16:12:38.207554
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a92c6b1f35"
+down_revision: str | Sequence[str] | None = "b81f4c0e9d27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Новое значение enum нельзя использовать в той же транзакции,
+    # где оно добавлено, а частичный индекс на него ссылается
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE task_status ADD VALUE IF NOT EXISTS 'SCHEDULED' AFTER 'NEW'")
+
+    op.add_column("tasks", sa.Column("run_at", sa.DateTime(timezone=True), nullable=True))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_scheduled_run_at",
+            "tasks",
+            ["run_at"],
+            postgresql_where=sa.text("status = 'SCHEDULED'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_scheduled_run_at",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("tasks", "run_at")
+    # Значение SCHEDULED остаётся в типе task_status: PostgreSQL не умеет удалять значения enum
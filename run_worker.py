@@ -1,7 +1,9 @@
+import argparse
 import asyncio
 import logging
 
-from async_task_manager.workers import run_worker
+from async_task_manager.core.config import settings
+from async_task_manager.workers import run_supervisor, run_worker
 
 if __name__ == "__main__":
     logging.basicConfig(
@@ -9,13 +11,27 @@ if __name__ == "__main__":
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    parser = argparse.ArgumentParser(description="Воркер обработки задач")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.WORKER_PROCESSES,
+        help="число процессов воркера (0 — по числу ядер CPU, 1 — один процесс без супервизора)",
+    )
+    args = parser.parse_args()
+
     logger = logging.getLogger(__name__)
-    logger.info("Запуск воркера обработки задач...")
 
-    try:
-        asyncio.run(run_worker())
-    except KeyboardInterrupt:
-        logger.info("Воркер остановлен пользователем")
-    except Exception as e:
-        logger.error(f"Ошибка воркера: {e}")
-        raise
+    if args.processes != 1:
+        logger.info("Запуск супервизора процессов воркера...")
+        run_supervisor(args.processes or None)
+    else:
+        logger.info("Запуск воркера обработки задач...")
+
+        try:
+            asyncio.run(run_worker())
+        except KeyboardInterrupt:
+            logger.info("Воркер остановлен пользователем")
+        except Exception as e:
+            logger.error(f"Ошибка воркера: {e}")
+            raise
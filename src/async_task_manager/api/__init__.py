@@ -1,4 +1,15 @@
 from .health import router as health_router
+from .metrics_routes import router as metrics_router
+from .middleware import TracingMiddleware
+from .schedule_routes import router as schedule_router
 from .task_routes import router as task_router
+from .ws_routes import router as ws_router
 
-__all__ = ["task_router", "health_router"]
+__all__ = [
+    "task_router",
+    "schedule_router",
+    "health_router",
+    "metrics_router",
+    "ws_router",
+    "TracingMiddleware",
+]
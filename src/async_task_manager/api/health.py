@@ -4,8 +4,8 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from async_task_manager.core.broker import get_broker
 from async_task_manager.core.db import get_async_session
-from async_task_manager.core.rabbitmq import get_rabbitmq_manager
 from async_task_manager.schemas import HealthStatus
 
 router = APIRouter(tags=["health"])
@@ -21,7 +21,7 @@ router = APIRouter(tags=["health"])
         Проверяет состояние всех критически важных компонентов сервиса:
 
         * **database** — подключение к PostgreSQL
-        * **rabbitmq** — подключение к RabbitMQ
+        * **rabbitmq** — подключение к брокеру сообщений (RabbitMQ или очереди в памяти)
         * **status** — общий статус (true, если все компоненты работают)
 
         Возвращает HTTP 200 даже если некоторые компоненты недоступны.
@@ -42,8 +42,8 @@ async def health_check(session: AsyncSession = Depends(get_async_session)):
             raise
 
     try:
-        rabbitmq = await get_rabbitmq_manager()
-        rabbitmq_ok = rabbitmq.connection is not None and not rabbitmq.connection.is_closed
+        broker = await get_broker()
+        rabbitmq_ok = broker.connected
     except Exception as e:
         import aio_pika
 
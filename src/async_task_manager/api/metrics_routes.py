@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Response
+
+from async_task_manager.core.metrics import CONTENT_TYPE_LATEST, registry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get(
+    "/metrics",
+    summary="Метрики Prometheus",
+    description="Метрики процесса API в текстовом формате Prometheus.",
+    response_class=Response,
+    responses={200: {"description": "Метрики", "content": {"text/plain": {}}}},
+)
+async def metrics_endpoint():
+    return Response(content=registry.render(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,56 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from async_task_manager.core.tracing import TRACEPARENT_HEADER, parse_traceparent, tracer
+
+_TRACEPARENT_KEY = TRACEPARENT_HEADER.encode()
+
+
+def _path_template(scope: Scope) -> str:
+    """Путь запроса с параметрами маршрута, заменёнными на их имена."""
+    segments = scope["path"].split("/")
+    names = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    return "/".join(f"{{{names[s]}}}" if s in names else s for s in segments)
+
+
+class TracingMiddleware:
+    """
+    Корневой span HTTP-запроса.
+
+    Продолжает трассу из входящего заголовка traceparent, если он есть.
+    Span называется по шаблону маршрута (`GET /api/v1/tasks/{task_id}`), чтобы
+    запросы к разным задачам группировались вместе. Без экспортёра трассировки
+    запрос проходит без изменений.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = next(
+            (value for key, value in scope["headers"] if key == _TRACEPARENT_KEY), None
+        )
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        method = scope["method"]
+        with tracer.start_span(
+            f"{method} {scope['path']}",
+            parent=parse_traceparent(traceparent),
+            kind="server",
+            attributes={"http.method": method, "http.target": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if span is not None:
+                    span.name = f"{method} {_path_template(scope)}"
+                    span.set_attribute("http.status_code", status_code)
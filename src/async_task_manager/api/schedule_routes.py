@@ -0,0 +1,105 @@
+import uuid
+from collections.abc import Sequence
+from textwrap import dedent
+
+from fastapi import APIRouter, Depends, Path, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.db import get_async_session
+from async_task_manager.schemas import (
+    ErrorDetail,
+    TaskScheduleCreate,
+    TaskScheduleRead,
+    ValidationError,
+)
+from async_task_manager.services import (
+    create_schedule_service,
+    delete_schedule_service,
+    get_schedule_service,
+    list_schedules_service,
+)
+
+router = APIRouter(prefix="/schedules", tags=["schedules"])
+
+
+@router.post(
+    "/",
+    response_model=TaskScheduleRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Создание периодического расписания",
+    description=dedent(
+        """
+        Регистрирует шаблон задачи, который создаётся по cron-выражению.
+
+        **Параметры:**
+        * **name** — уникальное имя расписания
+        * **cron** — cron-выражение из пяти полей (минута, час, день месяца, месяц,
+          день недели), время UTC; поддерживаются `*`, списки, диапазоны и шаги
+        * **title**, **description**, **priority**, **type**, **max_retries** — шаблон задачи
+        * **enabled** — активно ли расписание (по умолчанию `true`)
+
+        **Поведение:** в момент срабатывания создаётся обычная задача в статусе PENDING
+        и ставится в очередь своего приоритета. Срабатывает только один экземпляр
+        сервиса — лидер, удерживающий advisory lock PostgreSQL. Пропущенные
+        срабатывания не навёрстываются: расписание срабатывает один раз
+        и переходит к ближайшему будущему времени.
+        """
+    ),
+    responses={
+        201: {"description": "Расписание создано", "model": TaskScheduleRead},
+        409: {"description": "Расписание с таким именем уже существует", "model": ErrorDetail},
+        422: {"description": "Ошибка валидации данных", "model": ValidationError},
+    },
+)
+async def create_schedule_endpoint(
+    schedule: TaskScheduleCreate, session: AsyncSession = Depends(get_async_session)
+):
+    return await create_schedule_service(session, schedule)
+
+
+@router.get(
+    "/",
+    response_model=list[TaskScheduleRead],
+    summary="Список расписаний",
+    responses={200: {"description": "Список расписаний", "model": list[TaskScheduleRead]}},
+)
+async def list_schedules_endpoint(
+    session: AsyncSession = Depends(get_async_session),
+) -> Sequence[TaskScheduleRead]:
+    return await list_schedules_service(session)
+
+
+@router.get(
+    "/{schedule_id}",
+    response_model=TaskScheduleRead,
+    summary="Получение расписания",
+    responses={
+        200: {"description": "Расписание найдено", "model": TaskScheduleRead},
+        404: {"description": "Расписание не найдено", "model": ErrorDetail},
+        422: {"description": "Некорректный формат UUID", "model": ValidationError},
+    },
+)
+async def get_schedule_endpoint(
+    schedule_id: uuid.UUID = Path(..., description="UUID расписания"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    return await get_schedule_service(session, schedule_id)
+
+
+@router.delete(
+    "/{schedule_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Удаление расписания",
+    description="Удаляет расписание; уже созданные им задачи остаются.",
+    responses={
+        204: {"description": "Расписание удалено"},
+        404: {"description": "Расписание не найдено", "model": ErrorDetail},
+        422: {"description": "Некорректный формат UUID", "model": ValidationError},
+    },
+)
+async def delete_schedule_endpoint(
+    schedule_id: uuid.UUID = Path(..., description="UUID расписания"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    await delete_schedule_service(session, schedule_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
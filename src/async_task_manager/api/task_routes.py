@@ -1,26 +1,50 @@
+import json
 import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from textwrap import dedent
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from async_task_manager.core.config import settings
 from async_task_manager.core.db import get_async_session
 from async_task_manager.schemas import (
     ErrorDetail,
+    ExportFormatLiteral,
+    FailedTaskFilter,
+    FailedTaskSummary,
     PriorityLiteral,
     StatusLiteral,
+    TaskBatchCreate,
     TaskCreate,
+    TaskExportFilter,
     TaskFilter,
     TaskRead,
+    TaskReplayRequest,
+    TaskStats,
     TaskStatusRead,
     ValidationError,
 )
 from async_task_manager.services import (
+    EXPORT_MEDIA_TYPES,
     cancel_task_service,
     create_task_service,
+    create_tasks_batch_service,
+    encode_failed_cursor,
+    encode_task_cursor,
+    export_tasks_service,
     filter_tasks_service,
+    get_task_result_service,
     get_task_service,
+    get_task_stats_service,
     get_task_status_service,
+    list_failed_tasks_service,
+    replay_failed_tasks_service,
+    stream_task_events_service,
+    summarize_failed_tasks_service,
+    wait_for_task_service,
 )
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -39,12 +63,17 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
         * **title** — название задачи (обязательно)
         * **description** — описание задачи (обязательно)
         * **priority** — приоритет задачи: LOW, MEDIUM или HIGH (обязательно)
+        * **type** — тип задачи, определяет обработчик в воркере (по умолчанию `default`)
+        * **max_retries** — сколько раз повторить задачу после ошибки (по умолчанию 3)
+        * **run_at** — время отложенного запуска с часовым поясом (необязательно)
 
         **Поведение:**
-        1. Задача создается со **статусом** NEW
-        2. Статус изменяется на PENDING
-        3. Задача отправляется в RabbitMQ для обработки
-        4. Возвращается созданная задача
+        1. Задача записывается одним запросом `INSERT ... RETURNING` сразу со **статусом** PENDING
+        2. В той же транзакции сообщение о задаче записывается в outbox
+        3. Возвращается созданная задача; публикацию в RabbitMQ выполняет ретранслятор outbox
+
+        Если **run_at** в будущем, задача получает статус **SCHEDULED** без сообщения в outbox;
+        в момент run_at планировщик переводит её в PENDING и ставит в очередь.
 
         **Приоритеты влияют на скорость обработки:**
         * **HIGH** — высший приоритет, обрабатывается быстрее всего
@@ -64,6 +93,52 @@ async def create_task_endpoint(
     return await create_task_service(session, data)
 
 
+async def _iter_task_ids_ndjson(task_ids: Sequence[uuid.UUID]) -> AsyncIterator[bytes]:
+    """Построчная (NDJSON) выдача идентификаторов созданных задач."""
+    for task_id in task_ids:
+        yield (json.dumps({"id": str(task_id)}) + "\n").encode()
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_class=StreamingResponse,
+    summary="Пакетное создание задач",
+    description=dedent(
+        """
+        Создает пакет задач (до 10 000 за запрос) и отправляет их в очередь.
+
+        **Параметры:**
+        * **tasks** — список задач в формате `TaskCreate`
+
+        **Поведение:**
+        1. Все задачи вставляются многострочным INSERT в одной транзакции сразу со статусом PENDING
+        2. В той же транзакции сообщения записываются в outbox; ретранслятор публикует их
+           в RabbitMQ пакетами, подтверждения брокера собираются в конце пакета
+        3. Идентификаторы созданных задач возвращаются потоком в формате NDJSON:
+           по одной строке `{"id": "<uuid>"}` на задачу в порядке запроса
+        """
+    ),
+    responses={
+        201: {
+            "description": "Задачи успешно созданы",
+            "content": {"application/x-ndjson": {}},
+        },
+        422: {"description": "Ошибка валидации данных", "model": ValidationError},
+    },
+)
+async def create_tasks_batch_endpoint(
+    data: TaskBatchCreate,
+    session: AsyncSession = Depends(get_async_session),
+):
+    task_ids = await create_tasks_batch_service(session, data)
+    return StreamingResponse(
+        _iter_task_ids_ndjson(task_ids),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get(
     "/",
     response_model=list[TaskRead],
@@ -73,26 +148,46 @@ async def create_task_endpoint(
         Возвращает список задач с возможностью **фильтрации** и **пагинации**.
 
         **Параметры фильтрации:**
-        * **status** — фильтр по статусу (NEW, PENDING, IN_PROGRESS, COMPLETED, FAILED, CANCELLED)
+        * **status** — фильтр по статусу (NEW, SCHEDULED, PENDING, IN_PROGRESS, COMPLETED, FAILED, CANCELLED)
         * **priority** — фильтр по приоритету (LOW, MEDIUM, HIGH)
 
+        Задачи упорядочены от новых к старым по (`created_at`, `id`).
+
         **Параметры пагинации:**
         * **skip** — количество пропускаемых записей (по умолчанию 0)
         * **limit** — максимальное количество записей в ответе (1-100, по умолчанию 10)
+        * **cursor** — курсор следующей страницы из заголовка ответа `X-Next-Cursor`;
+          если задан, `skip` не используется
+
+        Если страница заполнена полностью, в заголовке `X-Next-Cursor` возвращается курсор
+        следующей страницы. Страница по курсору выбирается по индексу и стоит столько же,
+        сколько первая, независимо от глубины — в отличие от `skip`.
 
         **Примеры запросов:**
         * `GET /tasks` — все задачи (первые 10)
         * `GET /tasks?status=COMPLETED` — только завершённые задачи
         * `GET /tasks?priority=HIGH&limit=20` — задачи с высоким приоритетом (до 20 штук)
         * `GET /tasks?skip=20&limit=10` — задачи с 21-й по 30-ю
+        * `GET /tasks?cursor=<X-Next-Cursor>` — следующая страница по курсору
         """
     ),
     responses={
-        200: {"description": "Список задач", "model": list[TaskRead]},
+        200: {
+            "description": "Список задач",
+            "model": list[TaskRead],
+            "headers": {
+                "X-Next-Cursor": {
+                    "description": "Курсор следующей страницы (если страница заполнена)",
+                    "schema": {"type": "string"},
+                }
+            },
+        },
+        400: {"description": "Некорректный курсор", "model": ErrorDetail},
         422: {"description": "Ошибка валидации параметров", "model": ValidationError},
     },
 )
 async def list_tasks_endpoint(
+    response: Response,
     status_: StatusLiteral | None = Query(
         None,
         alias="status",
@@ -117,10 +212,213 @@ async def list_tasks_endpoint(
         description="Максимальное количество записей (1-100)",
         examples={"example": {"summary": "Лимит", "value": 10}},
     ),
+    cursor: str | None = Query(
+        None,
+        description="Курсор следующей страницы (заголовок X-Next-Cursor предыдущего ответа)",
+    ),
+    session: AsyncSession = Depends(get_async_session),
+):
+    filters = TaskFilter(status=status_, priority=priority, skip=skip, limit=limit, cursor=cursor)
+    tasks = await filter_tasks_service(session, filters)
+    if len(tasks) == limit:
+        response.headers["X-Next-Cursor"] = encode_task_cursor(tasks[-1])
+    return tasks
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStats,
+    summary="Статистика задач",
+    description=dedent(
+        """
+        Возвращает число задач по статусам и приоритетам, а также квантили
+        (p50, p90, p99) времени ожидания в очереди и времени выполнения по приоритетам.
+
+        Статистика поддерживается инкрементально при каждом переходе статуса
+        и читается из таблиц счётчиков, поэтому время ответа не зависит от числа задач.
+        Данные отстают не больше чем на `STATS_FLUSH_INTERVAL` секунд.
+        """
+    ),
+    responses={200: {"description": "Статистика задач", "model": TaskStats}},
+)
+async def get_task_stats_endpoint(session: AsyncSession = Depends(get_async_session)):
+    return await get_task_stats_service(session)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Потоковая выгрузка задач (NDJSON или CSV)",
+    description=dedent(
+        """
+        Выгружает все задачи, подходящие под фильтры, одним потоковым ответом —
+        без постраничных запросов и ограничения `limit`.
+
+        **Параметры:**
+        * **format** — `ndjson` (строка JSON на задачу) или `csv` (с заголовком)
+        * **status**, **priority** — фильтры как у списка задач
+        * **since**, **until** — окно времени создания
+
+        Задачи читаются из БД серверным курсором порциями по `EXPORT_CHUNK_SIZE`
+        по возрастанию времени создания; память сервиса не зависит от объёма выгрузки.
+        """
+    ),
+    responses={
+        200: {
+            "description": "Поток задач",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        422: {"description": "Ошибка валидации параметров", "model": ValidationError},
+    },
+)
+async def export_tasks_endpoint(
+    format_: ExportFormatLiteral = Query("ndjson", alias="format", description="Формат выгрузки"),
+    status_: StatusLiteral | None = Query(None, alias="status", description="Статус задачи"),
+    priority: PriorityLiteral | None = Query(None, description="Приоритет задачи"),
+    since: datetime | None = Query(None, description="Созданы не раньше"),
+    until: datetime | None = Query(None, description="Созданы раньше"),
     session: AsyncSession = Depends(get_async_session),
 ):
-    filters = TaskFilter(status=status_, priority=priority, skip=skip, limit=limit)
-    return await filter_tasks_service(session, filters)
+    filters = TaskExportFilter(
+        format=format_, status=status_, priority=priority, since=since, until=until
+    )
+    return StreamingResponse(
+        export_tasks_service(session, filters),
+        media_type=EXPORT_MEDIA_TYPES[format_],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format_}"'},
+    )
+
+
+@router.get(
+    "/failed",
+    response_model=list[TaskRead],
+    summary="Список упавших задач",
+    description=dedent(
+        """
+        Возвращает задачи в статусе **FAILED** от последних к ранним.
+
+        **Параметры:**
+        * **error_type** — класс ошибки (например, `TimeoutError`)
+        * **since**, **until** — окно времени завершения
+        * **limit** — количество записей (1–100)
+        * **cursor** — курсор из заголовка `X-Next-Cursor` предыдущей страницы
+        """
+    ),
+    responses={
+        200: {"description": "Список упавших задач", "model": list[TaskRead]},
+        400: {"description": "Некорректный курсор", "model": ErrorDetail},
+    },
+)
+async def list_failed_tasks_endpoint(
+    response: Response,
+    error_type: str | None = Query(None, description="Класс ошибки"),
+    since: datetime | None = Query(None, description="Завершены не раньше"),
+    until: datetime | None = Query(None, description="Завершены раньше"),
+    limit: int = Query(10, ge=1, le=100, description="Количество записей"),
+    cursor: str | None = Query(None, description="Курсор следующей страницы"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    filters = FailedTaskFilter(
+        error_type=error_type, since=since, until=until, limit=limit, cursor=cursor
+    )
+    tasks = await list_failed_tasks_service(session, filters)
+    if len(tasks) == limit:
+        response.headers["X-Next-Cursor"] = encode_failed_cursor(tasks[-1])
+    return tasks
+
+
+@router.get(
+    "/failed/errors",
+    response_model=list[FailedTaskSummary],
+    summary="Упавшие задачи по классам ошибок",
+    description=dedent(
+        """
+        Возвращает число задач в статусе **FAILED** и время последнего падения
+        по каждому классу ошибки в окне времени завершения **since**–**until**.
+        """
+    ),
+)
+async def summarize_failed_tasks_endpoint(
+    since: datetime | None = Query(None, description="Завершены не раньше"),
+    until: datetime | None = Query(None, description="Завершены раньше"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    return await summarize_failed_tasks_service(session, since, until)
+
+
+@router.post(
+    "/failed/replay",
+    response_class=StreamingResponse,
+    summary="Повторный запуск упавших задач",
+    description=dedent(
+        """
+        Возвращает упавшие задачи в очередь порциями с ограничением темпа.
+
+        **Параметры:**
+        * **error_type**, **since**, **until** — какие задачи повторить
+        * **limit** — сколько задач повторить всего (по умолчанию — все)
+        * **batch_size** — размер порции (одна транзакция)
+        * **rate** — не больше задач в секунду (до `REPLAY_MAX_RATE`)
+        * **cursor** — продолжить прерванный повтор
+
+        **Поведение:**
+        1. Каждая порция переводится из FAILED в PENDING и попадает в outbox одной транзакцией
+        2. После каждой порции в поток NDJSON пишется `{"replayed", "total", "cursor"}`
+        3. В конце — `{"done": true, "total", "cursor"}`
+
+        Если соединение оборвалось, повтор можно продолжить с последнего курсора.
+        """
+    ),
+    responses={
+        200: {"description": "Ход повтора", "content": {"application/x-ndjson": {}}},
+        400: {"description": "Некорректный курсор или темп", "model": ErrorDetail},
+        422: {"description": "Ошибка валидации данных", "model": ValidationError},
+    },
+)
+async def replay_failed_tasks_endpoint(
+    data: TaskReplayRequest,
+    session: AsyncSession = Depends(get_async_session),
+):
+    return StreamingResponse(
+        replay_failed_tasks_service(session, data), media_type="application/x-ndjson"
+    )
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    summary="Поток статусов задач (Server-Sent Events)",
+    description=dedent(
+        """
+        Открывает поток **Server-Sent Events** со статусами набора задач вместо опроса
+        `GET /tasks/{task_id}/status` в цикле.
+
+        **Параметры:**
+        * **ids** — UUID задач (параметр повторяется, не более `TASK_EVENTS_MAX_IDS`)
+
+        **Поведение:**
+        1. Сначала передаются текущие статусы всех задач
+        2. Затем — каждый переход статуса: `event: status`, `data: {"id": "...", "status": "..."}`
+        3. Поток закрывается, когда все задачи достигли итогового статуса
+           (COMPLETED, FAILED, CANCELLED); в паузах передаются комментарии `: keepalive`
+        """
+    ),
+    responses={
+        200: {"description": "Поток событий", "content": {"text/event-stream": {}}},
+        400: {"description": "Пустой или слишком большой набор задач", "model": ErrorDetail},
+        404: {"description": "Задача не найдена", "model": ErrorDetail},
+    },
+)
+async def stream_task_events_endpoint(
+    ids: list[uuid.UUID] = Query(..., description="UUID задач"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    events = await stream_task_events_service(session, ids)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -162,6 +460,38 @@ async def get_task_endpoint(
     return await get_task_service(session, task_id)
 
 
+@router.get(
+    "/{task_id}/result",
+    response_class=StreamingResponse,
+    summary="Результат задачи",
+    description=dedent(
+        """
+        Возвращает результат завершённой задачи как текст.
+
+        Результат больше `RESULT_INLINE_MAX_BYTES` байт не хранится в строке задачи
+        (в ней остаётся только **result_ref**) и отдаётся потоком из хранилища
+        результатов, не загружаясь в память целиком.
+        """
+    ),
+    responses={
+        200: {"description": "Результат задачи", "content": {"text/plain": {}}},
+        404: {"description": "Задача или результат не найдены", "model": ErrorDetail},
+        409: {"description": "Задача не завершена", "model": ErrorDetail},
+        422: {"description": "Некорректный формат UUID", "model": ValidationError},
+    },
+)
+async def get_task_result_endpoint(
+    task_id: uuid.UUID = Path(..., description="UUID задачи"),
+    session: AsyncSession = Depends(get_async_session),
+):
+    chunks, size = await get_task_result_service(session, task_id)
+    return StreamingResponse(
+        chunks,
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Length": str(size)},
+    )
+
+
 @router.get(
     "/{task_id}/status",
     response_model=TaskStatusRead,
@@ -175,13 +505,15 @@ async def get_task_endpoint(
 
         **Возможные статусы:**
         * `NEW` — задача только создана
+        * `SCHEDULED` — ожидает времени запуска
         * `PENDING` — ожидает обработки
         * `IN_PROGRESS` — в процессе выполнения
         * `COMPLETED` — успешно завершена
         * `FAILED` — завершена с ошибкой
         * `CANCELLED` — отменена пользователем
 
-        **Использование:** идеально подходит для быстрой проверки статуса задачи без загрузки всех данных.
+        **Использование:** идеально подходит для частого опроса статуса задачи: из БД читается
+        только колонка `status`, ответ кэшируется в памяти и сбрасывается при каждом переходе статуса.
         """
     ),
     responses={
@@ -206,6 +538,39 @@ async def get_task_status_endpoint(
     return await get_task_status_service(session, task_id)
 
 
+@router.get(
+    "/{task_id}/wait",
+    response_model=TaskStatusRead,
+    summary="Ожидание завершения задачи (long-poll)",
+    description=dedent(
+        """
+        Держит запрос, пока задача не достигнет итогового статуса
+        (COMPLETED, FAILED, CANCELLED), но не дольше **timeout** секунд.
+
+        **Параметры:**
+        * **task_id** — UUID задачи
+        * **timeout** — максимальное время ожидания в секундах (до `TASK_WAIT_MAX_TIMEOUT`)
+
+        **Возвращает:** статус задачи. Если по истечении timeout задача ещё выполняется,
+        возвращается текущий статус — запрос можно повторить.
+        """
+    ),
+    responses={
+        200: {"description": "Статус задачи", "model": TaskStatusRead},
+        404: {"description": "Задача не найдена", "model": ErrorDetail},
+        422: {"description": "Некорректный формат UUID или timeout", "model": ValidationError},
+    },
+)
+async def wait_for_task_endpoint(
+    task_id: uuid.UUID = Path(..., description="UUID задачи"),
+    timeout: float = Query(
+        30.0, gt=0, le=settings.TASK_WAIT_MAX_TIMEOUT, description="Время ожидания, с"
+    ),
+    session: AsyncSession = Depends(get_async_session),
+):
+    return await wait_for_task_service(session, task_id, timeout)
+
+
 @router.delete(
     "/{task_id}",
     response_model=TaskRead,
@@ -220,6 +585,7 @@ async def get_task_status_endpoint(
         **Ограничения:** задачу можно отменить **только** если она находится в одном из статусов:
 
         * `NEW` — только создана, ещё не обрабатывается
+        * `SCHEDULED` — ожидает времени запуска
         * `PENDING` — ожидает обработки в очереди
         * `IN_PROGRESS` — в процессе выполнения
 
@@ -0,0 +1,85 @@
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+
+from async_task_manager.schemas import TaskSubscriptionMessage
+from async_task_manager.services.task_subscriptions import (
+    StatusSubscriber,
+    SubscriberLimitError,
+    task_subscription_hub,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["ws"])
+
+
+async def _send_events(websocket: WebSocket, subscriber: StatusSubscriber) -> None:
+    """Отправка событий из очереди подписчика; None — отключение за медленное чтение."""
+    while True:
+        payload = await subscriber.queue.get()
+        if payload is None:
+            await websocket.close(
+                code=status.WS_1013_TRY_AGAIN_LATER,
+                reason="Клиент не успевает получать события",
+            )
+            return
+        await websocket.send_text(payload)
+
+
+def _reply(subscriber: StatusSubscriber, reply: dict) -> None:
+    """Ответ клиенту через ту же очередь, что и события (порядок сохраняется)."""
+    if not subscriber.offer(json.dumps(reply)):
+        logger.warning("Очередь WebSocket-подписчика переполнена, ответ отброшен")
+
+
+@router.websocket("/ws/tasks")
+async def task_subscriptions_ws(websocket: WebSocket):
+    """
+    Подписка на переходы статусов задач.
+
+    Клиент присылает JSON-сообщения `TaskSubscriptionMessage`:
+    `{"action": "subscribe", "task_ids": [...]}` или
+    `{"action": "subscribe", "filter": {"priority": "HIGH"}}` (аналогично `unsubscribe`).
+    Сервер отправляет `{"type": "status", "id", "status", "priority", "at"}` на каждый
+    переход, подтверждения `{"type": "subscribed" | "unsubscribed"}` и ошибки
+    `{"type": "error", "detail"}`.
+    """
+    await websocket.accept()
+    try:
+        subscriber = task_subscription_hub.connect()
+    except SubscriberLimitError as e:
+        logger.warning(f"WebSocket-подключение отклонено: {e}")
+        await websocket.close(
+            code=status.WS_1013_TRY_AGAIN_LATER, reason="Слишком много подписчиков"
+        )
+        return
+
+    sender = asyncio.create_task(_send_events(websocket, subscriber))
+    try:
+        while not subscriber.dropped:
+            raw = await websocket.receive_text()
+            try:
+                message = TaskSubscriptionMessage.model_validate_json(raw)
+                task_subscription_hub.apply(subscriber, message)
+            except (ValidationError, ValueError) as e:
+                _reply(subscriber, {"type": "error", "detail": str(e)})
+                continue
+            _reply(
+                subscriber,
+                {
+                    "type": f"{message.action}d",
+                    "task_ids": len(subscriber.task_ids),
+                    "filters": len(subscriber.filters),
+                },
+            )
+    except WebSocketDisconnect:
+        pass
+    finally:
+        task_subscription_hub.disconnect(subscriber)
+        if not subscriber.dropped:
+            sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
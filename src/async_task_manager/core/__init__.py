@@ -1,4 +1,12 @@
+from .broker import TaskBroker, get_broker, task_broker
 from .db import get_async_session
 from .rabbitmq import get_rabbitmq_manager, rabbitmq_manager
 
-__all__ = ["get_async_session", "get_rabbitmq_manager", "rabbitmq_manager"]
+__all__ = [
+    "TaskBroker",
+    "get_async_session",
+    "get_broker",
+    "get_rabbitmq_manager",
+    "rabbitmq_manager",
+    "task_broker",
+]
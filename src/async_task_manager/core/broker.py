@@ -0,0 +1,122 @@
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.events import TaskStatusEvent
+
+PRIORITIES = ["HIGH", "MEDIUM", "LOW"]
+
+# Очередь режима broker_priority: одна очередь с приоритетами сообщений для всех приоритетов
+PRIORITY_QUEUE_KEY = "ALL"
+MAX_MESSAGE_PRIORITY = 10
+MESSAGE_PRIORITIES = {"HIGH": 9, "MEDIUM": 5, "LOW": 1}
+
+
+def retry_delay(level: int) -> float:
+    """Задержка очереди повторов уровня level, секунды."""
+    return settings.WORKER_RETRY_BASE_DELAY * 2**level
+
+
+class TaskBroker(ABC):
+    """
+    Брокер сообщений о задачах.
+
+    Доставляет сообщения о задачах воркерам (очереди приоритетов, повторы
+    с задержкой, «мёртвые» задачи) и рассылает всем процессам события
+    статусов и отмены. Сообщение, переданное consumer'у, имеет `body`,
+    `headers` и асинхронный контекст `process()`, который подтверждает
+    сообщение при успехе и отклоняет при ошибке, как в aio_pika.
+    """
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        """Подключение установлено: сообщения можно публиковать и получать."""
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Подключиться к брокеру и объявить очереди."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Закрыть подключение."""
+
+    @abstractmethod
+    async def publish_task(self, task_id: uuid.UUID, priority: str) -> None:
+        """Отправить задачу в очередь по приоритету."""
+
+    @abstractmethod
+    async def publish_tasks(self, tasks: Iterable[tuple[uuid.UUID, str, str | None]]) -> None:
+        """Отправить пакет задач: тройки (UUID задачи, приоритет, traceparent или None)."""
+
+    @abstractmethod
+    async def publish_retry(self, task_id: uuid.UUID, priority: str, attempt: int) -> float:
+        """Отложить повтор задачи; возвращает задержку в секундах."""
+
+    @abstractmethod
+    async def publish_dead_letter(self, task_id: uuid.UUID, priority: str, error: str) -> None:
+        """Сохранить окончательно упавшую задачу в очереди «мёртвых» задач."""
+
+    @abstractmethod
+    async def consume_tasks(
+        self,
+        priority: str,
+        callback: Callable[[Any], Awaitable[None]],
+        prefetch_count: int | None = None,
+    ) -> None:
+        """Начать получение задач очереди приоритета (или PRIORITY_QUEUE_KEY)."""
+
+    @abstractmethod
+    async def cancel_consumers(self) -> None:
+        """Прекратить получение новых сообщений; доставленные можно подтвердить."""
+
+    @abstractmethod
+    async def publish_status_event(self, event: TaskStatusEvent) -> None:
+        """Разослать событие смены статуса задачи всем подписчикам."""
+
+    @abstractmethod
+    async def consume_status_events(
+        self, callback: Callable[[TaskStatusEvent], Awaitable[None]]
+    ) -> None:
+        """Подписаться на события смены статусов задач."""
+
+    @abstractmethod
+    async def publish_cancellation(self, task_id: uuid.UUID) -> None:
+        """Разослать всем воркерам отмену задачи."""
+
+    @abstractmethod
+    async def consume_cancellations(self, callback: Callable[[uuid.UUID], Awaitable[None]]) -> None:
+        """Подписаться на отмены задач."""
+
+
+_broker: TaskBroker | None = None
+
+
+def task_broker() -> TaskBroker:
+    """
+    Брокер процесса, выбранный настройкой BROKER_BACKEND.
+
+    rabbitmq — RabbitMQ (aio_pika); memory — очереди в памяти процесса,
+    для развёртывания API и воркера в одном процессе и для тестов.
+    """
+    global _broker
+    if _broker is None:
+        if settings.BROKER_BACKEND == "memory":
+            from async_task_manager.core.memory_broker import InMemoryBroker
+
+            _broker = InMemoryBroker()
+        else:
+            from async_task_manager.core.rabbitmq import rabbitmq_manager
+
+            _broker = rabbitmq_manager
+    return _broker
+
+
+async def get_broker() -> TaskBroker:
+    """Получить брокер процесса, подключившись при необходимости."""
+    broker = task_broker()
+    if not broker.connected:
+        await broker.connect()
+    return broker
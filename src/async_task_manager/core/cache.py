@@ -0,0 +1,73 @@
+import time
+import uuid
+from collections import OrderedDict
+from itertools import count
+
+from async_task_manager.core.config import settings
+
+# Отметка о сбросе записи: значение счётчика на момент invalidate()
+_Tombstone = int
+
+
+class TaskStatusCache:
+    """
+    Кэш статусов задач в памяти процесса API (LRU с TTL).
+
+    Запись сбрасывается при каждом переходе статуса (событие tasks.events).
+    Чтобы значение, прочитанное из БД до перехода, не попало в кэш после
+    сброса, чтение начинается с stamp(), а set() игнорируется, если запись
+    была сброшена после этой отметки.
+    """
+
+    def __init__(self, max_size: int | None = None, ttl: float | None = None):
+        self.max_size = max_size or settings.STATUS_CACHE_MAX_SIZE
+        self.ttl = ttl if ttl is not None else settings.STATUS_CACHE_TTL
+        self._entries: OrderedDict[uuid.UUID, tuple[float, str | _Tombstone]] = OrderedDict()
+        self._counter = count(1)
+
+    def stamp(self) -> int:
+        """Отметка начала чтения из БД для последующего set()."""
+        return next(self._counter)
+
+    def get(self, task_id: uuid.UUID) -> str | None:
+        """Статус задачи из кэша или None."""
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[task_id]
+            return None
+        if not isinstance(value, str):
+            return None
+
+        self._entries.move_to_end(task_id)
+        return value
+
+    def set(self, task_id: uuid.UUID, status: str, stamp: int | None = None) -> None:
+        """Запомнить статус, если запись не сбрасывалась после отметки stamp."""
+        entry = self._entries.get(task_id)
+        if stamp is not None and entry is not None:
+            expires_at, value = entry
+            if not isinstance(value, str) and value > stamp and expires_at >= time.monotonic():
+                return
+
+        self._put(task_id, status)
+
+    def invalidate(self, task_id: uuid.UUID) -> None:
+        """Сбросить статус задачи (оставив отметку о сбросе)."""
+        self._put(task_id, next(self._counter))
+
+    def clear(self) -> None:
+        """Очистить кэш."""
+        self._entries.clear()
+
+    def _put(self, task_id: uuid.UUID, value: str | _Tombstone) -> None:
+        self._entries[task_id] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(task_id)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+task_status_cache = TaskStatusCache()
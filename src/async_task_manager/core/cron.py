@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# (минимум, максимум) значений полей cron: минута, час, день месяца, месяц, день недели
+_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# Поиск следующего срабатывания ограничен: выражение вроде «30 февраля» не сработает никогда
+_MAX_SEARCH_YEARS = 5
+
+
+class CronError(ValueError):
+    """Некорректное cron-выражение."""
+
+
+def _parse_field(field: str, low: int, high: int) -> frozenset[int]:
+    """Разобрать поле cron: `*`, `a`, `a-b`, `*/n`, `a-b/n` и списки через запятую."""
+    values: set[int] = set()
+    for part in field.split(","):
+        body, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise CronError(f"Некорректный шаг в поле «{field}»")
+
+        if body == "*":
+            start, end = low, high
+        elif "-" in body:
+            start_text, end_text = body.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(body)
+            end = high if step_text else start
+
+        if not low <= start <= end <= high:
+            raise CronError(f"Значение поля «{field}» вне диапазона {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True, slots=True)
+class CronExpression:
+    """
+    Разобранное cron-выражение из пяти полей (минута, час, день месяца,
+    месяц, день недели; воскресенье — 0 или 7).
+
+    Как в классическом cron, если ограничены и день месяца, и день недели,
+    достаточно совпадения любого из них.
+    """
+
+    expression: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronExpression":
+        """Разобрать выражение; CronError, если оно некорректно."""
+        fields = expression.split()
+        if len(fields) != 5:
+            raise CronError("Cron-выражение должно состоять из 5 полей")
+
+        try:
+            parsed = [
+                _parse_field(field, low, high)
+                for field, (low, high) in zip(fields, _FIELD_RANGES, strict=True)
+            ]
+        except ValueError as e:
+            if isinstance(e, CronError):
+                raise
+            raise CronError(f"Некорректное cron-выражение «{expression}»") from None
+
+        # 7 в поле дня недели — тоже воскресенье
+        parsed[4] = frozenset(day % 7 for day in parsed[4])
+        return cls(
+            expression,
+            *parsed,
+            days_restricted=fields[2] != "*",
+            weekdays_restricted=fields[4] != "*",
+        )
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.isoweekday() % 7) in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Ближайшее время срабатывания строго после moment (с точностью до минуты).
+
+        Поиск идёт крупными шагами: не подходящий месяц пропускается целиком,
+        затем день, затем час, поэтому число итераций не зависит от того,
+        насколько далеко следующее срабатывание.
+        """
+        current = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment.year + _MAX_SEARCH_YEARS
+
+        while current.year <= limit:
+            if current.month not in self.months:
+                year, month = divmod(current.month, 12)
+                current = current.replace(year=current.year + year, month=month + 1, day=1)
+                current = current.replace(hour=0, minute=0)
+                continue
+            if not self._day_matches(current):
+                current = (current + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if current.hour not in self.hours:
+                current = (current + timedelta(hours=1)).replace(minute=0)
+                continue
+            if current.minute not in self.minutes:
+                current += timedelta(minutes=1)
+                continue
+            return current
+
+        raise CronError(f"Выражение «{self.expression}» не срабатывает в ближайшие годы")
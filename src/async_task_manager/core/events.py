@@ -0,0 +1,83 @@
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStatusEvent:
+    """
+    Событие смены статуса задачи.
+
+    Публикуется воркером и API в fanout-exchange tasks.events при каждом
+    переходе статуса и рассылается всем экземплярам API.
+    """
+
+    task_id: uuid.UUID
+    status: str
+    priority: str | None = None
+    at: float = field(default_factory=time.time)
+
+    def to_bytes(self) -> bytes:
+        """Сериализовать событие в JSON."""
+        return json.dumps(
+            {
+                "task_id": str(self.task_id),
+                "status": self.status,
+                "priority": self.priority,
+                "at": self.at,
+            }
+        ).encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TaskStatusEvent":
+        """Разобрать событие из JSON."""
+        raw = json.loads(data)
+        return cls(
+            task_id=uuid.UUID(raw["task_id"]),
+            status=raw["status"],
+            priority=raw.get("priority"),
+            at=raw.get("at", time.time()),
+        )
+
+
+class TaskEventHub:
+    """
+    Рассылка событий смены статуса ожидающим их запросам внутри процесса API.
+
+    Каждый запрос (long-poll или SSE) получает собственную очередь событий
+    по интересующим его задачам; события остальных задач до него не доходят.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[uuid.UUID, set[asyncio.Queue[TaskStatusEvent]]] = {}
+
+    @contextmanager
+    def subscribe(self, task_ids: Iterable[uuid.UUID]) -> Iterator[asyncio.Queue[TaskStatusEvent]]:
+        """Подписаться на события задач на время блока with."""
+        task_ids = set(task_ids)
+        queue: asyncio.Queue[TaskStatusEvent] = asyncio.Queue()
+        for task_id in task_ids:
+            self._subscribers.setdefault(task_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            for task_id in task_ids:
+                queues = self._subscribers.get(task_id)
+                if queues is None:
+                    continue
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[task_id]
+
+    def publish(self, event: TaskStatusEvent) -> None:
+        """Передать событие всем подписчикам задачи."""
+        for queue in self._subscribers.get(event.task_id, ()):
+            queue.put_nowait(event)
+
+    def subscriber_count(self) -> int:
+        """Число задач, на события которых есть подписка."""
+        return len(self._subscribers)
@@ -0,0 +1,298 @@
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import random
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from async_task_manager.core.broker import (
+    MESSAGE_PRIORITIES,
+    PRIORITIES,
+    PRIORITY_QUEUE_KEY,
+    TaskBroker,
+    retry_delay,
+)
+from async_task_manager.core.config import settings
+from async_task_manager.core.events import TaskStatusEvent
+from async_task_manager.core.tracing import TRACEPARENT_HEADER, tracer
+
+logger = logging.getLogger(__name__)
+
+# Сколько последних «мёртвых» задач хранить в памяти
+DEAD_LETTERS_MAX_SIZE = 10_000
+
+
+class InMemoryMessage:
+    """
+    Сообщение очереди в памяти.
+
+    Повторяет используемую часть aio_pika.IncomingMessage: body, headers,
+    redelivered, ack/reject/nack и контекст process().
+    """
+
+    __slots__ = ("_consumer", "_settled", "body", "headers", "priority", "queue", "redelivered")
+
+    def __init__(self, queue: str, body: bytes, headers: dict[str, Any], priority: int = 0):
+        self.queue = queue
+        self.body = body
+        self.headers = headers
+        self.priority = priority
+        self.redelivered = False
+        self._consumer: _Consumer | None = None
+        self._settled = False
+
+    def _settle(self) -> "_Consumer | None":
+        if self._settled:
+            raise RuntimeError("Сообщение уже подтверждено или отклонено")
+        self._settled = True
+        consumer, self._consumer = self._consumer, None
+        if consumer is not None:
+            consumer.release(self)
+        return consumer
+
+    async def ack(self) -> None:
+        self._settle()
+
+    async def reject(self, requeue: bool = False) -> None:
+        consumer = self._settle()
+        if requeue and consumer is not None:
+            consumer.broker._requeue(self)
+
+    async def nack(self, requeue: bool = True) -> None:
+        await self.reject(requeue=requeue)
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False):
+        """Подтвердить сообщение после блока или отклонить, если блок упал."""
+        try:
+            yield self
+        except BaseException:
+            if not self._settled:
+                await self.reject(requeue=requeue)
+            raise
+        else:
+            if not self._settled:
+                await self.ack()
+
+
+class _Consumer:
+    """Consumer очереди: доставляет сообщения, пока неподтверждённых меньше prefetch_count."""
+
+    def __init__(
+        self,
+        broker: "InMemoryBroker",
+        queue: str,
+        callback: Callable[[InMemoryMessage], Awaitable[None]],
+        prefetch_count: int,
+    ):
+        self.broker = broker
+        self.queue = queue
+        self.callback = callback
+        self.slots = asyncio.Semaphore(prefetch_count)
+        self.unacked: set[InMemoryMessage] = set()
+        self.handlers: set[asyncio.Task] = set()
+        self.task = asyncio.create_task(self.run())
+
+    def release(self, message: InMemoryMessage) -> None:
+        self.unacked.discard(message)
+        self.slots.release()
+
+    async def run(self) -> None:
+        queue = self.broker._queues[self.queue]
+        while True:
+            await self.slots.acquire()
+            _, _, message = await queue.get()
+            message._consumer = self
+            self.unacked.add(message)
+            handler = asyncio.create_task(self.callback(message))
+            self.handlers.add(handler)
+            handler.add_done_callback(self._handler_done)
+
+    def _handler_done(self, handler: asyncio.Task) -> None:
+        self.handlers.discard(handler)
+        if not handler.cancelled() and handler.exception() is not None:
+            logger.error(f"Ошибка обработки сообщения очереди {self.queue}: {handler.exception()}")
+
+    async def cancel(self) -> None:
+        self.task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.task
+
+
+class InMemoryBroker(TaskBroker):
+    """
+    Брокер на очередях asyncio в памяти процесса.
+
+    Для небольших развёртываний, где API и воркер работают в одном процессе,
+    и для тестов: сообщение доходит до воркера без сети и сериализации
+    в брокере. Топология повторяет RabbitMQ: очереди по приоритетам или одна
+    очередь с приоритетами сообщений (WORKER_SCHEDULING_MODE=broker_priority),
+    prefetch_count ограничивает неподтверждённые сообщения consumer'а,
+    отклонённое с requeue и неподтверждённое к закрытию сообщение
+    доставляется повторно с флагом redelivered. Повторы ждут задержку
+    уровня с jitter, как очереди повторов RabbitMQ.
+
+    Сообщения не переживают перезапуск процесса: неопубликованные задачи
+    остаются в outbox и будут отправлены снова, а уже опубликованные, но
+    не выполненные остаются в статусе PENDING без сообщения. Поэтому
+    backend memory не подходит для развёртываний с отдельными процессами
+    воркеров и для задач, которые нельзя потерять при перезапуске.
+    """
+
+    def __init__(self, scheduling_mode: str | None = None):
+        self.scheduling_mode = scheduling_mode or settings.WORKER_SCHEDULING_MODE
+        self._queues: dict[str, asyncio.PriorityQueue] = {}
+        self._consumers: list[_Consumer] = []
+        self._status_callbacks: list[Callable[[TaskStatusEvent], Awaitable[None]]] = []
+        self._cancel_callbacks: list[Callable[[uuid.UUID], Awaitable[None]]] = []
+        self._retry_handles: set[asyncio.TimerHandle] = set()
+        self._sequence = itertools.count()
+        self.dead_letters: deque[dict[str, str]] = deque(maxlen=DEAD_LETTERS_MAX_SIZE)
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    async def connect(self) -> None:
+        """Создать очереди в текущем event loop."""
+        if self.scheduling_mode == "broker_priority":
+            keys = [PRIORITY_QUEUE_KEY]
+        else:
+            keys = PRIORITIES
+        self._queues = {key: asyncio.PriorityQueue() for key in keys}
+        self._connected = True
+        logger.info(f"Брокер в памяти готов (очереди: {', '.join(keys)})")
+
+    def _route(self, priority: str) -> str:
+        return PRIORITY_QUEUE_KEY if PRIORITY_QUEUE_KEY in self._queues else priority
+
+    def _put(self, message: InMemoryMessage) -> None:
+        # Выше приоритет — раньше; при равном приоритете — в порядке публикации
+        self._queues[message.queue].put_nowait((-message.priority, next(self._sequence), message))
+
+    def _requeue(self, message: InMemoryMessage) -> None:
+        if not self._connected:
+            return
+        message.redelivered = True
+        message._settled = False
+        self._put(message)
+
+    def _publish(
+        self, task_id: uuid.UUID, priority: str, traceparent: str | None, **headers: Any
+    ) -> None:
+        if not self._connected:
+            raise RuntimeError("Брокер в памяти не подключен")
+        if traceparent:
+            headers[TRACEPARENT_HEADER] = traceparent
+        body = json.dumps({"task_id": str(task_id), "priority": priority}).encode()
+        self._put(
+            InMemoryMessage(
+                self._route(priority), body, headers, MESSAGE_PRIORITIES.get(priority, 0)
+            )
+        )
+
+    async def publish_task(self, task_id: uuid.UUID, priority: str) -> None:
+        self._publish(task_id, priority, tracer.current_traceparent())
+        logger.info(f"Задача {task_id} отправлена в очередь {priority}")
+
+    async def publish_tasks(self, tasks: Iterable[tuple[uuid.UUID, str, str | None]]) -> None:
+        count = 0
+        for task_id, priority, traceparent in tasks:
+            self._publish(task_id, priority, traceparent)
+            count += 1
+        logger.info(f"Пакет из {count} задач отправлен в очереди")
+
+    async def publish_retry(self, task_id: uuid.UUID, priority: str, attempt: int) -> float:
+        if not self._connected:
+            raise RuntimeError("Брокер в памяти не подключен")
+        level = min(attempt - 1, settings.WORKER_RETRY_LEVELS - 1)
+        max_delay = retry_delay(level)
+        delay = random.uniform(max_delay / 2, max_delay)
+        traceparent = tracer.current_traceparent()
+
+        def release() -> None:
+            self._retry_handles.discard(handle)
+            if self._connected:
+                self._publish(task_id, priority, traceparent, **{"x-retry-attempt": attempt})
+
+        handle = asyncio.get_running_loop().call_later(delay, release)
+        self._retry_handles.add(handle)
+        logger.info(f"Повтор {attempt} задачи {task_id} через {delay:.1f} с")
+        return delay
+
+    async def publish_dead_letter(self, task_id: uuid.UUID, priority: str, error: str) -> None:
+        self.dead_letters.append({"task_id": str(task_id), "priority": priority, "error": error})
+        logger.info(f"Задача {task_id} сохранена в списке «мёртвых» задач")
+
+    async def consume_tasks(
+        self,
+        priority: str,
+        callback: Callable[[InMemoryMessage], Awaitable[None]],
+        prefetch_count: int | None = None,
+    ) -> None:
+        if priority not in self._queues:
+            raise ValueError(f"Очередь для приоритета {priority} не найдена")
+        if prefetch_count is None:
+            prefetch_count = settings.WORKER_PREFETCH_COUNT.get(
+                priority, sum(settings.WORKER_PREFETCH_COUNT.values())
+            )
+        self._consumers.append(_Consumer(self, priority, callback, prefetch_count))
+        logger.info(f"Начат consume очереди {priority} (prefetch_count={prefetch_count})")
+
+    async def cancel_consumers(self) -> None:
+        for consumer in self._consumers:
+            await consumer.cancel()
+
+    async def publish_status_event(self, event: TaskStatusEvent) -> None:
+        for callback in list(self._status_callbacks):
+            try:
+                await callback(event)
+            except Exception as e:
+                logger.error(f"Ошибка обработки события статуса: {e}")
+
+    async def consume_status_events(
+        self, callback: Callable[[TaskStatusEvent], Awaitable[None]]
+    ) -> None:
+        if not self._connected:
+            raise RuntimeError("Брокер в памяти не подключен")
+        self._status_callbacks.append(callback)
+
+    async def publish_cancellation(self, task_id: uuid.UUID) -> None:
+        for callback in list(self._cancel_callbacks):
+            try:
+                await callback(task_id)
+            except Exception as e:
+                logger.error(f"Ошибка обработки отмены задачи: {e}")
+
+    async def consume_cancellations(self, callback: Callable[[uuid.UUID], Awaitable[None]]) -> None:
+        if not self._connected:
+            raise RuntimeError("Брокер в памяти не подключен")
+        self._cancel_callbacks.append(callback)
+
+    async def close(self) -> None:
+        """
+        Остановить доставку и отбросить очереди.
+
+        Подтверждение доставленных до закрытия сообщений после close()
+        ничего не делает; следующий connect() создаёт пустые очереди.
+        """
+        if not self._connected:
+            return
+        await self.cancel_consumers()
+        for consumer in self._consumers:
+            for message in consumer.unacked:
+                message._consumer = None
+        self._consumers.clear()
+        for handle in self._retry_handles:
+            handle.cancel()
+        self._retry_handles.clear()
+        self._status_callbacks.clear()
+        self._cancel_callbacks.clear()
+        self._connected = False
+        logger.info("Брокер в памяти закрыт")
@@ -0,0 +1,273 @@
+import functools
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+
+from async_task_manager.core.tracing import tracer
+
+# Формат текстовой выдачи Prometheus
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# Границы бакетов гистограмм задержек, секунды
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class CounterChild:
+    """Значение счётчика для одного набора меток."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeChild:
+    """Значение gauge для одного набора меток."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class HistogramChild:
+    """
+    Гистограмма для одного набора меток.
+
+    При записи увеличивается только счётчик одного бакета (поиск границы
+    бисекцией); накопительные значения считаются при выдаче метрик.
+    """
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        registry.register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """
+        Значение метрики для набора меток.
+
+        Объект кэшируется: в горячем пути его стоит получить один раз
+        и дальше вызывать inc/observe напрямую.
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Метрика {self.name} ожидает метки {self.labelnames}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Монотонно растущий счётчик."""
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._children.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Текущее значение, которое может расти и убывать."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._children.items()
+        ]
+
+
+class Histogram(_Metric):
+    """Распределение значений по бакетам с фиксированными границами."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.bounds)
+
+    def counts(self) -> dict[tuple[str, ...], int]:
+        """Число наблюдений по наборам меток."""
+        return {values: sum(child.counts) for values, child in self._children.items()}
+
+    def _samples(self) -> list[str]:
+        samples = []
+        bucket_names = (*self.labelnames, "le")
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip((*self.bounds, math.inf), child.counts):
+                cumulative += count
+                labels = _format_labels(bucket_names, (*values, _format_value(bound)))
+                samples.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            samples.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            samples.append(f"{self.name}_count{labels} {cumulative}")
+        return samples
+
+
+class MetricsRegistry:
+    """Метрики процесса и их выдача в текстовом формате Prometheus."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Метрика {metric.name} уже зарегистрирована")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
+
+TASK_PUBLISH_SECONDS = Histogram(
+    "task_publish_seconds",
+    "Время публикации задач в RabbitMQ с подтверждением брокера",
+    ["mode"],
+)
+TASK_DB_SECONDS = Histogram(
+    "task_db_seconds",
+    "Время операций репозитория с БД",
+    ["operation"],
+)
+TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "task_queue_wait_seconds",
+    "Время ожидания задачи в очереди (started_at - created_at, первая попытка)",
+    ["priority"],
+)
+TASK_EXECUTION_SECONDS = Histogram(
+    "task_execution_seconds",
+    "Время выполнения задачи воркером",
+    ["priority"],
+)
+TASKS_IN_FLIGHT = Gauge(
+    "tasks_in_flight",
+    "Задачи, выполняемые процессом воркера",
+    ["priority"],
+)
+TASKS_FINISHED_TOTAL = Counter(
+    "tasks_finished_total",
+    "Задачи, перешедшие в итоговый статус",
+    ["priority", "status"],
+)
+
+
+def db_timed(func: Callable) -> Callable:
+    """
+    Учитывать время асинхронной функции репозитория в task_db_seconds.
+
+    Внутри сэмплированной трассы вызов дополнительно пишется span'ом db.<имя>.
+    """
+    child = TASK_DB_SECONDS.labels(func.__name__)
+    span_name = f"db.{func.__name__}"
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            with tracer.start_span(span_name, require_parent=True):
+                return await func(*args, **kwargs)
+        finally:
+            child.observe(time.perf_counter() - started)
+
+    return wrapper
@@ -1,24 +1,80 @@
+import asyncio
 import json
 import logging
+import random
+import time
 import uuid
+from collections.abc import Awaitable, Callable, Iterable
 
 import aio_pika
 from aio_pika import DeliveryMode, ExchangeType, Message
-from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractQueue
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractConnection,
+    AbstractIncomingMessage,
+    AbstractQueue,
+)
 
+from async_task_manager.core.broker import (
+    MAX_MESSAGE_PRIORITY,
+    MESSAGE_PRIORITIES,
+    PRIORITIES,
+    PRIORITY_QUEUE_KEY,
+    TaskBroker,
+    retry_delay,
+)
 from async_task_manager.core.config import settings
+from async_task_manager.core.events import TaskStatusEvent
+from async_task_manager.core.metrics import TASK_PUBLISH_SECONDS
+from async_task_manager.core.tracing import (
+    TRACEPARENT_HEADER,
+    Span,
+    parse_traceparent,
+    tracer,
+)
 
 logger = logging.getLogger(__name__)
 
+# Очередь режима broker_priority: одна очередь с x-max-priority для всех приоритетов
+PRIORITY_QUEUE_NAME = "tasks.priority"
 
-class RabbitMQManager:
+EVENTS_EXCHANGE_NAME = "tasks.events"
+CANCEL_EXCHANGE_NAME = "tasks.cancel"
+
+DEAD_LETTER_EXCHANGE_NAME = "tasks.dlx"
+DEAD_LETTER_QUEUE_NAME = "tasks.dead"
+
+_PUBLISH_SINGLE = TASK_PUBLISH_SECONDS.labels("single")
+_PUBLISH_BATCH = TASK_PUBLISH_SECONDS.labels("batch")
+
+
+def retry_queue_name(priority: str, level: int) -> str:
+    """Имя очереди повторов приоритета и уровня задержки."""
+    return f"tasks.retry.{priority.lower()}.{level}"
+
+
+class RabbitMQManager(TaskBroker):
     """Менеджер для работы с RabbitMQ очередями задач."""
 
     def __init__(self):
         self.connection: AbstractConnection | None = None
         self.channel: AbstractChannel | None = None
+        self.events_channel: AbstractChannel | None = None
         self.task_exchange = None
+        self.events_exchange = None
+        self.cancel_exchange = None
+        self.dead_letter_exchange = None
         self.queues: dict[str, AbstractQueue] = {}
+        self.consumer_channels: dict[str, AbstractChannel] = {}
+        self.consumer_tags: dict[str, tuple[AbstractQueue, str]] = {}
+
+    @property
+    def connected(self) -> bool:
+        return (
+            self.events_exchange is not None
+            and self.connection is not None
+            and not self.connection.is_closed
+        )
 
     async def connect(self) -> None:
         """Установить соединение с RabbitMQ."""
@@ -26,13 +82,22 @@ class RabbitMQManager:
             self.connection = await aio_pika.connect_robust(str(settings.RABBITMQ_URL))
             self.channel = await self.connection.channel()
 
-            await self.channel.set_qos(prefetch_count=1)
-
             self.task_exchange = await self.channel.declare_exchange(
                 "tasks", ExchangeType.DIRECT, durable=True
             )
 
             await self._setup_queues()
+            await self._setup_retry_queues()
+
+            # События статусов не критичны к потере, поэтому публикуются
+            # в отдельном канале без подтверждений брокера
+            self.events_channel = await self.connection.channel(publisher_confirms=False)
+            self.events_exchange = await self.events_channel.declare_exchange(
+                EVENTS_EXCHANGE_NAME, ExchangeType.FANOUT, durable=True
+            )
+            self.cancel_exchange = await self.events_channel.declare_exchange(
+                CANCEL_EXCHANGE_NAME, ExchangeType.FANOUT, durable=True
+            )
 
             logger.info("Подключение к RabbitMQ установлено")
 
@@ -42,9 +107,11 @@ class RabbitMQManager:
 
     async def _setup_queues(self) -> None:
         """Настройка очередей для разных приоритетов."""
-        priorities = ["HIGH", "MEDIUM", "LOW"]
+        if settings.WORKER_SCHEDULING_MODE == "broker_priority":
+            await self._setup_priority_queue()
+            return
 
-        for priority in priorities:
+        for priority in PRIORITIES:
             queue_name = f"tasks.{priority.lower()}"
             queue = await self.channel.declare_queue(queue_name, durable=True)
 
@@ -53,6 +120,73 @@ class RabbitMQManager:
 
             logger.info(f"Очередь {queue_name} создана и привязана")
 
+    async def _setup_priority_queue(self) -> None:
+        """Настройка единой очереди с приоритетами сообщений (x-max-priority)."""
+        queue = await self.channel.declare_queue(
+            PRIORITY_QUEUE_NAME,
+            durable=True,
+            arguments={"x-max-priority": MAX_MESSAGE_PRIORITY},
+        )
+
+        for priority in PRIORITIES:
+            await queue.bind(self.task_exchange, routing_key=priority)
+        self.queues[PRIORITY_QUEUE_KEY] = queue
+
+        logger.info(f"Очередь {PRIORITY_QUEUE_NAME} создана и привязана ко всем приоритетам")
+
+    async def _setup_retry_queues(self) -> None:
+        """
+        Настройка очередей отложенных повторов и очереди «мёртвых» задач.
+
+        Для каждого приоритета создаётся WORKER_RETRY_LEVELS очередей без
+        consumer'ов с фиксированным TTL, удваивающимся от уровня к уровню.
+        Истёкшее сообщение возвращается через dead-letter в exchange tasks
+        с ключом своего приоритета. Окончательно упавшие задачи копируются
+        в очередь tasks.dead.
+        """
+        for priority in PRIORITIES:
+            for level in range(settings.WORKER_RETRY_LEVELS):
+                await self.channel.declare_queue(
+                    retry_queue_name(priority, level),
+                    durable=True,
+                    arguments={
+                        "x-message-ttl": int(retry_delay(level) * 1000),
+                        "x-dead-letter-exchange": self.task_exchange.name,
+                        "x-dead-letter-routing-key": priority,
+                    },
+                )
+
+        self.dead_letter_exchange = await self.channel.declare_exchange(
+            DEAD_LETTER_EXCHANGE_NAME, ExchangeType.DIRECT, durable=True
+        )
+        dead_queue = await self.channel.declare_queue(DEAD_LETTER_QUEUE_NAME, durable=True)
+        await dead_queue.bind(self.dead_letter_exchange, routing_key=DEAD_LETTER_QUEUE_NAME)
+
+        logger.info(
+            f"Очереди повторов созданы: {settings.WORKER_RETRY_LEVELS} уровней на приоритет"
+        )
+
+    @staticmethod
+    def _build_task_message(
+        task_id: uuid.UUID, priority: str, traceparent: str | None = None, **properties
+    ) -> Message:
+        """Сформировать сообщение о задаче для публикации; traceparent передаётся в заголовке."""
+        message_body = {"task_id": str(task_id), "priority": priority}
+        if traceparent:
+            properties["headers"] = {
+                **properties.get("headers", {}),
+                TRACEPARENT_HEADER: traceparent,
+            }
+
+        return Message(
+            json.dumps(message_body).encode(),
+            delivery_mode=DeliveryMode.PERSISTENT,
+            content_type="application/json",
+            message_id=str(uuid.uuid4()),
+            priority=MESSAGE_PRIORITIES.get(priority),
+            **properties,
+        )
+
     async def publish_task(self, task_id: uuid.UUID, priority: str) -> None:
         """
         Отправить задачу в очередь по приоритету.
@@ -64,42 +198,274 @@ class RabbitMQManager:
         if not self.task_exchange:
             raise RuntimeError("RabbitMQ не подключен")
 
-        message_body = {"task_id": str(task_id), "priority": priority}
+        with tracer.start_span(
+            "task.publish", kind="producer", attributes={"task.id": str(task_id)}
+        ) as span:
+            message = self._build_task_message(
+                task_id, priority, span.context.to_traceparent() if span else None
+            )
+
+            started = time.perf_counter()
+            try:
+                await self.task_exchange.publish(message, routing_key=priority)
+                _PUBLISH_SINGLE.observe(time.perf_counter() - started)
+                logger.info(f"Задача {task_id} отправлена в очередь {priority}")
+            except Exception as e:
+                logger.error(f"Ошибка отправки задачи {task_id}: {e}")
+                raise
+
+    async def publish_tasks(self, tasks: Iterable[tuple[uuid.UUID, str]]) -> None:
+        """
+        Отправить пакет задач в очереди по приоритетам.
+
+        Все сообщения публикуются в одном канале без ожидания подтверждения
+        каждого из них; подтверждения брокера (publisher confirms) собираются
+        после отправки всего пакета.
+
+        Трасса, в которой была создана задача, продолжается span'ом публикации
+        (от отправки до подтверждения брокера), его контекст уходит
+        в заголовке traceparent сообщения.
+
+        Args:
+            tasks: Тройки (UUID задачи, приоритет, traceparent или None)
+        """
+        if not self.task_exchange:
+            raise RuntimeError("RabbitMQ не подключен")
+
+        tasks = list(tasks)
+        started = time.perf_counter()
+        confirmations = []
+        for task_id, priority, traceparent in tasks:
+            span = tracer.begin_span(
+                "task.publish",
+                parent=parse_traceparent(traceparent),
+                kind="producer",
+                attributes={"task.id": str(task_id), "task.priority": priority},
+            )
+            message = self._build_task_message(
+                task_id, priority, span.context.to_traceparent() if span else traceparent
+            )
+            publish = self.task_exchange.publish(message, routing_key=priority)
+            if span is not None and span.is_recording:
+                publish = self._traced(publish, span)
+            confirmations.append(asyncio.ensure_future(publish))
+
+        results = await asyncio.gather(*confirmations, return_exceptions=True)
+        _PUBLISH_BATCH.observe(time.perf_counter() - started)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.error(f"Не подтверждено {len(errors)} из {len(tasks)} сообщений: {errors[0]}")
+            raise errors[0]
+
+        logger.info(f"Пакет из {len(tasks)} задач отправлен в очереди")
+
+    @staticmethod
+    async def _traced(publish: Awaitable, span: Span):
+        """Дождаться подтверждения публикации, завершив span в момент подтверждения."""
+        try:
+            return await publish
+        except Exception as e:
+            span.record_exception(e)
+            raise
+        finally:
+            span.end()
+
+    async def publish_retry(self, task_id: uuid.UUID, priority: str, attempt: int) -> float:
+        """
+        Отложить повтор задачи через очередь повторов.
+
+        Уровень очереди выбирается по номеру попытки (экспоненциальная
+        задержка), а срок жизни сообщения — случайно в пределах второй
+        половины TTL уровня (jitter), чтобы повторы одновременно упавших
+        задач не возвращались разом. TTL очереди ограничивает задержку сверху.
+
+        Args:
+            task_id: UUID задачи
+            priority: Приоритет задачи (HIGH, MEDIUM, LOW)
+            attempt: Номер повтора, начиная с 1
+
+        Returns:
+            Задержка повтора в секундах
+        """
+        if not self.channel:
+            raise RuntimeError("RabbitMQ не подключен")
+
+        level = min(attempt - 1, settings.WORKER_RETRY_LEVELS - 1)
+        max_delay = retry_delay(level)
+        delay = random.uniform(max_delay / 2, max_delay)
+        message = self._build_task_message(
+            task_id,
+            priority,
+            tracer.current_traceparent(),
+            expiration=delay,
+            headers={"x-retry-attempt": attempt},
+        )
+
+        await self.channel.default_exchange.publish(
+            message, routing_key=retry_queue_name(priority, level)
+        )
+        logger.info(f"Повтор {attempt} задачи {task_id} через {delay:.1f} с")
+        return delay
+
+    async def publish_dead_letter(self, task_id: uuid.UUID, priority: str, error: str) -> None:
+        """
+        Скопировать окончательно упавшую задачу в очередь tasks.dead.
+
+        Args:
+            task_id: UUID задачи
+            priority: Приоритет задачи
+            error: Текст последней ошибки
+        """
+        if not self.dead_letter_exchange:
+            raise RuntimeError("RabbitMQ не подключен")
 
         message = Message(
-            json.dumps(message_body).encode(),
+            json.dumps({"task_id": str(task_id), "priority": priority, "error": error}).encode(),
             delivery_mode=DeliveryMode.PERSISTENT,
             content_type="application/json",
             message_id=str(uuid.uuid4()),
         )
+        await self.dead_letter_exchange.publish(message, routing_key=DEAD_LETTER_QUEUE_NAME)
+        logger.info(f"Задача {task_id} отправлена в {DEAD_LETTER_QUEUE_NAME}")
 
-        try:
-            await self.task_exchange.publish(message, routing_key=priority)
-            logger.info(f"Задача {task_id} отправлена в очередь {priority}")
-        except Exception as e:
-            logger.error(f"Ошибка отправки задачи {task_id}: {e}")
-            raise
-
-    async def consume_tasks(self, priority: str, callback) -> None:
+    async def consume_tasks(
+        self, priority: str, callback, prefetch_count: int | None = None
+    ) -> None:
         """
         Начать прослушивание очереди для обработки задач.
 
+        Каждый consumer получает собственный канал со своим prefetch_count,
+        поэтому очереди не делят между собой лимит неподтверждённых сообщений.
+
         Args:
-            priority: Приоритет очереди (HIGH, MEDIUM, LOW)
+            priority: Приоритет очереди (HIGH, MEDIUM, LOW) или PRIORITY_QUEUE_KEY
+                для единой очереди режима broker_priority
             callback: Асинхронная функция для обработки задач
+            prefetch_count: Лимит неподтверждённых сообщений на канале
+                (по умолчанию из настроек WORKER_PREFETCH_COUNT)
         """
         if priority not in self.queues:
             raise ValueError(f"Очередь для приоритета {priority} не найдена")
 
-        queue = self.queues[priority]
+        if prefetch_count is None:
+            prefetch_count = settings.WORKER_PREFETCH_COUNT.get(
+                priority, sum(settings.WORKER_PREFETCH_COUNT.values())
+            )
 
         try:
-            await queue.consume(callback, no_ack=False)
-            logger.info(f"Начат consume очереди {priority}")
+            channel = await self.connection.channel()
+            await channel.set_qos(prefetch_count=prefetch_count)
+            self.consumer_channels[priority] = channel
+
+            queue = await channel.get_queue(self.queues[priority].name)
+            consumer_tag = await queue.consume(callback, no_ack=False)
+            self.consumer_tags[priority] = (queue, consumer_tag)
+            logger.info(f"Начат consume очереди {priority} (prefetch_count={prefetch_count})")
         except Exception as e:
             logger.error(f"Ошибка consume очереди {priority}: {e}")
             raise
 
+    async def publish_status_event(self, event: TaskStatusEvent) -> None:
+        """
+        Опубликовать событие смены статуса задачи в fanout-exchange tasks.events.
+
+        Args:
+            event: Событие смены статуса
+        """
+        if not self.events_exchange:
+            raise RuntimeError("RabbitMQ не подключен")
+
+        message = Message(
+            event.to_bytes(),
+            delivery_mode=DeliveryMode.NOT_PERSISTENT,
+            content_type="application/json",
+        )
+        await self.events_exchange.publish(message, routing_key="")
+
+    async def consume_status_events(
+        self, callback: Callable[[TaskStatusEvent], Awaitable[None]]
+    ) -> None:
+        """
+        Подписаться на события смены статусов задач.
+
+        Каждый подписчик получает собственную временную очередь, привязанную
+        к fanout-exchange, поэтому события получают все экземпляры API.
+
+        Args:
+            callback: Асинхронная функция, вызываемая для каждого события
+        """
+        if not self.events_exchange:
+            raise RuntimeError("RabbitMQ не подключен")
+
+        async def on_message(message: AbstractIncomingMessage) -> None:
+            try:
+                await callback(TaskStatusEvent.from_bytes(message.body))
+            except Exception as e:
+                logger.error(f"Ошибка обработки события статуса: {e}")
+
+        channel = await self.connection.channel()
+        exchange = await channel.get_exchange(EVENTS_EXCHANGE_NAME)
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(exchange)
+        await queue.consume(on_message, no_ack=True)
+        logger.info("Подписка на события статусов задач установлена")
+
+    async def publish_cancellation(self, task_id: uuid.UUID) -> None:
+        """
+        Разослать всем воркерам отмену задачи через fanout-exchange tasks.cancel.
+
+        Args:
+            task_id: UUID отменённой задачи
+        """
+        if not self.cancel_exchange:
+            raise RuntimeError("RabbitMQ не подключен")
+
+        message = Message(
+            json.dumps({"task_id": str(task_id)}).encode(),
+            delivery_mode=DeliveryMode.NOT_PERSISTENT,
+            content_type="application/json",
+        )
+        await self.cancel_exchange.publish(message, routing_key="")
+
+    async def consume_cancellations(self, callback: Callable[[uuid.UUID], Awaitable[None]]) -> None:
+        """
+        Подписаться на отмены задач.
+
+        Args:
+            callback: Асинхронная функция, вызываемая с UUID отменённой задачи
+        """
+        if not self.cancel_exchange:
+            raise RuntimeError("RabbitMQ не подключен")
+
+        async def on_message(message: AbstractIncomingMessage) -> None:
+            try:
+                await callback(uuid.UUID(json.loads(message.body)["task_id"]))
+            except Exception as e:
+                logger.error(f"Ошибка обработки отмены задачи: {e}")
+
+        channel = await self.connection.channel()
+        exchange = await channel.get_exchange(CANCEL_EXCHANGE_NAME)
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(exchange)
+        await queue.consume(on_message, no_ack=True)
+        logger.info("Подписка на отмены задач установлена")
+
+    async def cancel_consumers(self) -> None:
+        """
+        Прекратить получение новых сообщений, не закрывая каналы.
+
+        Уже доставленные сообщения остаются на своих каналах и могут быть
+        подтверждены после завершения обработки.
+        """
+        for priority, (queue, consumer_tag) in list(self.consumer_tags.items()):
+            try:
+                await queue.cancel(consumer_tag)
+                logger.info(f"Consume очереди {priority} остановлен")
+            except Exception as e:
+                logger.error(f"Ошибка остановки consume очереди {priority}: {e}")
+        self.consumer_tags.clear()
+
     async def close(self) -> None:
         """Закрыть соединение с RabbitMQ."""
         if self.connection and not self.connection.is_closed:
@@ -0,0 +1,104 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from async_task_manager.core.config import settings
+
+RESULT_CHUNK_SIZE = 64 * 1024
+
+
+class ResultNotFoundError(LookupError):
+    """Результат с указанной ссылкой отсутствует в хранилище."""
+
+
+class ResultBackend(ABC):
+    """
+    Хранилище больших результатов задач.
+
+    В строке задачи остаётся только ссылка (result_ref), содержимое
+    читается потоком частями, не загружаясь в память целиком.
+    """
+
+    @abstractmethod
+    async def put(self, data: bytes) -> str:
+        """Сохранить результат и вернуть ссылку на него."""
+
+    @abstractmethod
+    def open(self, ref: str) -> AsyncIterator[bytes]:
+        """Прочитать результат частями; ResultNotFoundError, если его нет."""
+
+    @abstractmethod
+    async def size(self, ref: str) -> int:
+        """Размер результата в байтах; ResultNotFoundError, если его нет."""
+
+
+class FileResultBackend(ResultBackend):
+    """
+    Контентно-адресуемое хранилище в каталоге файловой системы.
+
+    Ссылка — `sha256:<хэш>`, файл лежит в root/<2 символа>/<хэш>.
+    Одинаковые результаты хранятся один раз, а повторная запись того же
+    результата (повторная доставка сообщения) ничего не меняет. Файл
+    пишется во временный и переименовывается, поэтому читатель никогда
+    не видит недописанный результат. Каталог должен быть общим для API
+    и воркеров.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _path(self, ref: str) -> Path:
+        scheme, _, digest = ref.partition(":")
+        if (
+            scheme != "sha256"
+            or len(digest) != 64
+            or not all(c in "0123456789abcdef" for c in digest)
+        ):
+            raise ResultNotFoundError(ref)
+        return self.root / digest[:2] / digest
+
+    def _write(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        ref = f"sha256:{digest}"
+        path = self._path(ref)
+        if path.exists():
+            return ref
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return ref
+
+    async def put(self, data: bytes) -> str:
+        return await asyncio.to_thread(self._write, data)
+
+    async def open(self, ref: str) -> AsyncIterator[bytes]:
+        path = self._path(ref)
+        try:
+            file = await asyncio.to_thread(path.open, "rb")
+        except FileNotFoundError:
+            raise ResultNotFoundError(ref) from None
+        try:
+            while chunk := await asyncio.to_thread(file.read, RESULT_CHUNK_SIZE):
+                yield chunk
+        finally:
+            file.close()
+
+    async def size(self, ref: str) -> int:
+        try:
+            return (await asyncio.to_thread(self._path(ref).stat)).st_size
+        except FileNotFoundError:
+            raise ResultNotFoundError(ref) from None
+
+
+result_backend: ResultBackend = FileResultBackend(settings.RESULT_STORE_PATH)
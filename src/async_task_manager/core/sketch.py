@@ -0,0 +1,68 @@
+import math
+from collections.abc import Iterable, Mapping
+
+# Значения меньше (секунд) попадают в один нижний бакет
+SKETCH_MIN_VALUE = 1e-4
+
+
+class LogBucketSketch:
+    """
+    Гистограмма с логарифмическими бакетами для квантилей задержек.
+
+    Значение x попадает в бакет ceil(log_gamma(x)), где
+    gamma = (1 + accuracy) / (1 - accuracy); любой квантиль оценивается
+    с относительной ошибкой не больше accuracy. Скетч хранит только счётчики
+    бакетов (около тысячи для диапазона от 0.1 мс до суток при accuracy 1%),
+    и два скетча с одинаковой точностью объединяются сложением счётчиков —
+    поэтому их можно копить в разных процессах и складывать в БД.
+    """
+
+    __slots__ = ("accuracy", "buckets", "count", "_gamma", "_log_gamma", "_min_bucket")
+
+    def __init__(self, accuracy: float = 0.01, buckets: Mapping[int, int] | None = None):
+        if not 0 < accuracy < 1:
+            raise ValueError("accuracy должна быть в интервале (0, 1)")
+        self.accuracy = accuracy
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._min_bucket = self.bucket_of(SKETCH_MIN_VALUE)
+        self.buckets: dict[int, int] = dict(buckets or {})
+        self.count = sum(self.buckets.values())
+
+    def bucket_of(self, value: float) -> int:
+        """Номер бакета значения."""
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Добавить значение (секунды)."""
+        bucket = (
+            self._min_bucket
+            if value <= SKETCH_MIN_VALUE
+            else math.ceil(math.log(value) / self._log_gamma)
+        )
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += count
+
+    def merge(self, other: "LogBucketSketch") -> None:
+        """Прибавить счётчики другого скетча с той же точностью."""
+        if other.accuracy != self.accuracy:
+            raise ValueError("Объединять можно только скетчи с одинаковой точностью")
+        self.merge_buckets(other.buckets.items())
+
+    def merge_buckets(self, buckets: Iterable[tuple[int, int]]) -> None:
+        """Прибавить счётчики бакетов (например, прочитанные из БД)."""
+        for bucket, count in buckets:
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+            self.count += count
+
+    def quantile(self, q: float) -> float | None:
+        """Оценка квантиля q (0..1); None для пустого скетча."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen > rank:
+                return 2 * self._gamma**bucket / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.buckets) / (self._gamma + 1)
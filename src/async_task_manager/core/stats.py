@@ -0,0 +1,80 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.sketch import LogBucketSketch
+
+# Метрики задержек: ожидание в очереди (started_at - created_at) и выполнение
+QUEUE_WAIT = "queue_wait"
+RUN_TIME = "run_time"
+LATENCY_METRICS = (QUEUE_WAIT, RUN_TIME)
+
+
+@dataclass
+class StatsDelta:
+    """
+    Накопленные с прошлой записи изменения статистики.
+
+    counts — прирост числа задач по (приоритет, статус), может быть
+    отрицательным; buckets — прирост счётчиков бакетов по (метрика, приоритет).
+    """
+
+    counts: dict[tuple[str, str], int] = field(default_factory=dict)
+    buckets: dict[tuple[str, str], dict[int, int]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.counts or self.buckets)
+
+
+class TaskStatsRecorder:
+    """
+    Счётчики задач по статусам и приоритетам и скетчи задержек в памяти процесса.
+
+    Каждый переход статуса учитывается за O(1) без обращения к БД; накопленные
+    изменения периодически забирает StatsFlusher и прибавляет к таблицам
+    task_counters и task_latency_buckets. Приоритеты и статусы — строковые
+    значения перечислений.
+    """
+
+    def __init__(self, accuracy: float | None = None):
+        self.accuracy = accuracy or settings.STATS_SKETCH_ACCURACY
+        self._counts: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self._sketches: dict[tuple[str, str], LogBucketSketch] = {}
+
+    def transition(
+        self, priority: str, from_status: str | None, to_status: str, count: int = 1
+    ) -> None:
+        """Учесть переход count задач из from_status (None — новая задача) в to_status."""
+        if from_status is not None:
+            self._counts[(priority, from_status)] -= count
+        self._counts[(priority, to_status)] += count
+
+    def observe(self, metric: str, priority: str, seconds: float) -> None:
+        """Добавить значение задержки в скетч метрики."""
+        sketch = self._sketches.get((metric, priority))
+        if sketch is None:
+            sketch = self._sketches[(metric, priority)] = LogBucketSketch(self.accuracy)
+        sketch.add(seconds)
+
+    def drain(self) -> StatsDelta:
+        """Забрать накопленные изменения и начать копить заново."""
+        delta = StatsDelta(
+            counts={key: value for key, value in self._counts.items() if value},
+            buckets={key: sketch.buckets for key, sketch in self._sketches.items()},
+        )
+        self._counts = defaultdict(int)
+        self._sketches = {}
+        return delta
+
+    def restore(self, delta: StatsDelta) -> None:
+        """Вернуть изменения, которые не удалось записать, чтобы записать их позже."""
+        for key, value in delta.counts.items():
+            self._counts[key] += value
+        for (metric, priority), buckets in delta.buckets.items():
+            sketch = self._sketches.get((metric, priority))
+            if sketch is None:
+                sketch = self._sketches[(metric, priority)] = LogBucketSketch(self.accuracy)
+            sketch.merge_buckets(buckets.items())
+
+
+task_stats = TaskStatsRecorder()
@@ -0,0 +1,333 @@
+import contextvars
+import json
+import logging
+import random
+import re
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+from async_task_manager.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Заголовок W3C Trace Context: версия-trace_id-span_id-флаги
+TRACEPARENT_HEADER = "traceparent"
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_SAMPLED_FLAG = 0x01
+
+# Решение о сэмплировании принимается по младшим 56 битам trace_id, как
+# в TraceIdRatioBased OpenTelemetry: все процессы решают одинаково
+_SAMPLING_BOUND = 2**56
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    """Идентификаторы span'а, передаваемые между процессами."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{_SAMPLED_FLAG if self.sampled else 0:02x}"
+
+
+def parse_traceparent(value: str | bytes | None) -> SpanContext | None:
+    """Разобрать заголовок traceparent; None, если он отсутствует или некорректен."""
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("latin-1")
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return SpanContext(trace_id, span_id, bool(int(flags, 16) & _SAMPLED_FLAG))
+
+
+class Span:
+    """
+    Интервал работы внутри трассы.
+
+    Несэмплированный span не пишет атрибуты и не экспортируется, но несёт
+    контекст, чтобы решение о сэмплировании передалось дальше по цепочке.
+    """
+
+    __slots__ = (
+        "_tracer",
+        "attributes",
+        "context",
+        "end_ns",
+        "error",
+        "kind",
+        "name",
+        "parent_id",
+        "start_ns",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        context: SpanContext,
+        parent_id: str | None,
+        kind: str,
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes: dict[str, Any] = {}
+        self.error: str | None = None
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self.context.sampled and self.end_ns is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.context.sampled:
+            self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        if self.context.sampled:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.context.sampled:
+            self._tracer._on_end(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1e6,
+            "status": "ERROR" if self.error else "OK",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporter(ABC):
+    """Получатель завершённых span'ов (пакетами)."""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Выгрузить пакет span'ов."""
+
+    def shutdown(self) -> None:
+        """Освободить ресурсы экспортёра."""
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """Пишет span'ы строками JSON в поток (по умолчанию stdout)."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream or sys.stdout
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.stream.write("".join(json.dumps(span.to_dict()) + "\n" for span in spans))
+        self.stream.flush()
+
+
+class FileSpanExporter(SpanExporter):
+    """Дописывает span'ы строками JSON в файл."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write("".join(json.dumps(span.to_dict()) + "\n" for span in spans))
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Tracer:
+    """
+    Трассировка запросов от HTTP через RabbitMQ до воркера.
+
+    Без экспортёра трассировка выключена и start_span ничего не делает.
+    Корневой span сэмплируется с вероятностью sample_ratio, дочерние
+    наследуют решение родителя (в том числе из заголовка traceparent
+    другого процесса), поэтому трасса либо пишется целиком, либо
+    не пишется вовсе, а доля записываемых трасс ограничена.
+
+    Завершённые span'ы копятся в буфере и выгружаются экспортёру пакетом,
+    когда буфер заполнен или с прошлой выгрузки прошло export_interval.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter | None = None,
+        sample_ratio: float = 1.0,
+        batch_size: int = 256,
+        export_interval: float = 5.0,
+    ):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        self.batch_size = batch_size
+        self.export_interval = export_interval
+        self._buffer: list[Span] = []
+        self._exported_at = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(self, exporter: SpanExporter | None, sample_ratio: float | None = None) -> None:
+        """Сменить экспортёр (None — выключить трассировку) и долю сэмплирования."""
+        self.flush()
+        if self.exporter is not None and self.exporter is not exporter:
+            self.exporter.shutdown()
+        self.exporter = exporter
+        if sample_ratio is not None:
+            self.sample_ratio = sample_ratio
+
+    def _should_sample(self, trace_id: str) -> bool:
+        return int(trace_id[-14:], 16) < self.sample_ratio * _SAMPLING_BOUND
+
+    def begin_span(
+        self,
+        name: str,
+        parent: SpanContext | None = None,
+        kind: str = "internal",
+        attributes: dict[str, Any] | None = None,
+        require_parent: bool = False,
+    ) -> Span | None:
+        """
+        Начать span, не делая его текущим (для параллельных операций).
+
+        Args:
+            name: Имя span'а
+            parent: Контекст родителя; по умолчанию — текущий span
+            kind: server, consumer, producer или internal
+            attributes: Атрибуты span'а
+            require_parent: Только продолжать сэмплированную трассу: без
+                родителя или с несэмплированным родителем span не создаётся
+                (для частых мелких операций вроде запросов к БД)
+
+        Returns:
+            Span или None, если трассировка выключена или span не нужен
+            по require_parent
+        """
+        if self.exporter is None:
+            return None
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+        if parent is None:
+            if require_parent:
+                return None
+            trace_id = f"{random.getrandbits(128):032x}"
+            context = SpanContext(
+                trace_id, f"{random.getrandbits(64):016x}", self._should_sample(trace_id)
+            )
+            parent_id = None
+        else:
+            if require_parent and not parent.sampled:
+                return None
+            context = SpanContext(parent.trace_id, f"{random.getrandbits(64):016x}", parent.sampled)
+            parent_id = parent.span_id
+
+        span = Span(self, name, context, parent_id, kind)
+        if attributes and context.sampled:
+            span.attributes.update(attributes)
+        return span
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        parent: SpanContext | None = None,
+        kind: str = "internal",
+        attributes: dict[str, Any] | None = None,
+        require_parent: bool = False,
+    ) -> Iterator[Span | None]:
+        """
+        Выполнить блок внутри span'а, сделав его текущим.
+
+        Исключение из блока записывается в span и пробрасывается дальше.
+        Параметры — как у begin_span.
+        """
+        span = self.begin_span(name, parent, kind, attributes, require_parent)
+        if span is None:
+            yield None
+            return
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def current_traceparent(self) -> str | None:
+        """Заголовок traceparent текущего span'а для передачи в другой процесс."""
+        span = _current_span.get()
+        return span.context.to_traceparent() if span is not None else None
+
+    def _on_end(self, span: Span) -> None:
+        self._buffer.append(span)
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._exported_at >= self.export_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Выгрузить накопленные span'ы экспортёру."""
+        spans, self._buffer = self._buffer, []
+        self._exported_at = time.monotonic()
+        if not spans or self.exporter is None:
+            return
+        try:
+            self.exporter.export(spans)
+        except Exception as e:
+            logger.error(f"Ошибка экспорта {len(spans)} span'ов: {e}")
+
+    def shutdown(self) -> None:
+        """Выгрузить оставшиеся span'ы и закрыть экспортёр."""
+        self.flush()
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def _exporter_from_settings() -> SpanExporter | None:
+    if settings.TRACING_EXPORTER == "console":
+        return ConsoleSpanExporter()
+    if settings.TRACING_EXPORTER == "file":
+        return FileSpanExporter(settings.TRACING_FILE_PATH)
+    return None
+
+
+tracer = Tracer(
+    exporter=_exporter_from_settings(),
+    sample_ratio=settings.TRACING_SAMPLE_RATIO,
+    batch_size=settings.TRACING_EXPORT_BATCH_SIZE,
+    export_interval=settings.TRACING_EXPORT_INTERVAL,
+)
@@ -1,30 +1,83 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from async_task_manager.api import health_router, task_router
-from async_task_manager.core.rabbitmq import rabbitmq_manager
+from async_task_manager.api import (
+    TracingMiddleware,
+    health_router,
+    metrics_router,
+    schedule_router,
+    task_router,
+    ws_router,
+)
+from async_task_manager.core.broker import task_broker
+from async_task_manager.core.config import settings
+from async_task_manager.core.tracing import tracer
+from async_task_manager.services.task_events import subscribe_task_events
+from async_task_manager.workers import (
+    TaskWorker,
+    cron_scheduler,
+    outbox_relay,
+    stats_flusher,
+    task_scheduler,
+)
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Управление жизненным циклом приложения."""
+    """
+    Управление жизненным циклом приложения.
+
+    С BROKER_BACKEND=memory задачи выполняет воркер, встроенный в процесс API.
+    """
+    broker = task_broker()
+    try:
+        await broker.connect()
+        logger.info(f"Брокер {settings.BROKER_BACKEND} подключен при старте приложения")
+    except Exception as e:
+        logger.error(f"Ошибка подключения брокера {settings.BROKER_BACKEND}: {e}")
+
     try:
-        await rabbitmq_manager.connect()
-        logger.info("RabbitMQ подключен при старте приложения")
+        await subscribe_task_events()
     except Exception as e:
-        logger.error(f"Ошибка подключения RabbitMQ: {e}")
+        logger.error(f"Ошибка подписки на события статусов задач: {e}")
+
+    if settings.OUTBOX_RELAY_ENABLED:
+        outbox_relay.start()
+    if settings.SCHEDULER_ENABLED:
+        task_scheduler.start()
+    if settings.CRON_SCHEDULER_ENABLED:
+        cron_scheduler.start()
+    if settings.STATS_ENABLED:
+        stats_flusher.start()
+
+    worker: TaskWorker | None = None
+    worker_task: asyncio.Task | None = None
+    if settings.BROKER_BACKEND == "memory" and broker.connected:
+        worker = TaskWorker(broker=broker)
+        worker_task = asyncio.create_task(worker.start())
 
     yield
 
+    await cron_scheduler.stop()
+    await task_scheduler.stop()
+    await outbox_relay.stop()
+    if worker is not None:
+        worker.request_stop()
+        await asyncio.gather(worker_task, return_exceptions=True)
+        await worker.stop()
+    await stats_flusher.stop()
+    tracer.shutdown()
+
     try:
-        await rabbitmq_manager.close()
-        logger.info("RabbitMQ отключен при остановке приложения")
+        await broker.close()
+        logger.info(f"Брокер {settings.BROKER_BACKEND} отключен при остановке приложения")
     except Exception as e:
-        logger.error(f"Ошибка отключения RabbitMQ: {e}")
+        logger.error(f"Ошибка отключения брокера {settings.BROKER_BACKEND}: {e}")
 
 
 app = FastAPI(
@@ -37,7 +90,8 @@ app = FastAPI(
 * **Создание задач** через REST API
 * **Асинхронная обработка** в фоновом режиме
 * **Система приоритетов** (LOW, MEDIUM, HIGH)
-* **Статусная модель** (NEW, PENDING, IN_PROGRESS, COMPLETED, FAILED, CANCELLED)
+* **Статусная модель** (NEW, SCHEDULED, PENDING, IN_PROGRESS, COMPLETED, FAILED, CANCELLED)
+* **Периодические расписания** по cron-выражениям
 * **Фильтрация и пагинация** результатов
 * **Мониторинг состояния** сервиса
 
@@ -50,6 +104,7 @@ app = FastAPI(
 
 ### Статусы задач
 - `NEW` - новая задача
+- `SCHEDULED` - ожидает времени запуска (run_at)
 - `PENDING` - ожидает обработки
 - `IN_PROGRESS` - в процессе выполнения
 - `COMPLETED` - завершено успешно
@@ -70,5 +125,10 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+app.add_middleware(TracingMiddleware)
+
 app.include_router(task_router, prefix="/api/v1")
+app.include_router(schedule_router, prefix="/api/v1")
 app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(ws_router)
@@ -1,8 +1,15 @@
+from .outbox import TaskOutbox
+from .schedule import TaskSchedule
+from .stats import TaskCounter, TaskLatencyBucket
 from .task import Base, Task, TaskPriority, TaskStatus
 
 __all__ = [
     "Base",
     "Task",
+    "TaskOutbox",
+    "TaskSchedule",
+    "TaskCounter",
+    "TaskLatencyBucket",
     "TaskStatus",
     "TaskPriority",
 ]
@@ -0,0 +1,40 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, DateTime, Enum, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .task import Base, TaskPriority
+
+
+class TaskOutbox(Base):
+    """
+    Исходящее сообщение о задаче (transactional outbox).
+
+    Запись создаётся в той же транзакции, что и строка задачи, и удаляется
+    ретранслятором после подтверждённой публикации в RabbitMQ.
+
+    Атрибуты:
+        id: Монотонный идентификатор записи (порядок публикации).
+        task_id: UUID задачи.
+        priority: Приоритет задачи, определяет очередь (routing key).
+        created_at: Дата и время создания записи.
+        traceparent: Контекст трассировки создавшего запроса (W3C traceparent).
+    """
+
+    __tablename__ = "task_outbox"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    priority: Mapped[TaskPriority] = mapped_column(
+        Enum(TaskPriority, name="task_priority"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+    traceparent: Mapped[str | None] = mapped_column(String(55), nullable=True)
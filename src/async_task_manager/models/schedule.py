@@ -0,0 +1,52 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import Boolean, DateTime, Enum, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .task import Base, TaskPriority
+
+
+class TaskSchedule(Base):
+    """
+    Периодическое расписание: шаблон задачи и cron-выражение.
+
+    При каждом срабатывании по шаблону создаётся обычная задача
+    в статусе PENDING и ставится в очередь своего приоритета.
+
+    Атрибуты:
+        id: Уникальный идентификатор расписания (UUID).
+        name: Уникальное имя расписания.
+        cron: Cron-выражение из пяти полей (UTC).
+        title, description, type, priority, max_retries: Шаблон создаваемой задачи.
+        enabled: Активно ли расписание.
+        next_fire_at: Ближайшее время срабатывания.
+        last_fired_at: Время последнего срабатывания.
+        created_at: Дата и время создания.
+    """
+
+    __tablename__ = "task_schedules"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(128), nullable=False, unique=True)
+    cron: Mapped[str] = mapped_column(String(128), nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    type: Mapped[str] = mapped_column(
+        String(64), nullable=False, default="default", server_default="default"
+    )
+    priority: Mapped[TaskPriority] = mapped_column(
+        Enum(TaskPriority, name="task_priority"), nullable=False
+    )
+    max_retries: Mapped[int] = mapped_column(Integer, nullable=False, default=3, server_default="3")
+    enabled: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default="true"
+    )
+    next_fire_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_fired_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
@@ -0,0 +1,46 @@
+from sqlalchemy import BigInteger, Enum, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .task import Base, TaskPriority, TaskStatus
+
+
+class TaskCounter(Base):
+    """
+    Число задач в статусе и приоритете, поддерживаемое инкрементально.
+
+    Атрибуты:
+        priority: Приоритет задачи.
+        status: Статус задачи.
+        count: Число задач.
+    """
+
+    __tablename__ = "task_counters"
+
+    priority: Mapped[TaskPriority] = mapped_column(
+        Enum(TaskPriority, name="task_priority"), primary_key=True
+    )
+    status: Mapped[TaskStatus] = mapped_column(
+        Enum(TaskStatus, name="task_status"), primary_key=True
+    )
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+class TaskLatencyBucket(Base):
+    """
+    Бакет логарифмического скетча задержек (см. LogBucketSketch).
+
+    Атрибуты:
+        metric: Метрика задержки (queue_wait, run_time).
+        priority: Приоритет задачи.
+        bucket: Номер логарифмического бакета.
+        count: Число значений в бакете.
+    """
+
+    __tablename__ = "task_latency_buckets"
+
+    metric: Mapped[str] = mapped_column(String(32), primary_key=True)
+    priority: Mapped[TaskPriority] = mapped_column(
+        Enum(TaskPriority, name="task_priority"), primary_key=True
+    )
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, String, Text
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -17,6 +17,7 @@ class TaskStatus(enum.Enum):
     """Перечисление возможных статусов задачи."""
 
     NEW = "NEW"
+    SCHEDULED = "SCHEDULED"
     PENDING = "PENDING"
     IN_PROGRESS = "IN_PROGRESS"
     COMPLETED = "COMPLETED"
@@ -40,20 +41,43 @@ class Task(Base):
         id: Уникальный идентификатор задачи (UUID).
         title: Название задачи.
         description: Описание задачи.
+        type: Тип задачи, определяет обработчик в воркере.
         priority: Приоритет задачи (LOW, MEDIUM, HIGH).
         status: Текущий статус задачи.
         created_at: Дата и время создания.
         started_at: Дата и время начала выполнения.
         finished_at: Дата и время завершения.
-        result: Результат выполнения (если есть).
+        result: Результат выполнения (если есть и не вынесен в хранилище).
+        result_ref: Ссылка на большой результат в хранилище результатов.
         error: Информация об ошибке (если есть).
+        run_at: Время отложенного запуска (для статуса SCHEDULED).
+        error_type: Класс последней ошибки (для выборки и повтора упавших задач).
+        retry_count: Число выполненных повторов после ошибок.
+        max_retries: Допустимое число повторов до окончательного FAILED.
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_tasks_priority_created_at_id", "priority", "created_at", "id"),
+        Index("ix_tasks_status_priority_created_at_id", "status", "priority", "created_at", "id"),
+        Index("ix_tasks_status_finished_at_id", "status", "finished_at", "id"),
+        # Частичный индекс: в него попадают только ожидающие запуска задачи
+        Index(
+            "ix_tasks_scheduled_run_at",
+            "run_at",
+            postgresql_where=text("status = 'SCHEDULED'"),
+            sqlite_where=text("status = 'SCHEDULED'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
+    type: Mapped[str] = mapped_column(
+        String(64), nullable=False, default="default", server_default="default"
+    )
     priority: Mapped[TaskPriority] = mapped_column(
         Enum(TaskPriority, name="task_priority"), nullable=False
     )
@@ -65,7 +89,12 @@ class Task(Base):
         nullable=False,
         default=lambda: datetime.now(UTC),
     )
+    run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     result: Mapped[str | None] = mapped_column(Text, nullable=True)
+    result_ref: Mapped[str | None] = mapped_column(String(80), nullable=True)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    error_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    retry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    max_retries: Mapped[int] = mapped_column(Integer, nullable=False, default=3, server_default="3")
@@ -1,8 +1,75 @@
-from .task_repository import cancel_task, create_task, filter_tasks, get_task
+from .outbox_repository import add_outbox_messages, delete_outbox_messages, fetch_outbox_batch
+from .schedule_repository import (
+    create_schedule,
+    delete_schedule,
+    fire_schedule,
+    get_schedule,
+    list_enabled_schedules,
+    list_schedules,
+)
+from .stats_repository import apply_stats_deltas, get_latency_buckets, get_task_counters
+from .task_repository import (
+    CANCELLABLE_STATUSES,
+    EXPORT_COLUMNS,
+    TERMINAL_STATUSES,
+    StatusTransition,
+    apply_status_transitions,
+    cancel_task,
+    claim_task,
+    complete_task,
+    create_task,
+    create_tasks_bulk,
+    fail_task,
+    filter_tasks,
+    get_next_run_at,
+    get_task,
+    get_task_result,
+    get_task_status,
+    get_task_statuses,
+    insert_task,
+    list_failed_tasks,
+    release_due_tasks,
+    replay_failed_tasks,
+    retry_task,
+    stream_tasks,
+    summarize_failed_tasks,
+)
 
 __all__ = [
     "create_task",
+    "create_tasks_bulk",
+    "insert_task",
     "get_task",
+    "get_task_status",
+    "get_task_result",
+    "get_task_statuses",
     "filter_tasks",
+    "stream_tasks",
     "cancel_task",
+    "claim_task",
+    "complete_task",
+    "fail_task",
+    "retry_task",
+    "list_failed_tasks",
+    "summarize_failed_tasks",
+    "replay_failed_tasks",
+    "release_due_tasks",
+    "get_next_run_at",
+    "EXPORT_COLUMNS",
+    "CANCELLABLE_STATUSES",
+    "TERMINAL_STATUSES",
+    "create_schedule",
+    "get_schedule",
+    "list_schedules",
+    "delete_schedule",
+    "list_enabled_schedules",
+    "fire_schedule",
+    "apply_stats_deltas",
+    "get_task_counters",
+    "get_latency_buckets",
+    "StatusTransition",
+    "apply_status_transitions",
+    "add_outbox_messages",
+    "fetch_outbox_batch",
+    "delete_outbox_messages",
 ]
@@ -0,0 +1,48 @@
+import uuid
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.metrics import db_timed
+from async_task_manager.core.tracing import tracer
+from async_task_manager.models import TaskOutbox, TaskPriority
+
+
+async def add_outbox_messages(
+    session: AsyncSession, tasks: Iterable[tuple[uuid.UUID, TaskPriority]]
+) -> None:
+    """
+    Добавить сообщения о задачах в outbox.
+
+    Не выполняет commit: записи должны попасть в ту же транзакцию,
+    что и строки задач. Контекст текущей трассы сохраняется в записи,
+    чтобы ретранслятор продолжил её в сообщении RabbitMQ.
+    """
+    traceparent = tracer.current_traceparent()
+    rows = [
+        {"task_id": task_id, "priority": priority, "traceparent": traceparent}
+        for task_id, priority in tasks
+    ]
+    if rows:
+        await session.execute(insert(TaskOutbox), rows)
+
+
+@db_timed
+async def fetch_outbox_batch(session: AsyncSession, limit: int) -> Sequence[TaskOutbox]:
+    """
+    Выбрать и заблокировать пакет неотправленных сообщений.
+
+    Строки, уже заблокированные другим ретранслятором, пропускаются
+    (FOR UPDATE SKIP LOCKED), поэтому несколько ретрансляторов
+    разбирают outbox параллельно без дублей.
+    """
+    stmt = select(TaskOutbox).order_by(TaskOutbox.id).limit(limit).with_for_update(skip_locked=True)
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+@db_timed
+async def delete_outbox_messages(session: AsyncSession, ids: Sequence[int]) -> None:
+    """Удалить отправленные сообщения из outbox (без commit)."""
+    await session.execute(delete(TaskOutbox).where(TaskOutbox.id.in_(ids)))
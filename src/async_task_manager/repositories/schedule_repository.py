@@ -0,0 +1,127 @@
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.cron import CronExpression
+from async_task_manager.core.metrics import db_timed
+from async_task_manager.models import TaskPriority, TaskSchedule
+from async_task_manager.schemas import TaskCreate, TaskScheduleCreate
+
+from .task_repository import insert_task
+
+
+async def create_schedule(
+    session: AsyncSession, data: TaskScheduleCreate, now: datetime
+) -> TaskSchedule:
+    """Создать расписание; первое срабатывание — ближайшее по cron после now."""
+    stmt = (
+        insert(TaskSchedule)
+        .values(
+            id=uuid.uuid4(),
+            name=data.name,
+            cron=data.cron,
+            title=data.title,
+            description=data.description,
+            type=data.type,
+            priority=TaskPriority(data.priority),
+            max_retries=data.max_retries,
+            enabled=data.enabled,
+            next_fire_at=CronExpression.parse(data.cron).next_after(now),
+            created_at=now,
+        )
+        .returning(TaskSchedule)
+    )
+    schedule = (await session.scalars(stmt)).one()
+    await session.commit()
+    return schedule
+
+
+async def get_schedule(session: AsyncSession, schedule_id: uuid.UUID) -> TaskSchedule | None:
+    """Получить расписание по id."""
+    result = await session.execute(select(TaskSchedule).where(TaskSchedule.id == schedule_id))
+    return result.scalar_one_or_none()
+
+
+async def list_schedules(session: AsyncSession) -> Sequence[TaskSchedule]:
+    """Все расписания, упорядоченные по имени."""
+    result = await session.execute(select(TaskSchedule).order_by(TaskSchedule.name))
+    return result.scalars().all()
+
+
+async def delete_schedule(session: AsyncSession, schedule_id: uuid.UUID) -> bool:
+    """Удалить расписание; уже созданные им задачи остаются."""
+    result = await session.execute(delete(TaskSchedule).where(TaskSchedule.id == schedule_id))
+    await session.commit()
+    return result.rowcount > 0
+
+
+@db_timed
+async def list_enabled_schedules(
+    session: AsyncSession,
+) -> list[tuple[uuid.UUID, str, datetime]]:
+    """Активные расписания в виде (id, cron, next_fire_at) — без шаблонов задач."""
+    result = await session.execute(
+        select(TaskSchedule.id, TaskSchedule.cron, TaskSchedule.next_fire_at).where(
+            TaskSchedule.enabled.is_(True)
+        )
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@db_timed
+async def fire_schedule(
+    session: AsyncSession,
+    schedule_id: uuid.UUID,
+    fire_at: datetime,
+    next_fire_at: datetime,
+) -> tuple[uuid.UUID, TaskPriority] | None:
+    """
+    Сработать расписание: создать задачу по шаблону и сдвинуть next_fire_at.
+
+    Сдвиг выполняется условным UPDATE (next_fire_at всё ещё равен fire_at),
+    а задача и её сообщение в outbox пишутся в той же транзакции, поэтому
+    одно срабатывание не создаёт двух задач, даже если планировщиков
+    на короткое время оказалось два (смена лидера).
+
+    Returns:
+        (id, приоритет) созданной задачи или None, если расписание удалено,
+        выключено или это срабатывание уже выполнено
+    """
+    stmt = (
+        update(TaskSchedule)
+        .where(
+            TaskSchedule.id == schedule_id,
+            TaskSchedule.enabled.is_(True),
+            TaskSchedule.next_fire_at == fire_at,
+        )
+        .values(next_fire_at=next_fire_at, last_fired_at=fire_at)
+        .returning(
+            TaskSchedule.title,
+            TaskSchedule.description,
+            TaskSchedule.type,
+            TaskSchedule.priority,
+            TaskSchedule.max_retries,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    template = (await session.execute(stmt)).one_or_none()
+    if template is None:
+        await session.rollback()
+        return None
+
+    title, description, task_type, priority, max_retries = template
+    task = await insert_task(
+        session,
+        TaskCreate(
+            title=title,
+            description=description,
+            type=task_type,
+            priority=priority.value,
+            max_retries=max_retries,
+        ),
+    )
+    await session.commit()
+    return task.id, task.priority
@@ -0,0 +1,65 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.metrics import db_timed
+from async_task_manager.core.stats import StatsDelta
+from async_task_manager.models import TaskCounter, TaskLatencyBucket, TaskPriority, TaskStatus
+
+
+def _upsert_increment(session: AsyncSession, model, rows: list[dict]):
+    """INSERT ... ON CONFLICT DO UPDATE SET count = count + excluded.count."""
+    insert = postgresql_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(model).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[column.name for column in model.__table__.primary_key],
+        set_={"count": model.count + stmt.excluded.count},
+    )
+
+
+@db_timed
+async def apply_stats_deltas(session: AsyncSession, delta: StatsDelta) -> None:
+    """
+    Прибавить накопленные изменения к таблицам счётчиков одной транзакцией.
+
+    Строки сортируются по ключу, чтобы параллельные записи из разных
+    процессов блокировали их в одном порядке и не взаимоблокировались.
+    """
+    counter_rows = [
+        {"priority": TaskPriority(priority), "status": TaskStatus(status), "count": count}
+        for (priority, status), count in sorted(delta.counts.items())
+    ]
+    bucket_rows = [
+        {"metric": metric, "priority": TaskPriority(priority), "bucket": bucket, "count": count}
+        for (metric, priority), buckets in sorted(delta.buckets.items())
+        for bucket, count in sorted(buckets.items())
+    ]
+    if counter_rows:
+        await session.execute(_upsert_increment(session, TaskCounter, counter_rows))
+    if bucket_rows:
+        await session.execute(_upsert_increment(session, TaskLatencyBucket, bucket_rows))
+    await session.commit()
+
+
+async def get_task_counters(session: AsyncSession) -> list[tuple[TaskPriority, TaskStatus, int]]:
+    """Все счётчики задач: не больше (приоритеты x статусы) строк."""
+    result = await session.execute(
+        select(TaskCounter.priority, TaskCounter.status, TaskCounter.count)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+async def get_latency_buckets(
+    session: AsyncSession,
+) -> list[tuple[str, TaskPriority, int, int]]:
+    """Все бакеты скетчей задержек в виде (метрика, приоритет, бакет, счётчик)."""
+    result = await session.execute(
+        select(
+            TaskLatencyBucket.metric,
+            TaskLatencyBucket.priority,
+            TaskLatencyBucket.bucket,
+            TaskLatencyBucket.count,
+        )
+    )
+    return [tuple(row) for row in result.all()]
@@ -1,60 +1,659 @@
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import (
+    DateTime,
+    String,
+    Text,
+    column,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from async_task_manager.core.metrics import db_timed
 from async_task_manager.models import Task, TaskPriority, TaskStatus
-from async_task_manager.schemas import TaskCreate, TaskFilter
+from async_task_manager.schemas import FailedTaskFilter, TaskCreate, TaskExportFilter, TaskFilter
 
+from .outbox_repository import add_outbox_messages
 
-async def create_task(session: AsyncSession, data: TaskCreate) -> Task:
-    """Создать новую задачу."""
-    task = Task(
-        id=uuid.uuid4(),
-        title=data.title,
-        description=data.description,
-        priority=TaskPriority(data.priority),
-        status=TaskStatus.NEW,
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def _initial_status(data: TaskCreate, now: datetime) -> TaskStatus:
+    """Начальный статус: SCHEDULED для задач с run_at в будущем, иначе PENDING."""
+    if data.run_at is not None and data.run_at > now:
+        return TaskStatus.SCHEDULED
+    return TaskStatus.PENDING
+
+
+async def insert_task(session: AsyncSession, data: TaskCreate) -> Task:
+    """
+    Записать задачу и её сообщение в outbox, не завершая транзакцию.
+
+    Позволяет создать задачу атомарно с другими изменениями
+    (например, со сдвигом времени срабатывания расписания).
+    """
+    stmt = (
+        insert(Task)
+        .values(
+            id=uuid.uuid4(),
+            title=data.title,
+            description=data.description,
+            type=data.type,
+            max_retries=data.max_retries,
+            priority=TaskPriority(data.priority),
+            status=_initial_status(data, datetime.now(UTC)),
+            run_at=data.run_at,
+        )
+        .returning(Task)
     )
-    session.add(task)
+    task = (await session.scalars(stmt)).one()
+    if task.status == TaskStatus.PENDING:
+        await add_outbox_messages(session, [(task.id, task.priority)])
+    return task
+
+
+@db_timed
+async def create_task(session: AsyncSession, data: TaskCreate) -> Task:
+    """
+    Создать новую задачу сразу в статусе PENDING.
+
+    Строка записывается одним INSERT ... RETURNING, который возвращает её
+    вместе со значениями по умолчанию. В той же транзакции в outbox
+    добавляется сообщение для публикации, после чего выполняется
+    единственный commit — без промежуточного статуса NEW и повторных refresh.
+    Задача с run_at в будущем создаётся в статусе SCHEDULED без сообщения
+    в outbox — её опубликует планировщик.
+    """
+    task = await insert_task(session, data)
     await session.commit()
-    await session.refresh(task)
     return task
 
 
+@db_timed
+async def create_tasks_bulk(
+    session: AsyncSession, items: Sequence[TaskCreate]
+) -> list[tuple[uuid.UUID, TaskPriority, TaskStatus]]:
+    """
+    Создать пакет задач сразу в статусе PENDING одной транзакцией.
+
+    Строки вставляются многострочными INSERT порциями по
+    BULK_INSERT_CHUNK_SIZE (ограничение на число параметров запроса);
+    сообщения для публикации добавляются в outbox в той же транзакции
+    (кроме задач в статусе SCHEDULED).
+    Возвращает (id, приоритет, статус) созданных задач в исходном порядке.
+    """
+    created_at = datetime.now(UTC)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": item.title,
+            "description": item.description,
+            "type": item.type,
+            "max_retries": item.max_retries,
+            "priority": TaskPriority(item.priority),
+            "status": _initial_status(item, created_at),
+            "run_at": item.run_at,
+            "created_at": created_at,
+        }
+        for item in items
+    ]
+
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        await session.execute(insert(Task).values(rows[start : start + BULK_INSERT_CHUNK_SIZE]))
+    created = [(row["id"], row["priority"], row["status"]) for row in rows]
+    await add_outbox_messages(
+        session,
+        [(row["id"], row["priority"]) for row in rows if row["status"] == TaskStatus.PENDING],
+    )
+    await session.commit()
+
+    return created
+
+
+@db_timed
 async def get_task(session: AsyncSession, task_id: uuid.UUID) -> Task | None:
     """Получить задачу по id."""
     result = await session.execute(select(Task).where(Task.id == task_id))
     return result.scalar_one_or_none()
 
 
-async def filter_tasks(session: AsyncSession, filters: TaskFilter) -> Sequence[Task]:
-    """Получить список задач с фильтрацией и пагинацией."""
+@db_timed
+async def get_task_status(session: AsyncSession, task_id: uuid.UUID) -> TaskStatus | None:
+    """Получить только статус задачи, не загружая остальные колонки."""
+    result = await session.execute(select(Task.status).where(Task.id == task_id))
+    return result.scalar_one_or_none()
+
+
+@db_timed
+async def get_task_result(
+    session: AsyncSession, task_id: uuid.UUID
+) -> tuple[TaskStatus, str | None, str | None] | None:
+    """Получить (статус, результат, ссылку на результат) задачи без остальных колонок."""
+    result = await session.execute(
+        select(Task.status, Task.result, Task.result_ref).where(Task.id == task_id)
+    )
+    row = result.one_or_none()
+    return tuple(row) if row is not None else None
+
+
+@db_timed
+async def get_task_statuses(
+    session: AsyncSession, task_ids: Iterable[uuid.UUID]
+) -> dict[uuid.UUID, TaskStatus]:
+    """Получить статусы нескольких задач одним запросом (отсутствующие пропускаются)."""
+    result = await session.execute(select(Task.id, Task.status).where(Task.id.in_(list(task_ids))))
+    return {task_id: task_status for task_id, task_status in result.all()}
+
+
+@db_timed
+async def filter_tasks(
+    session: AsyncSession,
+    filters: TaskFilter,
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> Sequence[Task]:
+    """
+    Получить список задач с фильтрацией и пагинацией.
+
+    Задачи упорядочены от новых к старым по (created_at, id). Если задана
+    позиция after (курсор), выбираются задачи строго после неё — такой
+    запрос использует индекс и не зависит от глубины страницы, в отличие
+    от OFFSET (filters.skip), который применяется только без курсора.
+    """
     stmt = select(Task)
     if filters.status:
         stmt = stmt.where(Task.status == TaskStatus[filters.status])
     if filters.priority:
         stmt = stmt.where(Task.priority == TaskPriority[filters.priority])
-    stmt = stmt.offset(filters.skip).limit(filters.limit)
+    if after is not None:
+        created_at, task_id = after
+        stmt = stmt.where(
+            tuple_(Task.created_at, Task.id)
+            < tuple_(literal(created_at, Task.created_at.type), literal(task_id, Task.id.type))
+        )
+    else:
+        stmt = stmt.offset(filters.skip)
+    stmt = stmt.order_by(Task.created_at.desc(), Task.id.desc()).limit(filters.limit)
     result = await session.execute(stmt)
     return result.scalars().all()
 
 
-async def cancel_task(session: AsyncSession, task_id: uuid.UUID) -> Task | None:
+EXPORT_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.type,
+    Task.priority,
+    Task.status,
+    Task.created_at,
+    Task.run_at,
+    Task.started_at,
+    Task.finished_at,
+    Task.result,
+    Task.result_ref,
+    Task.error,
+    Task.error_type,
+    Task.retry_count,
+    Task.max_retries,
+)
+
+
+async def stream_tasks(
+    session: AsyncSession, filters: TaskExportFilter, chunk_size: int
+) -> AsyncIterator[list[RowMapping]]:
     """
-    Отменить задачу, если она в статусе NEW, PENDING или IN_PROGRESS.
-    Возвращает обновлённую задачу или None, если не найдена.
+    Выгрузить задачи порциями через серверный курсор.
+
+    Строки выбираются колонками (без ORM-объектов и identity map) по
+    chunk_size за раз (yield_per), поэтому память не зависит от объёма
+    выгрузки. Порядок — по возрастанию (created_at, id).
     """
-    result = await session.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
+    stmt = select(*EXPORT_COLUMNS)
+    if filters.status:
+        stmt = stmt.where(Task.status == TaskStatus[filters.status])
+    if filters.priority:
+        stmt = stmt.where(Task.priority == TaskPriority[filters.priority])
+    if filters.since is not None:
+        stmt = stmt.where(Task.created_at >= filters.since)
+    if filters.until is not None:
+        stmt = stmt.where(Task.created_at < filters.until)
+    stmt = stmt.order_by(Task.created_at, Task.id).execution_options(yield_per=chunk_size)
+
+    result = await session.stream(stmt)
+    async for partition in result.mappings().partitions():
+        yield partition
+
+
+@db_timed
+async def release_due_tasks(
+    session: AsyncSession, now: datetime, limit: int
+) -> list[tuple[uuid.UUID, TaskPriority]]:
+    """
+    Перевести в PENDING порцию задач SCHEDULED, время запуска которых наступило.
+
+    Порция выбирается по частичному индексу ix_tasks_scheduled_run_at
+    (только задачи в статусе SCHEDULED, по возрастанию run_at) и блокируется
+    с SKIP LOCKED, поэтому несколько планировщиков разбирают разные строки.
+    Сообщения для публикации добавляются в outbox в той же транзакции.
+    """
+    stmt = (
+        select(Task.id, Task.priority)
+        .where(Task.status == TaskStatus.SCHEDULED, Task.run_at <= now)
+        .order_by(Task.run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = [tuple(row) for row in (await session.execute(stmt)).all()]
+    if not rows:
+        await session.rollback()
+        return []
+
+    await session.execute(
+        update(Task)
+        .where(Task.id.in_([task_id for task_id, _ in rows]), Task.status == TaskStatus.SCHEDULED)
+        .values(status=TaskStatus.PENDING)
+        .execution_options(synchronize_session=False)
+    )
+    await add_outbox_messages(session, rows)
+    await session.commit()
+    return rows
+
+
+@db_timed
+async def get_next_run_at(session: AsyncSession) -> datetime | None:
+    """Ближайшее время запуска среди задач SCHEDULED (по частичному индексу)."""
+    result = await session.execute(
+        select(func.min(Task.run_at)).where(Task.status == TaskStatus.SCHEDULED)
+    )
+    return result.scalar_one_or_none()
+
+
+def _failed_tasks_where(
+    error_type: str | None, since: datetime | None, until: datetime | None
+) -> list:
+    """Условия выборки упавших задач по классу ошибки и окну времени завершения."""
+    conditions = [Task.status == TaskStatus.FAILED]
+    if error_type is not None:
+        conditions.append(Task.error_type == error_type)
+    if since is not None:
+        conditions.append(Task.finished_at >= since)
+    if until is not None:
+        conditions.append(Task.finished_at < until)
+    return conditions
+
+
+def _position_literal(position: tuple[datetime, uuid.UUID]):
+    at, task_id = position
+    return tuple_(literal(at, Task.finished_at.type), literal(task_id, Task.id.type))
+
+
+@db_timed
+async def list_failed_tasks(
+    session: AsyncSession,
+    filters: FailedTaskFilter,
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> Sequence[Task]:
+    """
+    Получить упавшие задачи от последних к ранним по (finished_at, id).
+
+    Позиция after (курсор) работает так же, как в filter_tasks.
+    """
+    stmt = select(Task).where(
+        *_failed_tasks_where(filters.error_type, filters.since, filters.until)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Task.finished_at, Task.id) < _position_literal(after))
+    stmt = stmt.order_by(Task.finished_at.desc(), Task.id.desc()).limit(filters.limit)
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+@db_timed
+async def summarize_failed_tasks(
+    session: AsyncSession, since: datetime | None = None, until: datetime | None = None
+) -> list[tuple[str | None, int, datetime | None]]:
+    """Число упавших задач и время последнего падения по классам ошибок."""
+    stmt = (
+        select(Task.error_type, func.count(), func.max(Task.finished_at))
+        .where(*_failed_tasks_where(None, since, until))
+        .group_by(Task.error_type)
+        .order_by(func.count().desc())
+    )
+    result = await session.execute(stmt)
+    return [tuple(row) for row in result.all()]
+
+
+@db_timed
+async def replay_failed_tasks(
+    session: AsyncSession,
+    limit: int,
+    error_type: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> list[tuple[uuid.UUID, TaskPriority, datetime]]:
+    """
+    Вернуть в PENDING очередную порцию упавших задач одной транзакцией.
+
+    Порция выбирается от ранних к поздним по (finished_at, id) после
+    позиции after и блокируется с SKIP LOCKED, чтобы параллельные повторы
+    не брали одни и те же строки. Счётчик повторов и ошибка сбрасываются,
+    сообщения для публикации добавляются в outbox в той же транзакции.
+    Возвращает (id, приоритет, finished_at) задач порции в порядке выборки.
+    """
+    stmt = select(Task.id, Task.priority, Task.finished_at).where(
+        *_failed_tasks_where(error_type, since, until)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Task.finished_at, Task.id) > _position_literal(after))
+    stmt = stmt.order_by(Task.finished_at, Task.id).limit(limit).with_for_update(skip_locked=True)
+    rows = [tuple(row) for row in (await session.execute(stmt)).all()]
+    if not rows:
+        await session.rollback()
+        return []
+
+    await session.execute(
+        update(Task)
+        .where(Task.id.in_([task_id for task_id, _, _ in rows]), Task.status == TaskStatus.FAILED)
+        .values(
+            status=TaskStatus.PENDING,
+            retry_count=0,
+            started_at=None,
+            finished_at=None,
+            result=None,
+            result_ref=None,
+            error=None,
+            error_type=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await add_outbox_messages(session, [(task_id, priority) for task_id, priority, _ in rows])
+    await session.commit()
+    return rows
+
+
+CANCELLABLE_STATUSES = (
+    TaskStatus.NEW,
+    TaskStatus.SCHEDULED,
+    TaskStatus.PENDING,
+    TaskStatus.IN_PROGRESS,
+)
+TERMINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+
+@db_timed
+async def cancel_task(session: AsyncSession, task_id: uuid.UUID) -> tuple[Task, TaskStatus] | None:
+    """
+    Отменить задачу, если она в статусе NEW, SCHEDULED, PENDING или IN_PROGRESS.
+
+    Текущий статус читается с блокировкой строки (FOR UPDATE), затем задача
+    переводится в CANCELLED условным UPDATE ... RETURNING с проверкой этого
+    статуса, поэтому отмена не конфликтует с воркером, а прежний статус
+    известен точно (для счётчиков статистики).
+    Возвращает обновлённую задачу и её прежний статус или None, если задача
+    не найдена или её нельзя отменить из текущего статуса.
+    """
+    previous = await session.scalar(
+        select(Task.status)
+        .where(Task.id == task_id, Task.status.in_(CANCELLABLE_STATUSES))
+        .with_for_update()
+    )
+    if previous is None:
+        await session.rollback()
         return None
-    if task.status not in [TaskStatus.NEW, TaskStatus.PENDING, TaskStatus.IN_PROGRESS]:
-        return task
-    task.status = TaskStatus.CANCELLED
-    task.finished_at = datetime.now(UTC)
+
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.status == previous)
+        .values(status=TaskStatus.CANCELLED, finished_at=datetime.now(UTC))
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+    task = (await session.scalars(stmt)).one_or_none()
+    await session.commit()
+    return (task, previous) if task is not None else None
+
+
+@db_timed
+async def claim_task(session: AsyncSession, task_id: uuid.UUID) -> Task | None:
+    """
+    Захватить задачу для выполнения.
+
+    Одним условным UPDATE ... WHERE status = 'PENDING' RETURNING переводит
+    задачу в IN_PROGRESS и возвращает её. Если задача не найдена или уже
+    захвачена (повторная доставка сообщения), отменена или завершена,
+    возвращает None.
+    """
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.status == TaskStatus.PENDING)
+        .values(status=TaskStatus.IN_PROGRESS, started_at=datetime.now(UTC))
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+    task = (await session.scalars(stmt)).one_or_none()
     await session.commit()
-    await session.refresh(task)
     return task
+
+
+@db_timed
+async def complete_task(
+    session: AsyncSession,
+    task_id: uuid.UUID,
+    result: str | None,
+    result_ref: str | None = None,
+) -> bool:
+    """
+    Перевести задачу из IN_PROGRESS в COMPLETED.
+
+    Большой результат передаётся ссылкой result_ref на хранилище результатов.
+    Возвращает False, если задача уже не в статусе IN_PROGRESS
+    (например, была отменена во время выполнения).
+    """
+    return await _finish_task(
+        session, task_id, status=TaskStatus.COMPLETED, result=result, result_ref=result_ref
+    )
+
+
+@db_timed
+async def fail_task(
+    session: AsyncSession, task_id: uuid.UUID, error: str, error_type: str | None = None
+) -> bool:
+    """
+    Перевести задачу из IN_PROGRESS в FAILED.
+
+    Возвращает False, если задача уже не в статусе IN_PROGRESS.
+    """
+    return await _finish_task(
+        session, task_id, status=TaskStatus.FAILED, error=error, error_type=error_type
+    )
+
+
+async def _finish_task(
+    session: AsyncSession, task_id: uuid.UUID, status: TaskStatus, **values
+) -> bool:
+    """Условно (только из IN_PROGRESS) записать итоговый статус задачи."""
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.status == TaskStatus.IN_PROGRESS)
+        .values(status=status, finished_at=datetime.now(UTC), **values)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    await session.commit()
+    return result.rowcount == 1
+
+
+@db_timed
+async def retry_task(
+    session: AsyncSession,
+    task_id: uuid.UUID,
+    retry_count: int,
+    error: str,
+    error_type: str | None = None,
+) -> bool:
+    """
+    Вернуть задачу из IN_PROGRESS в PENDING для повтора после ошибки.
+
+    Условие на retry_count защищает от двойного учёта повтора; возвращает
+    False, если задача уже не выполняется (например, отменена).
+    """
+    stmt = (
+        update(Task)
+        .where(
+            Task.id == task_id,
+            Task.status == TaskStatus.IN_PROGRESS,
+            Task.retry_count == retry_count,
+        )
+        .values(
+            status=TaskStatus.PENDING,
+            retry_count=retry_count + 1,
+            started_at=None,
+            error=error,
+            error_type=error_type,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    await session.commit()
+    return result.rowcount == 1
+
+
+@dataclass(slots=True)
+class StatusTransition:
+    """
+    Переход задачи из expected_status в status для пакетной записи.
+
+    Поля started_at, finished_at, result, result_ref, error и error_type записываются,
+    только если заданы.
+    """
+
+    task_id: uuid.UUID
+    status: TaskStatus
+    expected_status: TaskStatus
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: str | None = None
+    result_ref: str | None = None
+    error: str | None = None
+    error_type: str | None = None
+
+    def merge(self, later: "StatusTransition") -> "StatusTransition":
+        """Объединить с более поздним переходом той же задачи в один."""
+        return replace(
+            later,
+            expected_status=self.expected_status,
+            started_at=later.started_at or self.started_at,
+            finished_at=later.finished_at or self.finished_at,
+            result=later.result if later.result is not None else self.result,
+            result_ref=later.result_ref if later.result_ref is not None else self.result_ref,
+            error=later.error if later.error is not None else self.error,
+            error_type=later.error_type if later.error_type is not None else self.error_type,
+        )
+
+
+@db_timed
+async def apply_status_transitions(
+    session: AsyncSession, transitions: Sequence[StatusTransition]
+) -> set[uuid.UUID]:
+    """
+    Записать пакет переходов статусов одной транзакцией.
+
+    В PostgreSQL пакет записывается одним UPDATE ... FROM (VALUES ...)
+    с условием на ожидаемый статус каждой строки; в остальных СУБД —
+    условными UPDATE по строкам в одной транзакции.
+    Возвращает id задач, переходы которых применены.
+    """
+    if not transitions:
+        return set()
+
+    if session.get_bind().dialect.name == "postgresql":
+        applied = await _apply_status_transitions_values(session, transitions)
+    else:
+        applied = set()
+        for transition in transitions:
+            result = await session.execute(
+                update(Task)
+                .where(Task.id == transition.task_id, Task.status == transition.expected_status)
+                .values(status=transition.status, **_transition_values(transition))
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                applied.add(transition.task_id)
+
+    await session.commit()
+    return applied
+
+
+def _transition_values(transition: StatusTransition) -> dict:
+    """Необязательные поля перехода, которые нужно записать."""
+    fields = ("started_at", "finished_at", "result", "result_ref", "error", "error_type")
+    return {
+        field: getattr(transition, field)
+        for field in fields
+        if getattr(transition, field) is not None
+    }
+
+
+async def _apply_status_transitions_values(
+    session: AsyncSession, transitions: Sequence[StatusTransition]
+) -> set[uuid.UUID]:
+    """Пакетный UPDATE tasks ... FROM (VALUES ...) для PostgreSQL."""
+    applied: set[uuid.UUID] = set()
+
+    for start in range(0, len(transitions), BULK_INSERT_CHUNK_SIZE):
+        chunk = transitions[start : start + BULK_INSERT_CHUNK_SIZE]
+        rows = values(
+            column("id", Task.id.type),
+            column("status", Task.status.type),
+            column("expected_status", Task.status.type),
+            column("started_at", DateTime(timezone=True)),
+            column("finished_at", DateTime(timezone=True)),
+            column("result", Text),
+            column("result_ref", String(80)),
+            column("error", Text),
+            column("error_type", String(128)),
+            name="v",
+        ).data(
+            [
+                (
+                    t.task_id,
+                    t.status,
+                    t.expected_status,
+                    t.started_at,
+                    t.finished_at,
+                    t.result,
+                    t.result_ref,
+                    t.error,
+                    t.error_type,
+                )
+                for t in chunk
+            ]
+        )
+        stmt = (
+            update(Task)
+            .where(Task.id == rows.c.id, Task.status == rows.c.expected_status)
+            .values(
+                status=rows.c.status,
+                started_at=func.coalesce(rows.c.started_at, Task.started_at),
+                finished_at=func.coalesce(rows.c.finished_at, Task.finished_at),
+                result=func.coalesce(rows.c.result, Task.result),
+                result_ref=func.coalesce(rows.c.result_ref, Task.result_ref),
+                error=func.coalesce(rows.c.error, Task.error),
+                error_type=func.coalesce(rows.c.error_type, Task.error_type),
+            )
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        applied.update((await session.execute(stmt)).scalars())
+
+    return applied
@@ -1,8 +1,23 @@
 from .error import ErrorDetail, HealthStatus, ValidationError
-from .task import PriorityLiteral, StatusLiteral, TaskCreate, TaskFilter, TaskRead, TaskStatusRead
+from .export import ExportFormatLiteral, TaskExportFilter
+from .replay import MAX_REPLAY_BATCH_SIZE, FailedTaskFilter, FailedTaskSummary, TaskReplayRequest
+from .schedule import TaskScheduleCreate, TaskScheduleRead
+from .stats import LatencyPercentiles, PriorityStats, TaskStats
+from .subscription import TaskSubscriptionFilter, TaskSubscriptionMessage
+from .task import (
+    MAX_BATCH_SIZE,
+    PriorityLiteral,
+    StatusLiteral,
+    TaskBatchCreate,
+    TaskCreate,
+    TaskFilter,
+    TaskRead,
+    TaskStatusRead,
+)
 
 __all__ = [
     "TaskCreate",
+    "TaskBatchCreate",
     "TaskRead",
     "TaskStatusRead",
     "TaskFilter",
@@ -11,4 +26,18 @@ __all__ = [
     "HealthStatus",
     "PriorityLiteral",
     "StatusLiteral",
+    "MAX_BATCH_SIZE",
+    "TaskSubscriptionFilter",
+    "TaskSubscriptionMessage",
+    "FailedTaskFilter",
+    "FailedTaskSummary",
+    "TaskReplayRequest",
+    "MAX_REPLAY_BATCH_SIZE",
+    "TaskScheduleCreate",
+    "TaskScheduleRead",
+    "TaskExportFilter",
+    "ExportFormatLiteral",
+    "TaskStats",
+    "PriorityStats",
+    "LatencyPercentiles",
 ]
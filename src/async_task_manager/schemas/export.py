@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .task import PriorityLiteral, StatusLiteral
+
+ExportFormatLiteral = Literal["ndjson", "csv"]
+
+
+class TaskExportFilter(BaseModel):
+    """Схема фильтрации выгрузки задач."""
+
+    format: ExportFormatLiteral = Field("ndjson", json_schema_extra={"example": "csv"})
+    status: StatusLiteral | None = Field(None, json_schema_extra={"example": "COMPLETED"})
+    priority: PriorityLiteral | None = Field(None, json_schema_extra={"example": "HIGH"})
+    since: datetime | None = Field(None, description="Созданы не раньше")
+    until: datetime | None = Field(None, description="Созданы раньше")
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+MAX_REPLAY_BATCH_SIZE = 1000
+
+
+class FailedTaskFilter(BaseModel):
+    """Схема фильтрации упавших (FAILED) задач."""
+
+    error_type: str | None = Field(None, json_schema_extra={"example": "TimeoutError"})
+    since: datetime | None = Field(None, description="Завершены не раньше")
+    until: datetime | None = Field(None, description="Завершены раньше")
+    limit: int = Field(10, ge=1, le=100, json_schema_extra={"example": 10})
+    cursor: str | None = Field(None, json_schema_extra={"example": None})
+
+
+class FailedTaskSummary(BaseModel):
+    """Число упавших задач по классу ошибки."""
+
+    error_type: str | None
+    count: int
+    last_failed_at: datetime | None
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "error_type": "TimeoutError",
+                    "count": 1520,
+                    "last_failed_at": "2024-06-20T12:00:00Z",
+                }
+            ]
+        }
+    )
+
+
+class TaskReplayRequest(BaseModel):
+    """Схема повторного запуска упавших задач."""
+
+    error_type: str | None = Field(None, json_schema_extra={"example": "TimeoutError"})
+    since: datetime | None = Field(None, description="Завершены не раньше")
+    until: datetime | None = Field(
+        None, description="Завершены раньше (по умолчанию — момент начала повтора)"
+    )
+    limit: int | None = Field(None, ge=1, description="Сколько задач повторить всего")
+    batch_size: int = Field(500, ge=1, le=MAX_REPLAY_BATCH_SIZE)
+    rate: float = Field(200.0, gt=0, description="Не больше задач в секунду")
+    cursor: str | None = Field(None, description="Курсор из прерванного повтора")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [{"error_type": "TimeoutError", "batch_size": 500, "rate": 200}]
+        }
+    )
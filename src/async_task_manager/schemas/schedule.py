@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from async_task_manager.core.cron import CronExpression
+
+from .task import MAX_RETRIES_LIMIT, PriorityLiteral
+
+
+class TaskScheduleCreate(BaseModel):
+    """Схема для создания периодического расписания задачи."""
+
+    name: str = Field(..., min_length=1, max_length=128, json_schema_extra={"example": "nightly"})
+    cron: str = Field(
+        ...,
+        max_length=128,
+        description="Cron-выражение из пяти полей: минута, час, день месяца, месяц, "
+        "день недели (время UTC)",
+        json_schema_extra={"example": "0 3 * * *"},
+    )
+    title: str = Field(..., json_schema_extra={"example": "Ночная выгрузка"})
+    description: str = Field(..., json_schema_extra={"example": "Выгрузка отчётов за сутки"})
+    priority: PriorityLiteral = Field(..., json_schema_extra={"example": "MEDIUM"})
+    type: str = Field("default", min_length=1, max_length=64)
+    max_retries: int = Field(3, ge=0, le=MAX_RETRIES_LIMIT)
+    enabled: bool = True
+
+    @field_validator("cron")
+    @classmethod
+    def _valid_cron(cls, value: str) -> str:
+        # CronError — подкласс ValueError и превращается в ошибку валидации
+        return CronExpression.parse(value).expression
+
+
+class TaskScheduleRead(BaseModel):
+    """Схема для вывода периодического расписания."""
+
+    id: uuid.UUID
+    name: str
+    cron: str
+    title: str
+    description: str
+    type: str
+    priority: str
+    max_retries: int
+    enabled: bool
+    next_fire_at: datetime
+    last_fired_at: datetime | None
+    created_at: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "id": "5f0c2a1e-9d3b-4c7a-8e21-6b4f0d9a7c35",
+                    "name": "nightly",
+                    "cron": "0 3 * * *",
+                    "title": "Ночная выгрузка",
+                    "description": "Выгрузка отчётов за сутки",
+                    "type": "default",
+                    "priority": "MEDIUM",
+                    "max_retries": 3,
+                    "enabled": True,
+                    "next_fire_at": "2024-06-21T03:00:00Z",
+                    "last_fired_at": "2024-06-20T03:00:00Z",
+                    "created_at": "2024-06-01T12:00:00Z",
+                }
+            ]
+        },
+    )
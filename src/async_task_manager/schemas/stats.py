@@ -0,0 +1,44 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class LatencyPercentiles(BaseModel):
+    """Квантили задержки в секундах (относительная точность — STATS_SKETCH_ACCURACY)."""
+
+    count: int
+    p50: float | None
+    p90: float | None
+    p99: float | None
+
+
+class PriorityStats(BaseModel):
+    """Статистика задач одного приоритета."""
+
+    by_status: dict[str, int]
+    queue_wait: LatencyPercentiles
+    run_time: LatencyPercentiles
+
+
+class TaskStats(BaseModel):
+    """Сводная статистика задач."""
+
+    total: int
+    by_status: dict[str, int]
+    by_priority: dict[str, PriorityStats]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "total": 3,
+                    "by_status": {"PENDING": 1, "COMPLETED": 2},
+                    "by_priority": {
+                        "HIGH": {
+                            "by_status": {"PENDING": 1, "COMPLETED": 2},
+                            "queue_wait": {"count": 2, "p50": 0.012, "p90": 0.02, "p99": 0.02},
+                            "run_time": {"count": 2, "p50": 1.5, "p90": 2.1, "p99": 2.1},
+                        }
+                    },
+                }
+            ]
+        }
+    )
@@ -0,0 +1,33 @@
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from .task import PriorityLiteral, StatusLiteral
+
+
+class TaskSubscriptionFilter(BaseModel):
+    """Фильтр подписки на переходы статусов (все заданные поля должны совпасть)."""
+
+    priority: PriorityLiteral | None = Field(None, json_schema_extra={"example": "HIGH"})
+    status: StatusLiteral | None = Field(None, json_schema_extra={"example": "COMPLETED"})
+
+    @model_validator(mode="after")
+    def _not_empty(self) -> "TaskSubscriptionFilter":
+        if self.priority is None and self.status is None:
+            raise ValueError("Фильтр должен задавать priority или status")
+        return self
+
+
+class TaskSubscriptionMessage(BaseModel):
+    """Сообщение клиента WebSocket /ws/tasks: подписка или отписка."""
+
+    action: Literal["subscribe", "unsubscribe"]
+    task_ids: list[uuid.UUID] = Field(default_factory=list)
+    filter: TaskSubscriptionFilter | None = None
+
+    @model_validator(mode="after")
+    def _has_target(self) -> "TaskSubscriptionMessage":
+        if not self.task_ids and self.filter is None:
+            raise ValueError("Нужно указать task_ids или filter")
+        return self
@@ -2,11 +2,12 @@ import uuid
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 PriorityLiteral = Literal["LOW", "MEDIUM", "HIGH"]
 StatusLiteral = Literal[
     "NEW",
+    "SCHEDULED",
     "PENDING",
     "IN_PROGRESS",
     "COMPLETED",
@@ -14,6 +15,9 @@ StatusLiteral = Literal[
     "CANCELLED",
 ]
 
+MAX_BATCH_SIZE = 10_000
+MAX_RETRIES_LIMIT = 20
+
 
 class TaskCreate(BaseModel):
     """Схема для создания задачи."""
@@ -21,6 +25,26 @@ class TaskCreate(BaseModel):
     title: str = Field(..., json_schema_extra={"example": "Сделать тестовое задание"})
     description: str = Field(..., json_schema_extra={"example": "Подробное описание задачи"})
     priority: PriorityLiteral = Field(..., json_schema_extra={"example": "HIGH"})
+    type: str = Field(
+        "default",
+        min_length=1,
+        max_length=64,
+        description="Тип задачи, определяет обработчик в воркере",
+        json_schema_extra={"example": "default"},
+    )
+    max_retries: int = Field(
+        3,
+        ge=0,
+        le=MAX_RETRIES_LIMIT,
+        description="Сколько раз повторить задачу после ошибки до статуса FAILED",
+        json_schema_extra={"example": 3},
+    )
+    run_at: AwareDatetime | None = Field(
+        None,
+        description="Запустить не раньше этого времени (с часовым поясом); "
+        "до него задача находится в статусе SCHEDULED",
+        json_schema_extra={"example": None},
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -29,6 +53,26 @@ class TaskCreate(BaseModel):
                     "title": "Сделать тестовое задание",
                     "description": "Подробное описание задачи",
                     "priority": "HIGH",
+                    "type": "default",
+                }
+            ]
+        }
+    )
+
+
+class TaskBatchCreate(BaseModel):
+    """Схема для пакетного создания задач."""
+
+    tasks: list[TaskCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "tasks": [
+                        {"title": "Первая задача", "description": "Описание", "priority": "HIGH"},
+                        {"title": "Вторая задача", "description": "Описание", "priority": "LOW"},
+                    ]
                 }
             ]
         }
@@ -41,13 +85,21 @@ class TaskRead(BaseModel):
     id: uuid.UUID
     title: str
     description: str
+    type: str
     priority: str
     status: str
     created_at: datetime
+    run_at: datetime | None = None
     started_at: datetime | None
     finished_at: datetime | None
     result: str | None
+    result_ref: str | None = Field(
+        None, description="Результат вынесен в хранилище: GET /tasks/{id}/result"
+    )
     error: str | None
+    error_type: str | None = None
+    retry_count: int
+    max_retries: int
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -57,13 +109,18 @@ class TaskRead(BaseModel):
                     "id": "b3b7c7e2-8c2e-4e2a-9c2e-7e2a8c2e4e2a",
                     "title": "Сделать тестовое задание",
                     "description": "Подробное описание задачи",
+                    "type": "default",
                     "priority": "HIGH",
-                    "status": "NEW",
+                    "status": "PENDING",
                     "created_at": "2024-06-20T12:00:00Z",
                     "started_at": None,
                     "finished_at": None,
                     "result": None,
+                    "result_ref": None,
                     "error": None,
+                    "error_type": None,
+                    "retry_count": 0,
+                    "max_retries": 3,
                 }
             ]
         },
@@ -91,6 +148,7 @@ class TaskFilter(BaseModel):
     priority: PriorityLiteral | None = Field(None, json_schema_extra={"example": "HIGH"})
     skip: int = Field(0, ge=0, json_schema_extra={"example": 0})
     limit: int = Field(10, ge=1, le=100, json_schema_extra={"example": 10})
+    cursor: str | None = Field(None, json_schema_extra={"example": None})
 
     model_config = ConfigDict(
         extra="forbid",
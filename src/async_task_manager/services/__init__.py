@@ -1,15 +1,51 @@
+from .export_service import EXPORT_MEDIA_TYPES, export_tasks_service
+from .failed_task_service import (
+    encode_failed_cursor,
+    list_failed_tasks_service,
+    replay_failed_tasks_service,
+    summarize_failed_tasks_service,
+)
+from .schedule_service import (
+    create_schedule_service,
+    delete_schedule_service,
+    get_schedule_service,
+    list_schedules_service,
+)
+from .stats_service import get_task_stats_service
+from .task_events import stream_task_events_service, wait_for_task_service
 from .task_service import (
     cancel_task_service,
     create_task_service,
+    create_tasks_batch_service,
+    decode_task_cursor,
+    encode_task_cursor,
     filter_tasks_service,
+    get_task_result_service,
     get_task_service,
     get_task_status_service,
 )
 
 __all__ = [
     "create_task_service",
+    "create_tasks_batch_service",
     "get_task_service",
     "filter_tasks_service",
     "get_task_status_service",
+    "get_task_result_service",
     "cancel_task_service",
+    "encode_task_cursor",
+    "decode_task_cursor",
+    "wait_for_task_service",
+    "stream_task_events_service",
+    "list_failed_tasks_service",
+    "summarize_failed_tasks_service",
+    "replay_failed_tasks_service",
+    "encode_failed_cursor",
+    "export_tasks_service",
+    "EXPORT_MEDIA_TYPES",
+    "get_task_stats_service",
+    "create_schedule_service",
+    "list_schedules_service",
+    "get_schedule_service",
+    "delete_schedule_service",
 ]
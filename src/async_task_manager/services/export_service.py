@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from enum import Enum
+
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.config import settings
+from async_task_manager.repositories import EXPORT_COLUMNS, stream_tasks
+from async_task_manager.schemas import TaskExportFilter
+
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _plain(value):
+    """Значение колонки в виде, пригодном для JSON и CSV."""
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int)):
+        return value
+    return str(value)
+
+
+def _ndjson_chunk(rows: Sequence[RowMapping]) -> bytes:
+    lines = [
+        json.dumps({field: _plain(row[field]) for field in EXPORT_FIELDS}, ensure_ascii=False)
+        for row in rows
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _csv_chunk(rows: Sequence[RowMapping], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([_plain(row[field]) for field in EXPORT_FIELDS] for row in rows)
+    return buffer.getvalue().encode()
+
+
+async def export_tasks_service(
+    session: AsyncSession, filters: TaskExportFilter
+) -> AsyncIterator[bytes]:
+    """
+    Потоковая выгрузка задач в NDJSON или CSV.
+
+    Каждая порция серверного курсора (EXPORT_CHUNK_SIZE строк) сразу
+    сериализуется в один фрагмент ответа, поэтому память процесса не
+    зависит от числа выгружаемых задач.
+    """
+    header = filters.format == "csv"
+    async for rows in stream_tasks(session, filters, settings.EXPORT_CHUNK_SIZE):
+        if filters.format == "csv":
+            yield _csv_chunk(rows, header)
+            header = False
+        else:
+            yield _ndjson_chunk(rows)
+    if header:
+        # Пустая выгрузка в CSV — только заголовок
+        yield _csv_chunk([], header)
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.stats import task_stats
+from async_task_manager.models import TaskStatus
+from async_task_manager.repositories import (
+    list_failed_tasks,
+    replay_failed_tasks,
+    summarize_failed_tasks,
+)
+from async_task_manager.schemas import (
+    FailedTaskFilter,
+    FailedTaskSummary,
+    TaskRead,
+    TaskReplayRequest,
+)
+from async_task_manager.workers.outbox_relay import outbox_relay
+
+from .task_events import publish_task_event
+from .task_service import decode_position_cursor, encode_position_cursor
+
+logger = logging.getLogger(__name__)
+
+FAILED_CURSOR_FIELD = "finished_at"
+
+
+def encode_failed_cursor(task: TaskRead) -> str:
+    """Курсор позиции упавшей задачи: (finished_at, id)."""
+    return encode_position_cursor(task.finished_at, task.id, FAILED_CURSOR_FIELD)
+
+
+async def list_failed_tasks_service(
+    session: AsyncSession, filters: FailedTaskFilter
+) -> Sequence[TaskRead]:
+    """Получение упавших задач по классу ошибки и окну времени"""
+    after = decode_position_cursor(filters.cursor, FAILED_CURSOR_FIELD) if filters.cursor else None
+    tasks = await list_failed_tasks(session, filters, after=after)
+    return [TaskRead.model_validate(t) for t in tasks]
+
+
+async def summarize_failed_tasks_service(
+    session: AsyncSession, since: datetime | None, until: datetime | None
+) -> list[FailedTaskSummary]:
+    """Сводка упавших задач по классам ошибок"""
+    rows = await summarize_failed_tasks(session, since, until)
+    return [
+        FailedTaskSummary(error_type=error_type, count=count, last_failed_at=last_failed_at)
+        for error_type, count, last_failed_at in rows
+    ]
+
+
+def replay_failed_tasks_service(
+    session: AsyncSession, request: TaskReplayRequest
+) -> AsyncIterator[bytes]:
+    """
+    Подготовить повторный запуск упавших задач.
+
+    Параметры проверяются до начала ответа; сам повтор выполняется по мере
+    чтения потока (см. _replay_batches).
+    """
+    if request.rate > settings.REPLAY_MAX_RATE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Темп повтора не больше {settings.REPLAY_MAX_RATE} задач в секунду",
+        )
+    after = decode_position_cursor(request.cursor, FAILED_CURSOR_FIELD) if request.cursor else None
+    # Без верхней границы задачи, упавшие повторно во время повтора, попали бы в него снова
+    until = request.until or datetime.now(UTC)
+    return _replay_batches(session, request, until, after)
+
+
+async def _replay_batches(
+    session: AsyncSession,
+    request: TaskReplayRequest,
+    until: datetime,
+    after: tuple[datetime, uuid.UUID] | None,
+) -> AsyncIterator[bytes]:
+    """
+    Повтор упавших задач порциями с ограничением темпа.
+
+    Каждая порция — отдельная короткая транзакция (FAILED -> PENDING и
+    outbox), после неё поток выдаёт строку NDJSON с курсором. Между
+    порциями выдерживается пауза, чтобы темп не превышал request.rate.
+    Если поток прервался, повтор продолжается с последнего курсора;
+    уже повторённые задачи не в статусе FAILED и повторно не выбираются.
+    """
+    loop = asyncio.get_running_loop()
+    total = 0
+    cursor = request.cursor
+
+    while request.limit is None or total < request.limit:
+        size = request.batch_size
+        if request.limit is not None:
+            size = min(size, request.limit - total)
+
+        started = loop.time()
+        rows = await replay_failed_tasks(
+            session,
+            size,
+            error_type=request.error_type,
+            since=request.since,
+            until=until,
+            after=after,
+        )
+        if not rows:
+            break
+
+        total += len(rows)
+        last_id, _, last_finished_at = rows[-1]
+        after = (last_finished_at, last_id)
+        cursor = encode_position_cursor(last_finished_at, last_id, FAILED_CURSOR_FIELD)
+
+        outbox_relay.notify()
+        for task_id, priority, _ in rows:
+            task_stats.transition(priority.value, TaskStatus.FAILED.value, TaskStatus.PENDING.value)
+            await publish_task_event(task_id, TaskStatus.PENDING.value, priority.value)
+        logger.info(f"Повторно запущено {len(rows)} упавших задач (всего {total})")
+
+        yield (
+            json.dumps({"replayed": len(rows), "total": total, "cursor": cursor}) + "\n"
+        ).encode()
+
+        await asyncio.sleep(max(0.0, len(rows) / request.rate - (loop.time() - started)))
+
+    yield (json.dumps({"done": True, "total": total, "cursor": cursor}) + "\n").encode()
@@ -0,0 +1,58 @@
+import logging
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.repositories import (
+    create_schedule,
+    delete_schedule,
+    get_schedule,
+    list_schedules,
+)
+from async_task_manager.schemas import TaskScheduleCreate, TaskScheduleRead
+from async_task_manager.workers.cron_scheduler import cron_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+async def create_schedule_service(
+    session: AsyncSession, data: TaskScheduleCreate
+) -> TaskScheduleRead:
+    """Создание периодического расписания"""
+    try:
+        schedule = await create_schedule(session, data, datetime.now(UTC))
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Расписание с таким именем уже существует",
+        ) from None
+
+    cron_scheduler.notify()
+    logger.info(f"Расписание {schedule.name} создано, первое срабатывание {schedule.next_fire_at}")
+    return TaskScheduleRead.model_validate(schedule)
+
+
+async def list_schedules_service(session: AsyncSession) -> Sequence[TaskScheduleRead]:
+    """Получение списка расписаний"""
+    return [TaskScheduleRead.model_validate(s) for s in await list_schedules(session)]
+
+
+async def get_schedule_service(session: AsyncSession, schedule_id: uuid.UUID) -> TaskScheduleRead:
+    """Получение расписания по id"""
+    schedule = await get_schedule(session, schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Расписание не найдено")
+    return TaskScheduleRead.model_validate(schedule)
+
+
+async def delete_schedule_service(session: AsyncSession, schedule_id: uuid.UUID) -> None:
+    """Удаление расписания по id"""
+    if not await delete_schedule(session, schedule_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Расписание не найдено")
+    cron_scheduler.notify()
+    logger.info(f"Расписание {schedule_id} удалено")
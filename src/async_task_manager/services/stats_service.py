@@ -0,0 +1,66 @@
+from collections import defaultdict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.sketch import LogBucketSketch
+from async_task_manager.core.stats import LATENCY_METRICS, QUEUE_WAIT, RUN_TIME
+from async_task_manager.models import TaskPriority, TaskStatus
+from async_task_manager.repositories import get_latency_buckets, get_task_counters
+from async_task_manager.schemas import LatencyPercentiles, PriorityStats, TaskStats
+
+
+def _percentiles(sketch: LogBucketSketch) -> LatencyPercentiles:
+    return LatencyPercentiles(
+        count=sketch.count,
+        p50=sketch.quantile(0.5),
+        p90=sketch.quantile(0.9),
+        p99=sketch.quantile(0.99),
+    )
+
+
+async def get_task_stats_service(session: AsyncSession) -> TaskStats:
+    """
+    Статистика задач из таблиц счётчиков.
+
+    Читается не больше (приоритеты x статусы) счётчиков и ограниченное число
+    бакетов скетчей, поэтому время ответа не зависит от размера таблицы tasks.
+    Данные отстают не больше чем на STATS_FLUSH_INTERVAL.
+    """
+    counters = await get_task_counters(session)
+    buckets = await get_latency_buckets(session)
+
+    by_priority: dict[str, dict[str, int]] = defaultdict(dict)
+    for priority, task_status, count in counters:
+        # Изменения из разных процессов записываются независимо,
+        # поэтому счётчик может ненадолго уйти ниже нуля
+        if count > 0:
+            by_priority[priority.value][task_status.value] = count
+
+    sketches = {
+        (metric, priority.value): LogBucketSketch(settings.STATS_SKETCH_ACCURACY)
+        for metric in LATENCY_METRICS
+        for priority in TaskPriority
+    }
+    for metric, priority, bucket, count in buckets:
+        sketch = sketches.get((metric, priority.value))
+        if sketch is not None:
+            sketch.merge_buckets([(bucket, count)])
+
+    by_status = {
+        task_status.value: total
+        for task_status in TaskStatus
+        if (total := sum(counts.get(task_status.value, 0) for counts in by_priority.values()))
+    }
+    return TaskStats(
+        total=sum(by_status.values()),
+        by_status=by_status,
+        by_priority={
+            priority.value: PriorityStats(
+                by_status=by_priority.get(priority.value, {}),
+                queue_wait=_percentiles(sketches[(QUEUE_WAIT, priority.value)]),
+                run_time=_percentiles(sketches[(RUN_TIME, priority.value)]),
+            )
+            for priority in TaskPriority
+        },
+    )
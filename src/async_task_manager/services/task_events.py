@@ -0,0 +1,188 @@
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from contextlib import ExitStack
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from async_task_manager.core.broker import task_broker
+from async_task_manager.core.cache import task_status_cache
+from async_task_manager.core.config import settings
+from async_task_manager.core.events import TaskEventHub, TaskStatusEvent
+from async_task_manager.repositories import TERMINAL_STATUSES, get_task_status, get_task_statuses
+from async_task_manager.schemas import TaskStatusRead
+
+from .task_subscriptions import task_subscription_hub
+
+logger = logging.getLogger(__name__)
+
+task_event_hub = TaskEventHub()
+
+_TERMINAL_STATUS_VALUES = frozenset(s.value for s in TERMINAL_STATUSES)
+
+
+async def handle_task_event(event: TaskStatusEvent) -> None:
+    """
+    Обработать событие смены статуса в процессе API: сбросить кэш статуса
+    и разбудить запросы и WebSocket-подписчиков, ожидающих эту задачу.
+    """
+    task_status_cache.invalidate(event.task_id)
+    task_event_hub.publish(event)
+    task_subscription_hub.publish(event)
+
+
+async def publish_task_event(task_id: uuid.UUID, status: str, priority: str | None) -> None:
+    """
+    Сообщить о смене статуса задачи, изменённой в процессе API.
+
+    Событие сразу обрабатывается локально и, если брокер подключен,
+    рассылается остальным экземплярам API. Ошибка публикации не прерывает
+    запрос: в худшем случае устаревший статус живёт в их кэше до истечения TTL.
+    """
+    event = TaskStatusEvent(task_id=task_id, status=status, priority=priority)
+    await handle_task_event(event)
+
+    broker = task_broker()
+    if not broker.connected:
+        return
+    try:
+        await broker.publish_status_event(event)
+    except Exception as e:
+        logger.error(f"Ошибка публикации события статуса задачи {task_id}: {e}")
+
+
+async def broadcast_task_cancellation(task_id: uuid.UUID) -> None:
+    """
+    Разослать воркерам отмену задачи (tasks.cancel).
+
+    Выполняемая задача прерывается сразу, а сообщение ещё не начатой
+    задачи отбрасывается при получении. Ошибка публикации только логируется:
+    статус CANCELLED уже записан, и воркер не перезапишет его результатом.
+    """
+    broker = task_broker()
+    if not broker.connected:
+        return
+    try:
+        await broker.publish_cancellation(task_id)
+    except Exception as e:
+        logger.error(f"Ошибка рассылки отмены задачи {task_id}: {e}")
+
+
+async def subscribe_task_events() -> None:
+    """Подписать процесс API на события смены статусов из tasks.events."""
+    await task_broker().consume_status_events(handle_task_event)
+
+
+async def wait_for_task_service(
+    session: AsyncSession, task_id: uuid.UUID, timeout: float
+) -> TaskStatusRead:
+    """
+    Дождаться итогового статуса задачи (long-poll), но не дольше timeout секунд.
+
+    Подписка оформляется до чтения статуса из БД, поэтому переход между
+    чтением и ожиданием не теряется. На время ожидания соединение с БД
+    возвращается в пул. По истечении timeout статус перечитывается из БД —
+    на случай, если событие не было доставлено.
+    """
+    with task_event_hub.subscribe([task_id]) as events:
+        current = await get_task_status(session, task_id)
+        await session.close()
+        if current is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
+
+        status_value = current.value
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while status_value not in _TERMINAL_STATUS_VALUES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(events.get(), remaining)
+            except TimeoutError:
+                break
+            status_value = event.status
+
+    if status_value not in _TERMINAL_STATUS_VALUES:
+        current = await get_task_status(session, task_id)
+        await session.close()
+        if current is not None:
+            status_value = current.value
+
+    return TaskStatusRead(id=task_id, status=status_value)
+
+
+def _format_sse(task_id: uuid.UUID, status_value: str) -> bytes:
+    """Событие SSE со статусом задачи."""
+    data = json.dumps({"id": str(task_id), "status": status_value})
+    return f"event: status\ndata: {data}\n\n".encode()
+
+
+async def stream_task_events_service(
+    session: AsyncSession, task_ids: Sequence[uuid.UUID]
+) -> AsyncIterator[bytes]:
+    """
+    Подготовить поток SSE со статусами набора задач.
+
+    Сначала отдаются текущие статусы из БД, затем каждый переход статуса;
+    поток завершается, когда все задачи дошли до итогового статуса.
+    Проверка задач выполняется до начала ответа, чтобы вернуть 404/400
+    обычным ответом, а не внутри потока.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    if not task_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Не указаны задачи")
+    if len(task_ids) > settings.TASK_EVENTS_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Не более {settings.TASK_EVENTS_MAX_IDS} задач в одном потоке",
+        )
+
+    subscription = ExitStack()
+    events = subscription.enter_context(task_event_hub.subscribe(task_ids))
+    try:
+        statuses = await get_task_statuses(session, task_ids)
+        await session.close()
+        if len(statuses) != len(task_ids):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
+    except BaseException:
+        subscription.close()
+        raise
+
+    return _iter_task_events(
+        subscription, events, {task_id: statuses[task_id].value for task_id in task_ids}
+    )
+
+
+async def _iter_task_events(
+    subscription: ExitStack,
+    events: asyncio.Queue[TaskStatusEvent],
+    statuses: dict[uuid.UUID, str],
+) -> AsyncIterator[bytes]:
+    """Выдача событий SSE до итогового статуса всех задач (с heartbeat-комментариями)."""
+    with subscription:
+        for task_id, status_value in statuses.items():
+            yield _format_sse(task_id, status_value)
+
+        pending = {
+            task_id
+            for task_id, status_value in statuses.items()
+            if status_value not in _TERMINAL_STATUS_VALUES
+        }
+        while pending:
+            try:
+                event = await asyncio.wait_for(events.get(), settings.TASK_EVENTS_HEARTBEAT)
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+
+            # Событие, уже отражённое в прочитанном из БД статусе, не повторяем
+            if event.task_id not in pending or event.status == statuses[event.task_id]:
+                continue
+            statuses[event.task_id] = event.status
+            if event.status in _TERMINAL_STATUS_VALUES:
+                pending.discard(event.task_id)
+            yield _format_sse(event.task_id, event.status)
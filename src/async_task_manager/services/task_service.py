@@ -1,53 +1,75 @@
-import asyncio
+import base64
+import json
 import logging
-import os
-import sys
 import uuid
-from collections.abc import Sequence
-from datetime import UTC, datetime
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from async_task_manager.core.rabbitmq import get_rabbitmq_manager
-from async_task_manager.models import Task, TaskPriority, TaskStatus  # noqa: E402
-from async_task_manager.repositories import cancel_task, create_task, filter_tasks, get_task
-from async_task_manager.schemas import TaskCreate, TaskFilter, TaskRead, TaskStatusRead
+from async_task_manager.core.cache import task_status_cache
+from async_task_manager.core.config import settings
+from async_task_manager.core.metrics import TASKS_FINISHED_TOTAL
+from async_task_manager.core.results import ResultNotFoundError, result_backend
+from async_task_manager.core.stats import task_stats
+from async_task_manager.models import TaskStatus  # noqa: E402
+from async_task_manager.repositories import (
+    cancel_task,
+    create_task,
+    create_tasks_bulk,
+    filter_tasks,
+    get_task,
+    get_task_result,
+    get_task_status,
+)
+from async_task_manager.schemas import (
+    TaskBatchCreate,
+    TaskCreate,
+    TaskFilter,
+    TaskRead,
+    TaskStatusRead,
+)
+from async_task_manager.workers.outbox_relay import outbox_relay
+from async_task_manager.workers.scheduler import task_scheduler
+
+from .task_events import broadcast_task_cancellation, publish_task_event
 
 logger = logging.getLogger(__name__)
 
-_background_tasks: set[asyncio.Task] = set()
-
-
-def is_test_env() -> bool:
-    return "PYTEST_CURRENT_TEST" in os.environ or any("pytest" in arg for arg in sys.argv)
-
 
 async def create_task_service(session: AsyncSession, data: TaskCreate) -> TaskRead:
-    """Создание новой задачи и отправка в RabbitMQ"""
+    """Создание новой задачи; публикация в брокер выполняется через outbox"""
     task = await create_task(session, data)
+    task_stats.transition(task.priority.value, None, task.status.value)
 
-    try:
-        task.status = TaskStatus.PENDING
-        await session.commit()
-        await session.refresh(task)
-
-        if is_test_env():
-            bg_task = asyncio.create_task(_background_process_task_in_test(task.id, task.priority))
-            _background_tasks.add(bg_task)
-            bg_task.add_done_callback(_background_tasks.discard)
-        else:
-            rabbitmq = await get_rabbitmq_manager()
-            await rabbitmq.publish_task(task.id, data.priority)
-            logger.info(f"Задача {task.id} создана и отправлена в очередь")
-
-    except Exception as e:
-        logger.error(f"Ошибка обработки задачи {task.id}: {e}")
+    if task.status == TaskStatus.SCHEDULED:
+        task_scheduler.notify()
+        logger.info(f"Задача {task.id} запланирована на {task.run_at}")
+    else:
+        outbox_relay.notify()
+        logger.info(f"Задача {task.id} создана и поставлена в outbox")
 
     return TaskRead.model_validate(task)
 
 
+async def create_tasks_batch_service(
+    session: AsyncSession, data: TaskBatchCreate
+) -> list[uuid.UUID]:
+    """Пакетное создание задач; публикация в брокер выполняется через outbox"""
+    created = await create_tasks_bulk(session, data.tasks)
+    for (priority, task_status), count in Counter((p, s) for _, p, s in created).items():
+        task_stats.transition(priority.value, None, task_status.value, count)
+    if any(item.run_at is not None for item in data.tasks):
+        task_scheduler.notify()
+
+    outbox_relay.notify()
+    logger.info(f"Пакет из {len(created)} задач создан и поставлен в outbox")
+
+    return [task_id for task_id, _, _ in created]
+
+
 async def get_task_service(session: AsyncSession, task_id: uuid.UUID) -> TaskRead:
     """Получение задачи по id"""
     task = await get_task(session, task_id)
@@ -56,66 +78,113 @@ async def get_task_service(session: AsyncSession, task_id: uuid.UUID) -> TaskRea
     return TaskRead.model_validate(task)
 
 
+def encode_position_cursor(at: datetime, task_id: uuid.UUID, field: str = "created_at") -> str:
+    """Курсор позиции в списке: непрозрачная строка из (время, id)."""
+    raw = json.dumps({field: at.isoformat(), "id": str(task_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_position_cursor(cursor: str, field: str = "created_at") -> tuple[datetime, uuid.UUID]:
+    """Разобрать курсор позиции в списке."""
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(raw[field]), uuid.UUID(raw["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Некорректный курсор"
+        ) from None
+
+
+def encode_task_cursor(task: TaskRead) -> str:
+    """Курсор позиции задачи в списке: непрозрачная строка из (created_at, id)."""
+    return encode_position_cursor(task.created_at, task.id)
+
+
+def decode_task_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Разобрать курсор списка задач."""
+    return decode_position_cursor(cursor)
+
+
 async def filter_tasks_service(session: AsyncSession, filters: TaskFilter) -> Sequence[TaskRead]:
-    """Получение списка задач"""
-    tasks = await filter_tasks(session, filters)
+    """Получение списка задач (по курсору, если он задан)"""
+    after = decode_task_cursor(filters.cursor) if filters.cursor else None
+    tasks = await filter_tasks(session, filters, after=after)
     return [TaskRead.model_validate(t) for t in tasks]
 
 
 async def get_task_status_service(session: AsyncSession, task_id: uuid.UUID) -> TaskStatusRead:
-    """Получение статуса задачи по id"""
-    task = await get_task(session, task_id)
-    if not task:
+    """Получение статуса задачи по id (через кэш статусов)"""
+    if settings.STATUS_CACHE_ENABLED:
+        cached = task_status_cache.get(task_id)
+        if cached is not None:
+            return TaskStatusRead(id=task_id, status=cached)
+
+    stamp = task_status_cache.stamp()
+    task_status = await get_task_status(session, task_id)
+    if task_status is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
-    return TaskStatusRead(id=task.id, status=task.status.value)
 
+    if settings.STATUS_CACHE_ENABLED:
+        task_status_cache.set(task_id, task_status.value, stamp=stamp)
+    return TaskStatusRead(id=task_id, status=task_status.value)
 
-async def cancel_task_service(session: AsyncSession, task_id: uuid.UUID) -> TaskRead:
-    """
-    Отмена задачи по id с бизнес-валидацией статуса.
-    """
-    current = await get_task(session, task_id)
-    if not current:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
 
-    cancellable_statuses = {
-        TaskStatus.NEW,
-        TaskStatus.PENDING,
-        TaskStatus.IN_PROGRESS,
-    }
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
 
-    if current.status not in cancellable_statuses:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Задачу нельзя отменить из текущего статуса",
-        )
 
-    updated = await cancel_task(session, task_id)
-    return TaskRead.model_validate(updated)
+async def get_task_result_service(
+    session: AsyncSession, task_id: uuid.UUID
+) -> tuple[AsyncIterator[bytes], int]:
+    """
+    Результат завершённой задачи: поток частей и размер в байтах.
 
+    Небольшой результат хранится в строке задачи, большой читается
+    частями из хранилища результатов по ссылке result_ref.
+    """
+    row = await get_task_result(session, task_id)
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
 
-async def _background_process_task_in_test(task_id: uuid.UUID, priority: TaskPriority):
-    """Фоновая обработка задачи для тестового окружения."""
+    task_status, result, result_ref = row
+    if task_status != TaskStatus.COMPLETED:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Задача не завершена")
 
-    priority_delay = {
-        TaskPriority.HIGH: 0.2,
-        TaskPriority.MEDIUM: 0.4,
-        TaskPriority.LOW: 0.6,
-    }
+    if result_ref is not None:
+        try:
+            size = await result_backend.size(result_ref)
+        except ResultNotFoundError:
+            logger.error(f"Результат задачи {task_id} отсутствует в хранилище: {result_ref}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Результат не найден"
+            ) from None
+        return result_backend.open(result_ref), size
 
-    await asyncio.sleep(priority_delay.get(priority, 0.4))
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Результат не найден")
+    data = result.encode()
+    return _single_chunk(data), len(data)
 
-    from tests.conftest import TestSessionLocal as _SessionLocal  # noqa: E402
 
-    async with _SessionLocal() as local_session:
-        result = await local_session.execute(select(Task).where(Task.id == task_id))
-        task: Task | None = result.scalar_one_or_none()
-        if not task or task.status == TaskStatus.CANCELLED:
-            return
+async def cancel_task_service(session: AsyncSession, task_id: uuid.UUID) -> TaskRead:
+    """
+    Отмена задачи по id с бизнес-валидацией статуса.
+    """
+    row = await cancel_task(session, task_id)
+    if row:
+        cancelled, previous_status = row
+        task_stats.transition(
+            cancelled.priority.value, previous_status.value, cancelled.status.value
+        )
+        TASKS_FINISHED_TOTAL.labels(cancelled.priority.value, cancelled.status.value).inc()
+        await broadcast_task_cancellation(cancelled.id)
+        await publish_task_event(cancelled.id, cancelled.status.value, cancelled.priority.value)
+        return TaskRead.model_validate(cancelled)
 
-        task.status = TaskStatus.COMPLETED
-        task.started_at = datetime.now(UTC)
-        task.finished_at = datetime.now(UTC)
-        task.result = f"Задача '{task.title}' выполнена успешно. Приоритет: {str(task.priority)}"
+    if not await get_task(session, task_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
 
-        await local_session.commit()
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Задачу нельзя отменить из текущего статуса",
+    )
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import Iterable
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.events import TaskStatusEvent
+from async_task_manager.schemas import TaskSubscriptionFilter, TaskSubscriptionMessage
+
+logger = logging.getLogger(__name__)
+
+# Ключ фильтра: (priority, status); None означает «любой»
+FilterKey = tuple[str | None, str | None]
+
+
+class SubscriberLimitError(RuntimeError):
+    """Достигнут лимит WebSocket-подписчиков процесса API."""
+
+
+class StatusSubscriber:
+    """
+    Подписчик на переходы статусов: одно WebSocket-соединение.
+
+    События складываются в ограниченную очередь уже сериализованными;
+    None в очереди означает, что подписчик отключён за медленное чтение.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=queue_size)
+        self.task_ids: set[uuid.UUID] = set()
+        self.filters: set[FilterKey] = set()
+        self.dropped = False
+
+    def offer(self, payload: str) -> bool:
+        """Положить событие в очередь; False, если очередь переполнена."""
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+
+class TaskSubscriptionHub:
+    """
+    Раздача переходов статусов WebSocket-подписчикам процесса API.
+
+    Источник событий один на процесс — подписка на tasks.events. Подписчики
+    проиндексированы по id задачи и по ключу фильтра, поэтому событие
+    обходит только тех, кому оно адресовано, а сериализуется один раз.
+    Подписчик, не успевающий вычитывать свою очередь, отключается,
+    чтобы не замедлять и не раздувать память остальных.
+    """
+
+    def __init__(
+        self,
+        max_subscribers: int | None = None,
+        queue_size: int | None = None,
+        max_task_ids: int | None = None,
+    ):
+        self.max_subscribers = max_subscribers or settings.WS_MAX_SUBSCRIBERS
+        self.queue_size = queue_size or settings.WS_SUBSCRIBER_QUEUE_SIZE
+        self.max_task_ids = max_task_ids or settings.WS_MAX_TASK_IDS
+        self._subscribers: set[StatusSubscriber] = set()
+        self._by_task: dict[uuid.UUID, set[StatusSubscriber]] = {}
+        self._by_filter: dict[FilterKey, set[StatusSubscriber]] = {}
+        self.dropped_total = 0
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def connect(self) -> StatusSubscriber:
+        """Зарегистрировать нового подписчика."""
+        if len(self._subscribers) >= self.max_subscribers:
+            raise SubscriberLimitError(f"Достигнут лимит подписчиков: {self.max_subscribers}")
+        subscriber = StatusSubscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def disconnect(self, subscriber: StatusSubscriber) -> None:
+        """Удалить подписчика и все его подписки."""
+        self._subscribers.discard(subscriber)
+        self._remove(subscriber, subscriber.task_ids, subscriber.filters)
+        subscriber.task_ids.clear()
+        subscriber.filters.clear()
+
+    def apply(self, subscriber: StatusSubscriber, message: TaskSubscriptionMessage) -> None:
+        """
+        Применить сообщение клиента (subscribe/unsubscribe).
+
+        Raises:
+            ValueError: превышен лимит задач на одно соединение
+        """
+        filters = {_filter_key(message.filter)} if message.filter else set()
+        task_ids = set(message.task_ids)
+
+        if message.action == "unsubscribe":
+            self._remove(subscriber, task_ids, filters)
+            subscriber.task_ids -= task_ids
+            subscriber.filters -= filters
+            return
+
+        if len(subscriber.task_ids | task_ids) > self.max_task_ids:
+            raise ValueError(f"Не более {self.max_task_ids} задач на одно соединение")
+        for task_id in task_ids - subscriber.task_ids:
+            self._by_task.setdefault(task_id, set()).add(subscriber)
+        for key in filters - subscriber.filters:
+            self._by_filter.setdefault(key, set()).add(subscriber)
+        subscriber.task_ids |= task_ids
+        subscriber.filters |= filters
+
+    def publish(self, event: TaskStatusEvent) -> None:
+        """Разослать событие подписчикам задачи и подходящих фильтров."""
+        targets: set[StatusSubscriber] = set()
+        if subscribers := self._by_task.get(event.task_id):
+            targets |= subscribers
+        for key in (
+            (event.priority, event.status),
+            (event.priority, None),
+            (None, event.status),
+        ):
+            if subscribers := self._by_filter.get(key):
+                targets |= subscribers
+        if not targets:
+            return
+
+        payload = json.dumps(
+            {
+                "type": "status",
+                "id": str(event.task_id),
+                "status": event.status,
+                "priority": event.priority,
+                "at": event.at,
+            }
+        )
+        for subscriber in targets:
+            if not subscriber.offer(payload):
+                self._drop(subscriber)
+
+    def _drop(self, subscriber: StatusSubscriber) -> None:
+        """Отключить медленного подписчика: очистить очередь и оставить в ней None."""
+        self.disconnect(subscriber)
+        subscriber.dropped = True
+        self.dropped_total += 1
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+        logger.warning("WebSocket-подписчик отключён: не успевает получать события")
+
+    def _remove(
+        self,
+        subscriber: StatusSubscriber,
+        task_ids: Iterable[uuid.UUID],
+        filters: Iterable[FilterKey],
+    ) -> None:
+        for index, keys in ((self._by_task, task_ids), (self._by_filter, filters)):
+            for key in keys:
+                subscribers = index.get(key)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del index[key]
+
+
+def _filter_key(subscription_filter: TaskSubscriptionFilter) -> FilterKey:
+    return subscription_filter.priority, subscription_filter.status
+
+
+task_subscription_hub = TaskSubscriptionHub()
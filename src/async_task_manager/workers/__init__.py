@@ -1,3 +1,35 @@
+from .cron_scheduler import CronScheduler, cron_scheduler
+from .handlers import (
+    DEFAULT_TASK_TYPE,
+    HandlerRegistry,
+    TaskContext,
+    UnknownTaskTypeError,
+    handler_registry,
+)
+from .metrics_server import MetricsServer
+from .outbox_relay import OutboxRelay, outbox_relay
+from .scheduler import TaskScheduler, task_scheduler
+from .stats_flusher import StatsFlusher, stats_flusher
+from .supervisor import WorkerSupervisor, run_supervisor
 from .task_worker import TaskWorker, run_worker
 
-__all__ = ["TaskWorker", "run_worker"]
+__all__ = [
+    "TaskWorker",
+    "run_worker",
+    "OutboxRelay",
+    "outbox_relay",
+    "TaskScheduler",
+    "task_scheduler",
+    "CronScheduler",
+    "cron_scheduler",
+    "StatsFlusher",
+    "MetricsServer",
+    "stats_flusher",
+    "WorkerSupervisor",
+    "run_supervisor",
+    "HandlerRegistry",
+    "TaskContext",
+    "UnknownTaskTypeError",
+    "handler_registry",
+    "DEFAULT_TASK_TYPE",
+]
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+
+from async_task_manager.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationRegistry:
+    """
+    Отмены задач, полученные воркером из tasks.cancel.
+
+    Хранит id отменённых задач ограниченное время (TTL), чтобы сообщения
+    о них отбрасывались при получении без обращения к БД, и выполняемые
+    задачи процесса, чтобы отмена прерывала их сразу.
+    """
+
+    def __init__(self, ttl: float | None = None, max_size: int | None = None):
+        self.ttl = ttl if ttl is not None else settings.WORKER_CANCELLED_IDS_TTL
+        self.max_size = max_size or settings.WORKER_CANCELLED_IDS_MAX_SIZE
+        self._cancelled: OrderedDict[uuid.UUID, float] = OrderedDict()
+        self._running: dict[uuid.UUID, asyncio.Task] = {}
+
+    def is_cancelled(self, task_id: uuid.UUID) -> bool:
+        """Отменена ли задача (в пределах TTL)."""
+        expires_at = self._cancelled.get(task_id)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del self._cancelled[task_id]
+            return False
+        return True
+
+    def cancel(self, task_id: uuid.UUID) -> bool:
+        """
+        Запомнить отмену и прервать задачу, если она сейчас выполняется.
+
+        Returns:
+            True, если была прервана выполняемая задача
+        """
+        self._cancelled[task_id] = time.monotonic() + self.ttl
+        self._cancelled.move_to_end(task_id)
+        while len(self._cancelled) > self.max_size:
+            self._cancelled.popitem(last=False)
+
+        running = self._running.get(task_id)
+        if running is None or running.done():
+            return False
+        running.cancel()
+        return True
+
+    def track(self, task_id: uuid.UUID, task: asyncio.Task) -> None:
+        """Зарегистрировать выполняемую задачу процесса."""
+        self._running[task_id] = task
+
+    def untrack(self, task_id: uuid.UUID) -> None:
+        """Снять задачу с учёта после завершения обработки."""
+        self._running.pop(task_id, None)
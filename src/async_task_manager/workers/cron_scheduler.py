@@ -0,0 +1,226 @@
+import asyncio
+import contextlib
+import heapq
+import logging
+import time
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.cron import CronError, CronExpression
+from async_task_manager.core.db import async_session_maker
+from async_task_manager.core.stats import task_stats
+from async_task_manager.models import TaskStatus
+from async_task_manager.repositories import fire_schedule, list_enabled_schedules
+
+from .outbox_relay import outbox_relay
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # SQLite возвращает время без часового пояса
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+class CronScheduler:
+    """
+    Планировщик периодических расписаний (task_schedules).
+
+    Срабатывает только лидер — процесс, удерживающий advisory lock PostgreSQL
+    на отдельном соединении; остальные экземпляры периодически пытаются
+    его захватить и подхватывают работу, если лидер пропал (блокировка
+    снимается вместе с его соединением).
+
+    Лидер держит ближайшие срабатывания в куче (next_fire_at, id) и разобранные
+    cron-выражения в кэше, поэтому на каждом шаге смотрит только вершину кучи.
+    Задачи создаются вместе со сдвигом next_fire_at в одной транзакции
+    (fire_schedule), публикацию в RabbitMQ выполняет ретранслятор outbox.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        reload_interval: float | None = None,
+        leader_retry_interval: float | None = None,
+        lock_key: int | None = None,
+    ):
+        self.session_maker = session_maker
+        self.reload_interval = reload_interval or settings.CRON_RELOAD_INTERVAL
+        self.leader_retry_interval = leader_retry_interval or settings.CRON_LEADER_RETRY_INTERVAL
+        self.lock_key = lock_key if lock_key is not None else settings.CRON_LEADER_LOCK_KEY
+        self.running = False
+        self.is_leader = False
+        self._leader_connection: AsyncConnection | None = None
+        self._heap: list[tuple[datetime, uuid.UUID]] = []
+        self._schedules: dict[uuid.UUID, CronExpression] = {}
+        self._expressions: dict[str, CronExpression] = {}
+        self._reload_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        """Расписания изменились: перечитать их, не дожидаясь CRON_RELOAD_INTERVAL."""
+        self._reload_at = 0.0
+        self._wakeup.set()
+
+    async def acquire_leadership(self) -> bool:
+        """
+        Стать лидером или подтвердить, что лидерство не потеряно.
+
+        Лидерство проверяется запросом по соединению с блокировкой: если оно
+        оборвалось, блокировка уже снята сервером и её мог захватить другой
+        экземпляр. Вне PostgreSQL (тесты на SQLite) процесс всегда лидер.
+        """
+        engine = self.session_maker.kw["bind"]
+        if engine.dialect.name != "postgresql":
+            self.is_leader = True
+            return True
+
+        if self._leader_connection is not None:
+            try:
+                await self._leader_connection.execute(select(1))
+                return True
+            except Exception as e:
+                logger.warning(f"Соединение лидера cron-планировщика потеряно: {e}")
+                await self._drop_leadership()
+
+        connection = await engine.connect()
+        try:
+            acquired = await connection.scalar(select(func.pg_try_advisory_lock(self.lock_key)))
+            # Блокировка сессионная: транзакция запроса не должна её удерживать
+            await connection.commit()
+        except Exception:
+            await connection.close()
+            raise
+        if not acquired:
+            await connection.close()
+            return False
+
+        self._leader_connection = connection
+        self.is_leader = True
+        self._reload_at = 0.0
+        logger.info("Cron-планировщик стал лидером")
+        return True
+
+    async def _drop_leadership(self) -> None:
+        connection, self._leader_connection = self._leader_connection, None
+        self.is_leader = False
+        self._heap.clear()
+        self._schedules.clear()
+        if connection is not None:
+            with contextlib.suppress(Exception):
+                await connection.close()
+
+    def _parse(self, cron: str) -> CronExpression:
+        expression = self._expressions.get(cron)
+        if expression is None:
+            expression = self._expressions[cron] = CronExpression.parse(cron)
+        return expression
+
+    async def reload(self) -> None:
+        """Перечитать активные расписания и перестроить кучу срабатываний."""
+        async with self.session_maker() as session:
+            rows = await list_enabled_schedules(session)
+
+        schedules: dict[uuid.UUID, CronExpression] = {}
+        heap: list[tuple[datetime, uuid.UUID]] = []
+        for schedule_id, cron, next_fire_at in rows:
+            try:
+                schedules[schedule_id] = self._parse(cron)
+            except CronError as e:
+                logger.error(f"Расписание {schedule_id} пропущено: {e}")
+                continue
+            heap.append((_as_utc(next_fire_at), schedule_id))
+        heapq.heapify(heap)
+
+        self._schedules = schedules
+        self._heap = heap
+        self._reload_at = time.monotonic() + self.reload_interval
+
+    async def fire_due(self, now: datetime | None = None) -> int:
+        """
+        Выполнить наступившие срабатывания.
+
+        Пропущенные срабатывания (планировщик был остановлен) не навёрстываются:
+        расписание срабатывает один раз и переходит к ближайшему будущему времени.
+
+        Returns:
+            Количество созданных задач
+        """
+        now = now or datetime.now(UTC)
+        fired = 0
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, schedule_id = heapq.heappop(self._heap)
+            expression = self._schedules.get(schedule_id)
+            if expression is None:
+                continue
+
+            next_fire_at = expression.next_after(max(now, fire_at))
+            async with self.session_maker() as session:
+                created = await fire_schedule(session, schedule_id, fire_at, next_fire_at)
+            if created is None:
+                # Расписание изменили или удалили — состояние кучи устарело
+                self._reload_at = 0.0
+                continue
+
+            heapq.heappush(self._heap, (next_fire_at, schedule_id))
+            task_stats.transition(created[1].value, None, TaskStatus.PENDING.value)
+            fired += 1
+            logger.info(f"Расписание {schedule_id} создало задачу {created[0]}")
+
+        if fired:
+            outbox_relay.notify()
+        return fired
+
+    def seconds_until_next(self) -> float:
+        """Сколько ждать до ближайшего срабатывания или перечитывания расписаний."""
+        timeout = max(0.0, self._reload_at - time.monotonic())
+        if self._heap:
+            delay = (self._heap[0][0] - datetime.now(UTC)).total_seconds()
+            timeout = min(timeout, max(0.0, delay))
+        return timeout
+
+    async def run(self) -> None:
+        """Основной цикл: удерживать лидерство, срабатывать по куче, ждать вершину кучи."""
+        self.running = True
+        logger.info("CronScheduler запущен")
+
+        while self.running:
+            try:
+                if not await self.acquire_leadership():
+                    timeout = self.leader_retry_interval
+                else:
+                    if time.monotonic() >= self._reload_at:
+                        await self.reload()
+                    await self.fire_due()
+                    timeout = self.seconds_until_next()
+            except Exception as e:
+                logger.error(f"Ошибка cron-планировщика: {e}")
+                timeout = self.leader_retry_interval
+
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    def start(self) -> None:
+        """Запустить планировщик фоновой задачей в текущем event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Остановить планировщик и отпустить лидерство."""
+        self.running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._drop_leadership()
+        logger.info("CronScheduler остановлен")
+
+
+cron_scheduler = CronScheduler()
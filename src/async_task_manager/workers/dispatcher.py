@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from aio_pika.abc import AbstractIncomingMessage
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[AbstractIncomingMessage, str], Awaitable[None]]
+
+
+class PriorityDispatcher:
+    """
+    Локальная стадия диспетчеризации сообщений всех приоритетов.
+
+    Consumer'ы очередей только складывают сообщения в локальные очереди
+    приоритетов, а диспетчер выбирает, какое сообщение запустить в свободный
+    слот: плавным взвешенным циклическим обходом (smooth weighted round-robin)
+    по непустым очередям с весами, например 6:3:1. Если голова какой-либо
+    очереди ждёт дольше starvation_timeout, она запускается вне очереди.
+
+    Число одновременно выполняемых задач ограничено общим лимитом concurrency
+    и лимитами max_in_flight по приоритетам. Размер локальных очередей
+    ограничен prefetch_count каналов, поэтому рост очереди LOW в брокере
+    не влияет на задержку HIGH.
+    """
+
+    def __init__(
+        self,
+        handler: MessageHandler,
+        weights: dict[str, int],
+        concurrency: int,
+        max_in_flight: dict[str, int] | None = None,
+        starvation_timeout: float | None = None,
+    ):
+        self.handler = handler
+        self.weights = {priority: weight for priority, weight in weights.items() if weight > 0}
+        self.concurrency = concurrency
+        self.max_in_flight = max_in_flight or {}
+        self.starvation_timeout = starvation_timeout
+
+        self._queues: dict[str, deque[tuple[float, AbstractIncomingMessage]]] = {
+            priority: deque() for priority in self.weights
+        }
+        self._current_weights = dict.fromkeys(self.weights, 0)
+        self._in_flight = dict.fromkeys(self.weights, 0)
+        self._total_in_flight = 0
+        self._running_tasks: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self.running = False
+
+    def submit(self, priority: str, message: AbstractIncomingMessage) -> None:
+        """Поставить доставленное сообщение в локальную очередь приоритета."""
+        self._queues[priority].append((time.monotonic(), message))
+        self._wakeup.set()
+
+    def _select_priority(self) -> str | None:
+        """Выбрать приоритет, сообщение которого будет запущено следующим."""
+        eligible = [
+            priority
+            for priority, queue in self._queues.items()
+            if queue
+            and self._in_flight[priority] < self.max_in_flight.get(priority, self.concurrency)
+        ]
+        if not eligible:
+            return None
+
+        if self.starvation_timeout is not None:
+            now = time.monotonic()
+            oldest = min(eligible, key=lambda p: self._queues[p][0][0])
+            if now - self._queues[oldest][0][0] >= self.starvation_timeout:
+                return oldest
+
+        total = 0
+        selected = eligible[0]
+        for priority in eligible:
+            self._current_weights[priority] += self.weights[priority]
+            total += self.weights[priority]
+            if self._current_weights[priority] > self._current_weights[selected]:
+                selected = priority
+        self._current_weights[selected] -= total
+        return selected
+
+    async def run(self) -> None:
+        """Цикл диспетчеризации: запускать сообщения по мере освобождения слотов."""
+        self.running = True
+        while self.running:
+            priority = None
+            if self._total_in_flight < self.concurrency:
+                priority = self._select_priority()
+
+            if priority is None:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            _, message = self._queues[priority].popleft()
+            self._in_flight[priority] += 1
+            self._total_in_flight += 1
+
+            task = asyncio.create_task(self._handle(message, priority))
+            self._running_tasks.add(task)
+            task.add_done_callback(self._running_tasks.discard)
+
+    async def _handle(self, message: AbstractIncomingMessage, priority: str) -> None:
+        """Обработать сообщение и освободить слот."""
+        try:
+            await self.handler(message, priority)
+        except Exception as e:
+            logger.error(f"Ошибка обработки сообщения из очереди {priority}: {e}")
+        finally:
+            self._in_flight[priority] -= 1
+            self._total_in_flight -= 1
+            self._wakeup.set()
+
+    def stop(self) -> None:
+        """Остановить цикл диспетчеризации (запущенные задачи продолжают работу)."""
+        self.running = False
+        self._wakeup.set()
@@ -0,0 +1,173 @@
+import asyncio
+import importlib
+import inspect
+import logging
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TASK_TYPE = "default"
+
+Executor = Literal["thread", "process"]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskContext:
+    """
+    Данные задачи, передаваемые обработчику.
+
+    Не связан с сессией БД и может быть передан в пул процессов.
+    """
+
+    id: uuid.UUID
+    type: str
+    title: str
+    description: str
+    priority: str
+
+
+@dataclass(frozen=True, slots=True)
+class HandlerSpec:
+    """Зарегистрированный обработчик типа задач."""
+
+    task_type: str
+    func: Callable[[TaskContext], Any]
+    is_async: bool
+    executor: Executor
+    timeout: float | None
+
+
+class UnknownTaskTypeError(LookupError):
+    """Для типа задачи не зарегистрирован обработчик."""
+
+
+class HandlerRegistry:
+    """
+    Реестр обработчиков задач по полю type.
+
+    Асинхронные обработчики выполняются в event loop воркера, синхронные —
+    в пуле потоков (executor="thread") или процессов (executor="process").
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, HandlerSpec] = {}
+
+    def register(
+        self,
+        task_type: str,
+        *,
+        timeout: float | None = None,
+        executor: Executor = "thread",
+    ) -> Callable[[Callable], Callable]:
+        """
+        Декоратор регистрации обработчика.
+
+        Args:
+            task_type: Тип задачи (значение поля type)
+            timeout: Ограничение времени выполнения, секунд
+            executor: Пул для синхронного обработчика: thread или process
+        """
+
+        def decorator(func: Callable) -> Callable:
+            self.add(task_type, func, timeout=timeout, executor=executor)
+            return func
+
+        return decorator
+
+    def add(
+        self,
+        task_type: str,
+        func: Callable[[TaskContext], Any],
+        *,
+        timeout: float | None = None,
+        executor: Executor = "thread",
+    ) -> HandlerSpec:
+        """Зарегистрировать обработчик (повторная регистрация заменяет прежний)."""
+        spec = HandlerSpec(
+            task_type=task_type,
+            func=func,
+            is_async=inspect.iscoroutinefunction(func),
+            executor=executor,
+            timeout=timeout,
+        )
+        self._handlers[task_type] = spec
+        return spec
+
+    def get(self, task_type: str) -> HandlerSpec:
+        """Получить обработчик типа задачи."""
+        try:
+            return self._handlers[task_type]
+        except KeyError:
+            raise UnknownTaskTypeError(f"Неизвестный тип задачи: {task_type}") from None
+
+    def __contains__(self, task_type: str) -> bool:
+        return task_type in self._handlers
+
+    def specs(self) -> list[HandlerSpec]:
+        """Все зарегистрированные обработчики."""
+        return list(self._handlers.values())
+
+
+def load_handler_modules(modules: Iterable[str]) -> None:
+    """Импортировать модули, регистрирующие обработчики при импорте."""
+    for module in modules:
+        importlib.import_module(module)
+        logger.info(f"Загружен модуль обработчиков {module}")
+
+
+HandlerInvoker = Callable[[TaskContext], Awaitable[Any]]
+
+
+def build_invoker(
+    spec: HandlerSpec,
+    run_in_thread: Callable[..., Awaitable[Any]],
+    run_in_process: Callable[..., Awaitable[Any]],
+    default_timeout: float | None = None,
+) -> HandlerInvoker:
+    """
+    Собрать вызов обработчика заранее, при старте воркера.
+
+    На каждую задачу остаётся один вызов готовой функции без разбора
+    параметров обработчика.
+    """
+    if spec.is_async:
+        call = spec.func
+    elif spec.executor == "process":
+        call = lambda context: run_in_process(spec.func, context)  # noqa: E731
+    else:
+        call = lambda context: run_in_thread(spec.func, context)  # noqa: E731
+
+    timeout = spec.timeout if spec.timeout is not None else default_timeout
+    if timeout is None:
+        return call
+
+    async def call_with_timeout(context: TaskContext) -> Any:
+        return await asyncio.wait_for(call(context), timeout)
+
+    return call_with_timeout
+
+
+handler_registry = HandlerRegistry()
+
+
+@handler_registry.register(DEFAULT_TASK_TYPE)
+async def simulate_task_execution(task: TaskContext) -> str:
+    """
+    Симуляция выполнения задачи.
+    В реальном приложении здесь была бы бизнес-логика.
+
+    Args:
+        task: Данные задачи
+
+    Returns:
+        Результат выполнения задачи
+    """
+    priority_delays = {"HIGH": 2, "MEDIUM": 5, "LOW": 10}
+
+    delay = priority_delays.get(task.priority, 5)
+    await asyncio.sleep(delay)
+
+    return f"Задача '{task.title}' выполнена успешно. Приоритет: {task.priority}"
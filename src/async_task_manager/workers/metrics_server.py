@@ -0,0 +1,71 @@
+import asyncio
+import contextlib
+import logging
+
+from async_task_manager.core.metrics import CONTENT_TYPE_LATEST, registry
+
+logger = logging.getLogger(__name__)
+
+# Запрос, который не уложился в это время (секунд), закрывается
+REQUEST_TIMEOUT = 5.0
+
+
+class MetricsServer:
+    """
+    HTTP-сервер метрик процесса воркера: GET /metrics в формате Prometheus.
+
+    Минимальный HTTP/1.0 на asyncio.start_server без зависимостей: у воркера
+    нет веб-фреймворка, а сервер обслуживает только редкие запросы сборщика.
+    """
+
+    def __init__(self, port: int, host: str = "0.0.0.0"):
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT)
+            # Заголовки запроса не нужны, но их нужно дочитать до пустой строки
+            while (line := await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT)) not in (
+                b"\r\n",
+                b"\n",
+                b"",
+            ):
+                del line
+
+            method, path, *_ = request_line.decode("latin-1").split() or ["", ""]
+            if method == "GET" and path.split("?", 1)[0] == "/metrics":
+                status, content_type, body = "200 OK", CONTENT_TYPE_LATEST, registry.render()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", "Not Found\n"
+
+            payload = body.encode()
+            writer.write(
+                (
+                    f"HTTP/1.0 {status}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+                + payload
+            )
+            await writer.drain()
+        except (TimeoutError, ValueError, ConnectionError) as e:
+            logger.debug(f"Запрос метрик прерван: {e}")
+        finally:
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def start(self) -> None:
+        """Начать принимать запросы."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"Метрики воркера доступны на http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Остановить сервер."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
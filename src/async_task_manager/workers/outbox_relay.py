@@ -0,0 +1,102 @@
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from async_task_manager.core.broker import TaskBroker, get_broker
+from async_task_manager.core.config import settings
+from async_task_manager.core.db import async_session_maker
+from async_task_manager.repositories import delete_outbox_messages, fetch_outbox_batch
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Ретранслятор outbox: публикует сообщения о задачах в брокер.
+
+    Разбирает таблицу task_outbox пакетами с FOR UPDATE SKIP LOCKED,
+    публикует пакет с подтверждениями брокера и удаляет отправленные
+    записи в той же транзакции. При ошибке публикации транзакция
+    откатывается, и сообщения будут отправлены повторно.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        broker: TaskBroker | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        self.session_maker = session_maker
+        self.broker = broker
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        self.poll_interval = poll_interval or settings.OUTBOX_POLL_INTERVAL
+        self.running = False
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        """Разбудить ретранслятор: в outbox появились новые сообщения."""
+        self._wakeup.set()
+
+    async def relay_once(self) -> int:
+        """
+        Опубликовать один пакет сообщений из outbox.
+
+        Returns:
+            Количество опубликованных сообщений
+        """
+        if self.broker is None:
+            self.broker = await get_broker()
+
+        async with self.session_maker() as session:
+            async with session.begin():
+                messages = await fetch_outbox_batch(session, self.batch_size)
+                if not messages:
+                    return 0
+
+                await self.broker.publish_tasks(
+                    (m.task_id, m.priority.value, m.traceparent) for m in messages
+                )
+                await delete_outbox_messages(session, [m.id for m in messages])
+
+        return len(messages)
+
+    async def run(self) -> None:
+        """Основной цикл: разбирать outbox, пока он не опустеет, затем ждать."""
+        self.running = True
+        logger.info("OutboxRelay запущен")
+
+        while self.running:
+            try:
+                published = await self.relay_once()
+            except Exception as e:
+                logger.error(f"Ошибка ретрансляции outbox: {e}")
+                published = 0
+
+            if published >= self.batch_size:
+                continue
+
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+
+    def start(self) -> None:
+        """Запустить ретранслятор фоновой задачей в текущем event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Остановить ретранслятор."""
+        self.running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info("OutboxRelay остановлен")
+
+
+outbox_relay = OutboxRelay()
@@ -0,0 +1,132 @@
+import asyncio
+import contextlib
+import logging
+from collections import Counter
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from async_task_manager.core.broker import TaskBroker, task_broker
+from async_task_manager.core.config import settings
+from async_task_manager.core.db import async_session_maker
+from async_task_manager.core.events import TaskStatusEvent
+from async_task_manager.core.stats import task_stats
+from async_task_manager.models import TaskStatus
+from async_task_manager.repositories import get_next_run_at, release_due_tasks
+
+from .outbox_relay import outbox_relay
+
+logger = logging.getLogger(__name__)
+
+
+class TaskScheduler:
+    """
+    Планировщик отложенных задач: переводит SCHEDULED в PENDING в момент run_at.
+
+    Наступившие задачи разбираются пакетами с FOR UPDATE SKIP LOCKED по
+    частичному индексу на run_at, поэтому ни миллионы будущих задач, ни
+    несколько одновременно работающих планировщиков не приводят к полному
+    просмотру таблицы или двойной публикации. Публикацию в брокер
+    выполняет ретранслятор outbox.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        broker: TaskBroker | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        self.session_maker = session_maker
+        self.broker = broker
+        self.batch_size = batch_size or settings.SCHEDULER_BATCH_SIZE
+        self.poll_interval = poll_interval or settings.SCHEDULER_POLL_INTERVAL
+        self.running = False
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        """Разбудить планировщик: появилась задача с ранним run_at."""
+        self._wakeup.set()
+
+    async def release_once(self) -> int:
+        """
+        Перевести в PENDING один пакет наступивших задач.
+
+        Returns:
+            Количество переведённых задач
+        """
+        async with self.session_maker() as session:
+            released = await release_due_tasks(session, datetime.now(UTC), self.batch_size)
+        if not released:
+            return 0
+
+        for priority, count in Counter(priority for _, priority in released).items():
+            task_stats.transition(
+                priority.value, TaskStatus.SCHEDULED.value, TaskStatus.PENDING.value, count
+            )
+        outbox_relay.notify()
+        broker = self.broker or task_broker()
+        if broker.connected:
+            for task_id, priority in released:
+                try:
+                    await broker.publish_status_event(
+                        TaskStatusEvent(
+                            task_id=task_id,
+                            status=TaskStatus.PENDING.value,
+                            priority=priority.value,
+                        )
+                    )
+                except Exception as e:
+                    logger.error(f"Ошибка публикации события статуса задачи {task_id}: {e}")
+
+        logger.info(f"Запланированных задач поставлено в очередь: {len(released)}")
+        return len(released)
+
+    async def seconds_until_next(self) -> float:
+        """Сколько ждать до ближайшего run_at, но не больше poll_interval."""
+        async with self.session_maker() as session:
+            next_run_at = await get_next_run_at(session)
+        if next_run_at is None:
+            return self.poll_interval
+        if next_run_at.tzinfo is None:
+            next_run_at = next_run_at.replace(tzinfo=UTC)
+        delay = (next_run_at - datetime.now(UTC)).total_seconds()
+        return min(self.poll_interval, max(0.0, delay))
+
+    async def run(self) -> None:
+        """Основной цикл: разбирать наступившие задачи, затем ждать ближайший run_at."""
+        self.running = True
+        logger.info("TaskScheduler запущен")
+
+        while self.running:
+            try:
+                released = await self.release_once()
+                if released >= self.batch_size:
+                    continue
+                timeout = await self.seconds_until_next()
+            except Exception as e:
+                logger.error(f"Ошибка планировщика задач: {e}")
+                timeout = self.poll_interval
+
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    def start(self) -> None:
+        """Запустить планировщик фоновой задачей в текущем event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Остановить планировщик."""
+        self.running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info("TaskScheduler остановлен")
+
+
+task_scheduler = TaskScheduler()
@@ -0,0 +1,87 @@
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.db import async_session_maker
+from async_task_manager.core.stats import TaskStatsRecorder, task_stats
+from async_task_manager.repositories import apply_stats_deltas
+
+logger = logging.getLogger(__name__)
+
+
+class StatsFlusher:
+    """
+    Периодическая запись накопленной в памяти статистики задач в БД.
+
+    Каждые flush_interval секунд изменения счётчиков и скетчей процесса
+    прибавляются к таблицам task_counters и task_latency_buckets одной
+    транзакцией; если запись не удалась, изменения возвращаются в память
+    и будут записаны со следующей попыткой. Работает в процессах API и воркера.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        recorder: TaskStatsRecorder = task_stats,
+        flush_interval: float | None = None,
+    ):
+        self.session_maker = session_maker
+        self.recorder = recorder
+        self.flush_interval = flush_interval or settings.STATS_FLUSH_INTERVAL
+        self.running = False
+        self._task: asyncio.Task | None = None
+
+    async def flush_once(self) -> bool:
+        """
+        Записать накопленные изменения.
+
+        Returns:
+            True, если было что записывать и запись удалась
+        """
+        delta = self.recorder.drain()
+        if not delta:
+            return False
+        try:
+            async with self.session_maker() as session:
+                await apply_stats_deltas(session, delta)
+        except Exception:
+            self.recorder.restore(delta)
+            raise
+        return True
+
+    async def run(self) -> None:
+        """Основной цикл: записывать статистику раз в flush_interval."""
+        self.running = True
+        logger.info("StatsFlusher запущен")
+
+        while self.running:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush_once()
+            except Exception as e:
+                logger.error(f"Ошибка записи статистики задач: {e}")
+
+    def start(self) -> None:
+        """Запустить запись фоновой задачей в текущем event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Остановить запись, сохранив последние изменения."""
+        self.running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        try:
+            await self.flush_once()
+        except Exception as e:
+            logger.error(f"Ошибка записи статистики задач при остановке: {e}")
+        logger.info("StatsFlusher остановлен")
+
+
+stats_flusher = StatsFlusher()
@@ -0,0 +1,112 @@
+import asyncio
+import contextlib
+import logging
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from async_task_manager.core.config import settings
+from async_task_manager.core.db import async_session_maker
+from async_task_manager.repositories import StatusTransition, apply_status_transitions
+
+logger = logging.getLogger(__name__)
+
+
+class StatusWriteBuffer:
+    """
+    Буфер отложенной записи статусов задач (write-behind).
+
+    Переходы статусов накапливаются и записываются пакетами — каждые
+    flush_interval секунд или по достижении max_batch_size задач. Переходы
+    одной задачи, попавшие в один пакет, объединяются в одну строку.
+    submit() завершается только после commit пакета, поэтому сообщение
+    подтверждается (ack) лишь когда его итоговый статус надёжно записан.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        flush_interval: float | None = None,
+        max_batch_size: int | None = None,
+    ):
+        self.session_maker = session_maker
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.WORKER_STATUS_BATCH_INTERVAL_MS / 1000
+        )
+        self.max_batch_size = max_batch_size or settings.WORKER_STATUS_BATCH_SIZE
+        self.running = False
+        self._pending: dict[uuid.UUID, tuple[StatusTransition, list[asyncio.Future]]] = {}
+        self._full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def submit(self, transition: StatusTransition) -> bool:
+        """
+        Поставить переход в пакет и дождаться его записи.
+
+        Returns:
+            True, если переход применён (задача была в ожидаемом статусе)
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        entry = self._pending.get(transition.task_id)
+        if entry is None:
+            self._pending[transition.task_id] = (transition, [future])
+        else:
+            previous, futures = entry
+            futures.append(future)
+            self._pending[transition.task_id] = (previous.merge(transition), futures)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._full.set()
+
+        return await future
+
+    async def flush(self) -> None:
+        """Записать все накопленные переходы одной транзакцией."""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        try:
+            async with self.session_maker() as session:
+                applied = await apply_status_transitions(
+                    session, [transition for transition, _ in batch.values()]
+                )
+        except Exception as e:
+            logger.error(f"Ошибка пакетной записи статусов {len(batch)} задач: {e}")
+            for _, futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for task_id, (_, futures) in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(task_id in applied)
+
+    async def run(self) -> None:
+        """Цикл сброса буфера по таймеру или заполнению."""
+        self.running = True
+        while self.running:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            self._full.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Запустить цикл сброса фоновой задачей."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Остановить цикл и записать оставшиеся переходы."""
+        self.running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
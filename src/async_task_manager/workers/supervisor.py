@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.process import BaseProcess
+
+from async_task_manager.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _worker_process_main(index: int) -> None:
+    """Точка входа дочернего процесса: один TaskWorker в собственном event loop."""
+    from async_task_manager.workers.task_worker import run_worker
+
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    logger.info(f"Процесс воркера #{index} запущен (pid={os.getpid()})")
+    asyncio.run(run_worker(index))
+
+
+class WorkerSupervisor:
+    """
+    Супервизор процессов воркера.
+
+    Запускает processes процессов TaskWorker (по умолчанию по числу ядер CPU),
+    перезапускает аварийно завершившиеся процессы с экспоненциальной задержкой
+    и по SIGTERM/SIGINT пересылает сигнал дочерним процессам, давая им
+    завершить выполняемые задачи.
+    """
+
+    # Процесс, проработавший меньше, считается упавшим при старте
+    MIN_UPTIME = 5.0
+    MAX_RESTART_DELAY = 30.0
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        shutdown_timeout: float | None = None,
+        restart_delay: float = 1.0,
+    ):
+        self.processes = processes or os.cpu_count() or 1
+        self.shutdown_timeout = (
+            shutdown_timeout if shutdown_timeout is not None else settings.WORKER_SHUTDOWN_TIMEOUT
+        )
+        self.restart_delay = restart_delay
+        self._context = multiprocessing.get_context("spawn")
+        self._children: dict[int, BaseProcess] = {}
+        self._started_at: dict[int, float] = {}
+        self._delays: dict[int, float] = {}
+        self._restart_at: dict[int, float] = {}
+        self._stopping = False
+
+    def _spawn(self, index: int) -> None:
+        """Запустить процесс воркера с номером index."""
+        process = self._context.Process(
+            target=_worker_process_main, args=(index,), name=f"task-worker-{index}"
+        )
+        process.start()
+        self._children[index] = process
+        self._started_at[index] = time.monotonic()
+        logger.info(f"Запущен процесс воркера #{index} (pid={process.pid})")
+
+    def _handle_signal(self, signum: int, frame) -> None:
+        """Обработчик SIGTERM/SIGINT: начать плавную остановку."""
+        logger.info(f"Супервизор получил сигнал {signal.Signals(signum).name}")
+        self._stopping = True
+
+    def _check_children(self) -> None:
+        """Перезапустить завершившиеся процессы с учётом задержки."""
+        now = time.monotonic()
+        for index, process in list(self._children.items()):
+            if process.is_alive():
+                continue
+
+            if index not in self._restart_at:
+                uptime = now - self._started_at[index]
+                if uptime < self.MIN_UPTIME:
+                    delay = min(
+                        self._delays.get(index, self.restart_delay) * 2, self.MAX_RESTART_DELAY
+                    )
+                else:
+                    delay = self.restart_delay
+                self._delays[index] = delay
+                self._restart_at[index] = now + delay
+                logger.error(
+                    f"Процесс воркера #{index} (pid={process.pid}) завершился с кодом "
+                    f"{process.exitcode}, перезапуск через {delay:.1f} с"
+                )
+            elif now >= self._restart_at.pop(index):
+                self._spawn(index)
+
+    def _shutdown(self) -> None:
+        """Отправить SIGTERM всем процессам и дождаться их завершения."""
+        for process in self._children.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for index, process in self._children.items():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(
+                    f"Процесс воркера #{index} не завершился вовремя, принудительная остановка"
+                )
+                process.kill()
+                process.join()
+
+        logger.info("Все процессы воркера остановлены")
+
+    def run(self) -> None:
+        """Запустить процессы и следить за ними до получения сигнала остановки."""
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+
+        logger.info(f"Супервизор запускает {self.processes} процессов воркера")
+        for index in range(self.processes):
+            self._spawn(index)
+
+        try:
+            while not self._stopping:
+                self._check_children()
+                time.sleep(0.5)
+        finally:
+            self._shutdown()
+
+
+def run_supervisor(processes: int | None = None) -> None:
+    """Запуск супервизора процессов воркера."""
+    WorkerSupervisor(processes=processes).run()
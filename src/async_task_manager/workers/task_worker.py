@@ -1,149 +1,495 @@
 import asyncio
 import json
 import logging
+import signal
+import time
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
-
-from aio_pika.abc import AbstractIncomingMessage
-from sqlalchemy import select, update
-
+from functools import partial
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from async_task_manager.core.broker import (
+    PRIORITIES,
+    PRIORITY_QUEUE_KEY,
+    TaskBroker,
+    get_broker,
+)
+from async_task_manager.core.config import settings
 from async_task_manager.core.db import async_session_maker
-from async_task_manager.core.rabbitmq import get_rabbitmq_manager
+from async_task_manager.core.events import TaskStatusEvent
+from async_task_manager.core.metrics import (
+    TASK_EXECUTION_SECONDS,
+    TASK_QUEUE_WAIT_SECONDS,
+    TASKS_FINISHED_TOTAL,
+    TASKS_IN_FLIGHT,
+)
+from async_task_manager.core.results import ResultBackend, result_backend
+from async_task_manager.core.stats import QUEUE_WAIT, RUN_TIME, task_stats
+from async_task_manager.core.tracing import TRACEPARENT_HEADER, parse_traceparent, tracer
 from async_task_manager.models import Task, TaskStatus
+from async_task_manager.repositories import (
+    StatusTransition,
+    claim_task,
+    complete_task,
+    fail_task,
+    retry_task,
+)
+
+from .cancellation import CancellationRegistry
+from .dispatcher import PriorityDispatcher
+from .handlers import (
+    HandlerInvoker,
+    TaskContext,
+    UnknownTaskTypeError,
+    build_invoker,
+    handler_registry,
+    load_handler_modules,
+)
+from .metrics_server import MetricsServer
+from .stats_flusher import StatsFlusher
+from .status_buffer import StatusWriteBuffer
 
 logger = logging.getLogger(__name__)
 
+# Ошибки, при которых повтор задачи бессмыслен
+NON_RETRYABLE_ERRORS = (UnknownTaskTypeError,)
 
-class TaskWorker:
-    """Воркер для обработки задач из RabbitMQ очередей."""
 
-    def __init__(self):
-        self.rabbitmq = None
+def _error_text(error: Exception) -> str:
+    """Текст ошибки для строки задачи, не длиннее TASK_ERROR_MAX_LENGTH."""
+    text = str(error)
+    limit = settings.TASK_ERROR_MAX_LENGTH
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # SQLite возвращает время без часового пояса
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+class TaskWorker:
+    """Воркер для обработки задач из очередей брокера."""
+
+    def __init__(
+        self,
+        scheduling_mode: str | None = None,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        result_backend: ResultBackend = result_backend,
+        broker: TaskBroker | None = None,
+    ):
+        self.broker = broker
+        self.session_maker = session_maker
+        self.result_backend = result_backend
         self.running = False
+        self.scheduling_mode = scheduling_mode or settings.WORKER_SCHEDULING_MODE
+        self.dispatcher: PriorityDispatcher | None = None
+        self._slots = {
+            priority: asyncio.BoundedSemaphore(limit)
+            for priority, limit in settings.WORKER_MAX_IN_FLIGHT.items()
+        }
+        self._total_slots = asyncio.BoundedSemaphore(settings.WORKER_CONCURRENCY)
+        self.cpu_pool: ProcessPoolExecutor | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._processing: set[asyncio.Task] = set()
+        self._stopped = asyncio.Event()
+        self.cancellations = CancellationRegistry()
+        self._invokers: dict[str, HandlerInvoker] = {}
+        self._prepare_handlers()
+        self.status_buffer: StatusWriteBuffer | None = None
+        if settings.WORKER_STATUS_BATCH_ENABLED:
+            self.status_buffer = StatusWriteBuffer(session_maker=session_maker)
+        self.stats_flusher: StatsFlusher | None = None
+        if settings.STATS_ENABLED:
+            self.stats_flusher = StatsFlusher(session_maker=session_maker)
+
+    def _prepare_handlers(self) -> None:
+        """Заранее собрать вызовы всех зарегистрированных обработчиков по типу задачи."""
+        self._invokers = {
+            spec.task_type: build_invoker(
+                spec,
+                run_in_thread=asyncio.to_thread,
+                run_in_process=self.run_cpu_bound,
+                default_timeout=settings.WORKER_HANDLER_TIMEOUT,
+            )
+            for spec in handler_registry.specs()
+        }
 
     async def start(self) -> None:
-        """Запуск воркера для всех приоритетов."""
-        self.rabbitmq = await get_rabbitmq_manager()
+        """Запуск воркера для всех приоритетов; работает до вызова stop()."""
+        if self.broker is None:
+            self.broker = await get_broker()
         self.running = True
+        self._stopped.clear()
 
-        priorities = ["HIGH", "MEDIUM", "LOW"]
-        tasks = []
+        if settings.WORKER_CPU_POOL_SIZE > 0 and self.cpu_pool is None:
+            self.cpu_pool = ProcessPoolExecutor(max_workers=settings.WORKER_CPU_POOL_SIZE)
 
-        for priority in priorities:
-            task = asyncio.create_task(self._start_consumer(priority))
-            tasks.append(task)
-
-        logger.info("TaskWorker запущен для всех приоритетов")
+        load_handler_modules(settings.WORKER_HANDLER_MODULES)
+        self._prepare_handlers()
+        if self.status_buffer:
+            self.status_buffer.start()
+        if self.stats_flusher:
+            self.stats_flusher.start()
+        logger.info(f"Обработчики задач: {', '.join(sorted(self._invokers))}")
 
         try:
-            await asyncio.gather(*tasks)
+            if self.scheduling_mode == "broker_priority":
+                await self.broker.consume_tasks(PRIORITY_QUEUE_KEY, self._on_priority_queue_message)
+            else:
+                if self.scheduling_mode == "weighted":
+                    self.dispatcher = PriorityDispatcher(
+                        self._process_message,
+                        weights=settings.WORKER_PRIORITY_WEIGHTS,
+                        concurrency=settings.WORKER_CONCURRENCY,
+                        max_in_flight=settings.WORKER_MAX_IN_FLIGHT,
+                        starvation_timeout=settings.WORKER_STARVATION_TIMEOUT,
+                    )
+                    dispatcher_task = asyncio.create_task(self.dispatcher.run())
+                    self._background_tasks.add(dispatcher_task)
+                    dispatcher_task.add_done_callback(self._background_tasks.discard)
+
+                await asyncio.gather(*(self._start_consumer(p) for p in PRIORITIES))
         except Exception as e:
             logger.error(f"Ошибка в TaskWorker: {e}")
             raise
 
+        try:
+            await self.broker.consume_cancellations(self._on_cancellation)
+        except Exception as e:
+            logger.error(f"Ошибка подписки на отмены задач: {e}")
+
+        logger.info(f"TaskWorker запущен для всех приоритетов (режим {self.scheduling_mode})")
+        await self._stopped.wait()
+
     async def _start_consumer(self, priority: str) -> None:
         """Запуск consumer для конкретного приоритета."""
+        if self.scheduling_mode == "weighted":
+            callback = self._enqueue_message
+        else:
+            callback = self._on_message
+
         try:
-            await self.rabbitmq.consume_tasks(
-                priority, lambda message: self._process_message(message, priority)
-            )
+            await self.broker.consume_tasks(priority, lambda message: callback(message, priority))
         except Exception as e:
             logger.error(f"Ошибка consumer для {priority}: {e}")
             raise
 
-    async def _process_message(self, message: AbstractIncomingMessage, priority: str) -> None:
+    async def _enqueue_message(self, message: Any, priority: str) -> None:
+        """Передать сообщение в локальную стадию диспетчеризации (режим weighted)."""
+        self.dispatcher.submit(priority, message)
+
+    async def _on_message(self, message: Any, priority: str) -> None:
+        """
+        Обработка сообщения независимым consumer'ом (режим independent).
+
+        aio_pika запускает обработку каждого доставленного сообщения отдельной
+        задачей, поэтому одновременно выполняется до prefetch_count задач
+        очереди; семафор приоритета дополнительно ограничивает их число
+        значением WORKER_MAX_IN_FLIGHT.
+        """
+        async with self._slots[priority]:
+            await self._process_message(message, priority)
+
+    async def _on_priority_queue_message(self, message: Any) -> None:
+        """Обработка сообщения из единой очереди с приоритетами (режим broker_priority)."""
+        async with self._total_slots:
+            await self._process_message(message, PRIORITY_QUEUE_KEY)
+
+    async def _on_cancellation(self, task_id: uuid.UUID) -> None:
+        """Отмена задачи из tasks.cancel: прервать выполнение, если она выполняется здесь."""
+        if self.cancellations.cancel(task_id):
+            logger.info(f"Выполнение задачи {task_id} прервано отменой")
+
+    async def _process_message(self, message: Any, priority: str) -> None:
         """
         Обработка сообщения из очереди.
 
+        Подтверждение (ack/reject) выполняется по каждому сообщению отдельно
+        после завершения его обработки. Сообщение об уже отменённой задаче
+        подтверждается сразу, без обращения к БД. Обработка пишется span'ом
+        task.process, продолжающим трассу из заголовка traceparent.
+
         Args:
-            message: Сообщение из RabbitMQ
+            message: Сообщение из очереди брокера
             priority: Приоритет очереди
         """
+        current = asyncio.current_task()
+        self._processing.add(current)
+
+        task_id = None
+        headers = getattr(message, "headers", None) or {}
         async with message.process():
-            try:
-                body = json.loads(message.body.decode())
-                task_id = uuid.UUID(body["task_id"])
+            with tracer.start_span(
+                "task.process",
+                parent=parse_traceparent(headers.get(TRACEPARENT_HEADER)),
+                kind="consumer",
+                attributes={"task.queue": priority},
+            ) as span:
+                try:
+                    body = json.loads(message.body.decode())
+                    task_id = uuid.UUID(body["task_id"])
+                    if span is not None:
+                        span.set_attribute("task.id", str(task_id))
+                        span.set_attribute("task.attempt", headers.get("x-retry-attempt", 0))
 
-                logger.info(f"Обработка задачи {task_id} из очереди {priority}")
+                    if self.cancellations.is_cancelled(task_id):
+                        logger.info(f"Задача {task_id} отменена, сообщение отброшено")
+                        return
 
-                await self._execute_task(task_id)
+                    logger.info(f"Обработка задачи {task_id} из очереди {priority}")
 
-                logger.info(f"Задача {task_id} успешно выполнена")
+                    self.cancellations.track(task_id, current)
+                    await self._execute_task(task_id)
 
-            except Exception as e:
-                logger.error(f"Ошибка обработки сообщения: {e}")
-                raise
+                    logger.info(f"Обработка задачи {task_id} завершена")
+
+                except Exception as e:
+                    logger.error(f"Ошибка обработки сообщения: {e}")
+                    raise
+                finally:
+                    if task_id is not None:
+                        self.cancellations.untrack(task_id)
+                    self._processing.discard(current)
+
+    async def run_cpu_bound(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Выполнить CPU-bound функцию вне event loop.
+
+        Функция выполняется в пуле процессов (WORKER_CPU_POOL_SIZE > 0) и должна
+        быть picklable вместе с аргументами; без пула — в пуле потоков.
+        Event loop тем временем продолжает получать и обрабатывать сообщения.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.cpu_pool, partial(func, *args))
 
     async def _execute_task(self, task_id: uuid.UUID) -> None:
         """
         Выполнение задачи по ID.
 
+        Задача захватывается одним условным UPDATE (PENDING -> IN_PROGRESS),
+        итоговый статус записывается только из IN_PROGRESS, поэтому
+        повторная доставка сообщения не запускает задачу дважды, а отмена
+        во время выполнения не перезаписывается результатом. Отмена из
+        tasks.cancel прерывает выполнение сразу; статус CANCELLED к этому
+        моменту уже записан API. После ошибки задача откладывается на
+        повтор, пока не исчерпан max_retries, затем получает статус FAILED
+        и копируется в очередь tasks.dead.
+
         Args:
             task_id: UUID задачи
         """
-        async with async_session_maker() as session:
+        task: Task | None = None
+        priority: str | None = None
+        claimed_at = 0.0
+        async with self.session_maker() as session:
             try:
-                result = await session.execute(select(Task).where(Task.id == task_id))
-                task = result.scalar_one_or_none()
-
+                task = await claim_task(session, task_id)
                 if not task:
-                    logger.warning(f"Задача {task_id} не найдена в БД")
-                    return
-
-                if task.status != TaskStatus.PENDING:
-                    logger.warning(f"Задача {task_id} имеет статус {task.status}, пропускаем")
-                    return
-
-                await session.execute(
-                    update(Task)
-                    .where(Task.id == task_id)
-                    .values(
-                        status=TaskStatus.IN_PROGRESS,
-                        started_at=datetime.now(UTC),
+                    logger.warning(
+                        f"Задача {task_id} не найдена или уже не в статусе PENDING, пропускаем"
                     )
-                )
-                await session.commit()
+                    return
 
+                priority = task.priority.value
+                TASKS_IN_FLIGHT.labels(priority).inc()
+                claimed_at = time.monotonic()
+                self._record_claim(task)
                 logger.info(f"Задача {task_id} переведена в статус IN_PROGRESS")
-
-                result = await self._simulate_task_execution(task)
-
-                await session.execute(
-                    update(Task)
-                    .where(Task.id == task_id)
-                    .values(
-                        status=TaskStatus.COMPLETED,
-                        finished_at=datetime.now(UTC),
-                        result=result,
+                await self._publish_status_event(task_id, TaskStatus.IN_PROGRESS, priority)
+
+                with tracer.start_span(
+                    "task.handler", require_parent=True, attributes={"task.type": task.type}
+                ):
+                    result = await self._run_handler(task)
+                result, result_ref = await self._store_result(result)
+
+                if await self._finish_task(
+                    session, task_id, TaskStatus.COMPLETED, result=result, result_ref=result_ref
+                ):
+                    logger.info(f"Задача {task_id} завершена успешно")
+                    self._record_finish(priority, TaskStatus.COMPLETED, claimed_at)
+                    await self._publish_status_event(task_id, TaskStatus.COMPLETED, priority)
+                else:
+                    logger.info(
+                        f"Задача {task_id} отменена во время выполнения, результат отброшен"
                     )
-                )
-                await session.commit()
 
-                logger.info(f"Задача {task_id} завершена успешно")
+            except asyncio.CancelledError:
+                if not self.cancellations.is_cancelled(task_id):
+                    raise
+                asyncio.current_task().uncancel()
+                await session.rollback()
+                logger.info(f"Задача {task_id} отменена во время выполнения")
 
             except Exception as e:
                 logger.error(f"Ошибка выполнения задачи {task_id}: {e}")
 
                 try:
-                    await session.execute(
-                        update(Task)
-                        .where(Task.id == task_id)
-                        .values(
-                            status=TaskStatus.FAILED,
-                            finished_at=datetime.now(UTC),
-                            error=str(e),
-                        )
-                    )
-                    await session.commit()
+                    await session.rollback()
+                    if task is not None and await self._schedule_retry(session, task, e):
+                        return
+                    if await self._finish_task(
+                        session,
+                        task_id,
+                        TaskStatus.FAILED,
+                        error=_error_text(e),
+                        error_type=type(e).__name__,
+                    ):
+                        self._record_finish(priority, TaskStatus.FAILED, claimed_at)
+                        await self._publish_status_event(task_id, TaskStatus.FAILED, priority)
+                        await self._publish_dead_letter(task_id, priority, _error_text(e))
                 except Exception as update_error:
                     logger.error(f"Ошибка обновления статуса задачи {task_id}: {update_error}")
 
                 raise
 
-    async def _simulate_task_execution(self, task: Task) -> str:
+            finally:
+                if claimed_at:
+                    TASKS_IN_FLIGHT.labels(priority).dec()
+
+    async def _schedule_retry(self, session: AsyncSession, task: Task, error: Exception) -> bool:
+        """
+        Отложить повтор задачи после ошибки.
+
+        Сообщение публикуется в очередь повторов до возврата задачи в PENDING:
+        если публикация не удалась, задача завершается как FAILED, а не
+        остаётся в PENDING без сообщения. Если задачу успели отменить,
+        отложенное сообщение будет пропущено при захвате.
+
+        Returns:
+            True, если повтор запланирован и исходное сообщение можно подтвердить
+        """
+        if isinstance(error, NON_RETRYABLE_ERRORS) or task.retry_count >= task.max_retries:
+            return False
+        if self.broker is None:
+            return False
+
+        attempt = task.retry_count + 1
+        try:
+            await self.broker.publish_retry(task.id, task.priority.value, attempt)
+        except Exception as e:
+            logger.error(f"Ошибка публикации повтора задачи {task.id}: {e}")
+            return False
+
+        if await retry_task(
+            session, task.id, task.retry_count, _error_text(error), error_type=type(error).__name__
+        ):
+            logger.info(
+                f"Задача {task.id} возвращена в PENDING, повтор {attempt}/{task.max_retries}"
+            )
+            task_stats.transition(
+                task.priority.value, TaskStatus.IN_PROGRESS.value, TaskStatus.PENDING.value
+            )
+            await self._publish_status_event(task.id, TaskStatus.PENDING, task.priority.value)
+        return True
+
+    async def _publish_dead_letter(
+        self, task_id: uuid.UUID, priority: str | None, error: str
+    ) -> None:
+        """Скопировать окончательно упавшую задачу в tasks.dead (ошибка только логируется)."""
+        if priority is None or not getattr(self.broker, "connected", False):
+            return
+        try:
+            await self.broker.publish_dead_letter(task_id, priority, error)
+        except Exception as e:
+            logger.error(f"Ошибка отправки задачи {task_id} в очередь мёртвых задач: {e}")
+
+    async def _finish_task(
+        self,
+        session: AsyncSession,
+        task_id: uuid.UUID,
+        status: TaskStatus,
+        result: str | None = None,
+        result_ref: str | None = None,
+        error: str | None = None,
+        error_type: str | None = None,
+    ) -> bool:
+        """
+        Записать итоговый статус задачи (только из IN_PROGRESS).
+
+        При включённой пакетной записи переход попадает в буфер, и метод
+        завершается после commit пакета, содержащего задачу.
+        """
+        if self.status_buffer:
+            return await self.status_buffer.submit(
+                StatusTransition(
+                    task_id=task_id,
+                    status=status,
+                    expected_status=TaskStatus.IN_PROGRESS,
+                    finished_at=datetime.now(UTC),
+                    result=result,
+                    result_ref=result_ref,
+                    error=error,
+                    error_type=error_type,
+                )
+            )
+        if status == TaskStatus.COMPLETED:
+            return await complete_task(session, task_id, result, result_ref)
+        return await fail_task(session, task_id, error, error_type)
+
+    def _record_claim(self, task: Task) -> None:
+        """Учесть захват задачи и (для первой попытки) время ожидания в очереди."""
+        priority = task.priority.value
+        task_stats.transition(priority, TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value)
+        if task.retry_count == 0:
+            queued_at = _as_utc(task.created_at)
+            if task.run_at is not None:
+                queued_at = max(queued_at, _as_utc(task.run_at))
+            wait = max(0.0, (_as_utc(task.started_at) - queued_at).total_seconds())
+            task_stats.observe(QUEUE_WAIT, priority, wait)
+            TASK_QUEUE_WAIT_SECONDS.labels(priority).observe(wait)
+
+    def _record_finish(self, priority: str, status: TaskStatus, claimed_at: float) -> None:
+        """Учесть итоговый статус и время выполнения задачи."""
+        elapsed = time.monotonic() - claimed_at
+        task_stats.transition(priority, TaskStatus.IN_PROGRESS.value, status.value)
+        task_stats.observe(RUN_TIME, priority, elapsed)
+        TASK_EXECUTION_SECONDS.labels(priority).observe(elapsed)
+        TASKS_FINISHED_TOTAL.labels(priority, status.value).inc()
+
+    async def _store_result(self, result: str | None) -> tuple[str | None, str | None]:
+        """
+        Вынести большой результат в хранилище результатов.
+
+        Returns:
+            (результат, None), если он не больше RESULT_INLINE_MAX_BYTES,
+            иначе (None, ссылка на результат в хранилище)
+        """
+        if result is None:
+            return None, None
+        # UTF-8 занимает не больше 4 байт на символ: короткие строки не кодируем
+        if len(result) * 4 <= settings.RESULT_INLINE_MAX_BYTES:
+            return result, None
+        data = result.encode()
+        if len(data) <= settings.RESULT_INLINE_MAX_BYTES:
+            return result, None
+        return None, await self.result_backend.put(data)
+
+    async def _publish_status_event(
+        self, task_id: uuid.UUID, status: TaskStatus, priority: str | None = None
+    ) -> None:
+        """
+        Разослать событие смены статуса в tasks.events.
+
+        Событие сбрасывает кэш статусов в процессах API; ошибка публикации
+        только логируется — статус в БД уже записан.
+        """
+        if not getattr(self.broker, "connected", False):
+            return
+        try:
+            await self.broker.publish_status_event(
+                TaskStatusEvent(task_id=task_id, status=status.value, priority=priority)
+            )
+        except Exception as e:
+            logger.error(f"Ошибка публикации события статуса задачи {task_id}: {e}")
+
+    async def _run_handler(self, task: Task) -> str | None:
         """
-        Симуляция выполнения задачи.
-        В реальном приложении здесь была бы бизнес-логика.
+        Выполнить обработчик, зарегистрированный для типа задачи.
 
         Args:
             task: Объект задачи
@@ -151,30 +497,112 @@ class TaskWorker:
         Returns:
             Результат выполнения задачи
         """
-        priority_delays = {"HIGH": 2, "MEDIUM": 5, "LOW": 10}
+        invoker = self._invokers.get(task.type)
+        if invoker is None:
+            raise UnknownTaskTypeError(f"Неизвестный тип задачи: {task.type}")
+
+        result = await invoker(
+            TaskContext(
+                id=task.id,
+                type=task.type,
+                title=task.title,
+                description=task.description,
+                priority=task.priority.value,
+            )
+        )
+        if result is None or isinstance(result, str):
+            return result
+        return json.dumps(result, ensure_ascii=False, default=str)
+
+    def request_stop(self) -> None:
+        """Запросить остановку: start() завершится, после чего нужно вызвать stop()."""
+        self.running = False
+        self._stopped.set()
 
-        delay = priority_delays.get(task.priority.value, 5)
-        await asyncio.sleep(delay)
+    async def stop(self, timeout: float | None = None) -> None:
+        """
+        Плавная остановка воркера.
 
-        return f"Задача '{task.title}' выполнена успешно. Приоритет: {task.priority.value}"
+        Прекращает получение новых сообщений, ждёт завершения уже выполняемых
+        задач (не дольше timeout секунд, по умолчанию WORKER_SHUTDOWN_TIMEOUT)
+        и закрывает соединение. Неподтверждённые сообщения, которые не успели
+        начать выполняться, RabbitMQ вернёт в очередь (брокер в памяти их
+        отбрасывает).
+        """
+        if timeout is None:
+            timeout = settings.WORKER_SHUTDOWN_TIMEOUT
 
-    async def stop(self) -> None:
-        """Остановка воркера."""
         self.running = False
-        if self.rabbitmq:
-            await self.rabbitmq.close()
+        if self.dispatcher:
+            self.dispatcher.stop()
+        self._stopped.set()
+
+        if self.broker:
+            await self.broker.cancel_consumers()
+
+        if self._processing:
+            logger.info(f"Ожидание завершения {len(self._processing)} выполняемых задач")
+            _, pending = await asyncio.wait(self._processing, timeout=timeout)
+            if pending:
+                logger.warning(f"{len(pending)} задач не завершились за {timeout} с, прерываем")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if self.status_buffer:
+            await self.status_buffer.stop()
+        if self.stats_flusher:
+            await self.stats_flusher.stop()
+
+        if self.cpu_pool:
+            self.cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self.cpu_pool = None
+
+        if self.broker:
+            await self.broker.close()
         logger.info("TaskWorker остановлен")
 
 
-async def run_worker():
-    """Запуск воркера задач."""
+async def run_worker(index: int = 0):
+    """
+    Запуск воркера задач; SIGTERM и SIGINT приводят к плавной остановке.
+
+    Args:
+        index: Номер процесса под супервизором (сдвиг порта метрик)
+    """
+    if settings.BROKER_BACKEND == "memory":
+        logger.error(
+            "BROKER_BACKEND=memory: очереди живут в процессе API, задачи выполняет "
+            "встроенный воркер; отдельный процесс воркера не нужен"
+        )
+        return
+
     worker = TaskWorker()
+    metrics_server: MetricsServer | None = None
+    if settings.WORKER_METRICS_PORT:
+        metrics_server = MetricsServer(
+            settings.WORKER_METRICS_PORT + index, settings.WORKER_METRICS_HOST
+        )
+        try:
+            await metrics_server.start()
+        except OSError as e:
+            logger.error(f"Не удалось запустить сервер метрик воркера: {e}")
+            metrics_server = None
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.request_stop)
+
     try:
         await worker.start()
+        logger.info("Получен сигнал остановки")
     except KeyboardInterrupt:
         logger.info("Получен сигнал остановки")
     finally:
         await worker.stop()
+        if metrics_server:
+            await metrics_server.stop()
+        tracer.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_batch(async_client: AsyncClient):
+    payload = {
+        "tasks": [
+            {"title": f"Пакетная задача {i}", "description": "batch", "priority": priority}
+            for i, priority in enumerate(["HIGH", "MEDIUM", "LOW"])
+        ]
+    }
+    resp = await async_client.post("/api/v1/tasks/batch", json=payload)
+    assert resp.status_code == 201
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    task_ids = [json.loads(line)["id"] for line in resp.text.splitlines()]
+    assert len(task_ids) == 3
+
+    for task_id, item in zip(task_ids, payload["tasks"], strict=True):
+        resp = await async_client.get(f"/api/v1/tasks/{task_id}")
+        assert resp.status_code == 200
+        task = resp.json()
+        assert task["title"] == item["title"]
+        assert task["priority"] == item["priority"]
+        assert task["status"] in ["PENDING", "IN_PROGRESS", "COMPLETED"]
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_batch_empty(async_client: AsyncClient):
+    resp = await async_client.post("/api/v1/tasks/batch", json={"tasks": []})
+    assert resp.status_code == 422
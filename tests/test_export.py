@@ -0,0 +1,57 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from async_task_manager.services import export_service
+from src.async_task_manager.repositories import create_tasks_bulk
+from src.async_task_manager.schemas import TaskCreate
+from tests.conftest import TestSessionLocal
+
+
+async def _create(count: int, priority: str) -> None:
+    async with TestSessionLocal() as session:
+        await create_tasks_bulk(
+            session,
+            [
+                TaskCreate(title=f"{priority}-{i}", description="", priority=priority)
+                for i in range(count)
+            ],
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_streams_in_chunks(async_client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(export_service.settings, "EXPORT_CHUNK_SIZE", 2)
+    await _create(5, "HIGH")
+    await _create(2, "LOW")
+
+    resp = await async_client.get("/api/v1/tasks/export", params={"priority": "HIGH"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(rows) == 5
+    assert {row["priority"] for row in rows} == {"HIGH"}
+    assert rows[0]["status"] == "PENDING" and rows[0]["result"] is None
+
+
+@pytest.mark.asyncio
+async def test_export_csv(async_client: AsyncClient):
+    await _create(3, "MEDIUM")
+
+    resp = await async_client.get(
+        "/api/v1/tasks/export", params={"format": "csv", "status": "PENDING"}
+    )
+    assert resp.status_code == 200
+    assert 'filename="tasks.csv"' in resp.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert sorted(row["title"] for row in rows) == ["MEDIUM-0", "MEDIUM-1", "MEDIUM-2"]
+
+    resp = await async_client.get(
+        "/api/v1/tasks/export", params={"format": "csv", "status": "FAILED"}
+    )
+    assert resp.text.strip() == ",".join(export_service.EXPORT_FIELDS)
@@ -0,0 +1,92 @@
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
+
+from async_task_manager.models import Task, TaskPriority, TaskStatus
+from tests.conftest import TestSessionLocal
+
+
+async def _insert_failed(count: int, error_type: str) -> list[uuid.UUID]:
+    finished_at = datetime.now(UTC) - timedelta(minutes=5)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": f"failed {i}",
+            "description": "",
+            "priority": TaskPriority.MEDIUM,
+            "status": TaskStatus.FAILED,
+            "finished_at": finished_at + timedelta(seconds=i),
+            "error": "boom",
+            "error_type": error_type,
+            "retry_count": 3,
+        }
+        for i in range(count)
+    ]
+    async with TestSessionLocal() as session:
+        await session.execute(insert(Task).values(rows))
+        await session.commit()
+    return [row["id"] for row in rows]
+
+
+def _ndjson(resp) -> list[dict]:
+    return [json.loads(line) for line in resp.text.splitlines() if line]
+
+
+@pytest.mark.asyncio
+async def test_failed_tasks_listed_by_error_type(async_client: AsyncClient):
+    await _insert_failed(3, "TimeoutError")
+    await _insert_failed(1, "ValueError")
+
+    resp = await async_client.get("/api/v1/tasks/failed/errors")
+    assert [(row["error_type"], row["count"]) for row in resp.json()] == [
+        ("TimeoutError", 3),
+        ("ValueError", 1),
+    ]
+
+    resp = await async_client.get(
+        "/api/v1/tasks/failed", params={"error_type": "TimeoutError", "limit": 2}
+    )
+    assert len(resp.json()) == 2
+    resp = await async_client.get(
+        "/api/v1/tasks/failed",
+        params={"error_type": "TimeoutError", "cursor": resp.headers["X-Next-Cursor"]},
+    )
+    assert len(resp.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_replay_is_batched_and_resumable(async_client: AsyncClient):
+    ids = await _insert_failed(5, "TimeoutError")
+    await _insert_failed(1, "ValueError")
+
+    resp = await async_client.post(
+        "/api/v1/tasks/failed/replay",
+        json={"error_type": "TimeoutError", "batch_size": 2, "limit": 3, "rate": 1000},
+    )
+    lines = _ndjson(resp)
+    assert [line.get("replayed") for line in lines[:-1]] == [2, 1]
+    assert lines[-1]["done"] and lines[-1]["total"] == 3
+
+    resp = await async_client.post(
+        "/api/v1/tasks/failed/replay",
+        json={"error_type": "TimeoutError", "rate": 1000, "cursor": lines[-1]["cursor"]},
+    )
+    assert _ndjson(resp)[-1]["total"] == 2
+
+    for task_id in ids:
+        resp = await async_client.get(f"/api/v1/tasks/{task_id}")
+        assert resp.json()["status"] == "PENDING"
+        assert resp.json()["retry_count"] == 0
+
+    resp = await async_client.get("/api/v1/tasks/failed/errors")
+    assert [(row["error_type"], row["count"]) for row in resp.json()] == [("ValueError", 1)]
+
+
+@pytest.mark.asyncio
+async def test_replay_rate_limited(async_client: AsyncClient):
+    resp = await async_client.post("/api/v1/tasks/failed/replay", json={"rate": 10**9})
+    assert resp.status_code == 400
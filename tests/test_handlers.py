@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from src.async_task_manager.workers.handlers import (
+    HandlerRegistry,
+    TaskContext,
+    UnknownTaskTypeError,
+    build_invoker,
+)
+
+
+def _context(task_type: str) -> TaskContext:
+    return TaskContext(id=uuid.uuid4(), type=task_type, title="t", description="d", priority="HIGH")
+
+
+async def _run_in_process(func, *args):
+    return func(*args)
+
+
+@pytest.mark.asyncio
+async def test_registry_dispatches_sync_and_async_handlers():
+    registry = HandlerRegistry()
+    main_thread = threading.get_ident()
+
+    @registry.register("async")
+    async def async_handler(task: TaskContext) -> str:
+        return f"async:{task.title}"
+
+    @registry.register("sync")
+    def sync_handler(task: TaskContext) -> str:
+        assert threading.get_ident() != main_thread
+        return f"sync:{task.title}"
+
+    invokers = {
+        spec.task_type: build_invoker(spec, asyncio.to_thread, _run_in_process)
+        for spec in registry.specs()
+    }
+    assert registry.get("async").is_async
+    assert not registry.get("sync").is_async
+    assert await invokers["async"](_context("async")) == "async:t"
+    assert await invokers["sync"](_context("sync")) == "sync:t"
+
+    with pytest.raises(UnknownTaskTypeError):
+        registry.get("missing")
+
+
+@pytest.mark.asyncio
+async def test_handler_timeout():
+    registry = HandlerRegistry()
+
+    @registry.register("slow", timeout=0.01)
+    async def slow_handler(task: TaskContext) -> None:
+        await asyncio.sleep(1)
+
+    invoker = build_invoker(registry.get("slow"), asyncio.to_thread, _run_in_process)
+    with pytest.raises(TimeoutError):
+        await invoker(_context("slow"))
+
+
+@pytest.mark.asyncio
+async def test_create_task_with_type(async_client: AsyncClient):
+    payload = {"title": "typed", "description": "d", "priority": "LOW", "type": "report"}
+    resp = await async_client.post("/api/v1/tasks/", json=payload)
+    assert resp.status_code == 201
+    assert resp.json()["type"] == "report"
+
+    payload.pop("type")
+    resp = await async_client.post("/api/v1/tasks/", json=payload)
+    assert resp.json()["type"] == "default"
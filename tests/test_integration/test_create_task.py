@@ -4,11 +4,13 @@ import pytest
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("task_pipeline")
 async def test_create_task(async_client):
     payload = {
         "title": "integration test",
         "description": "integration test desc",
         "priority": "HIGH",
+        "type": "test.quick",
     }
     response = await async_client.post("/api/v1/tasks/", json=payload)
     assert response.status_code == 201
@@ -4,9 +4,10 @@ import pytest
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("task_pipeline")
 async def test_priority_processing(async_client):
-    payload_high = {"title": "high prio", "description": "high", "priority": "HIGH"}
-    payload_low = {"title": "low prio", "description": "low", "priority": "LOW"}
+    payload_high = {"title": "high prio", "description": "high", "priority": "HIGH", "type": "test.quick"}
+    payload_low = {"title": "low prio", "description": "low", "priority": "LOW", "type": "test.quick"}
     resp_high = await async_client.post("/api/v1/tasks/", json=payload_high)
     resp_low = await async_client.post("/api/v1/tasks/", json=payload_low)
     id_high = resp_high.json()["id"]
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from async_task_manager.core.metrics import Histogram, HistogramChild, registry
+from src.async_task_manager.workers.metrics_server import MetricsServer
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_demo_seconds", "demo", ["op"], buckets=(1.0, 0.1))
+    child = histogram.labels("x")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        child.observe(value)
+
+    text = registry.render()
+    assert 'test_demo_seconds_bucket{op="x",le="0.1"} 2' in text
+    assert 'test_demo_seconds_bucket{op="x",le="1"} 3' in text
+    assert 'test_demo_seconds_bucket{op="x",le="+Inf"} 4' in text
+    assert 'test_demo_seconds_count{op="x"} 4' in text
+    assert 'test_demo_seconds_sum{op="x"} 3.65' in text
+
+
+def test_observe_is_cheap():
+    observer = HistogramChild((0.001, 0.01, 0.1, 1.0))
+    started = time.perf_counter()
+    for _ in range(100_000):
+        observer.observe(0.05)
+    # Запас на медленные CI-машины: порядок — доли микросекунды на запись
+    assert (time.perf_counter() - started) / 100_000 < 20e-6
+
+
+@pytest.mark.asyncio
+async def test_api_metrics_endpoint(async_client: AsyncClient):
+    await async_client.post(
+        "/api/v1/tasks/", json={"title": "m", "description": "", "priority": "LOW"}
+    )
+    response = await async_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'task_db_seconds_bucket{operation="create_task",le="+Inf"}' in response.text
+    assert "# TYPE tasks_finished_total counter" in response.text
+
+
+@pytest.mark.asyncio
+async def test_worker_metrics_server():
+    server = MetricsServer(0, "127.0.0.1")
+    await server.start()
+    port = server._server.sockets[0].getsockname()[1]
+    try:
+        responses = {}
+        for path in ("/metrics", "/other"):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+            await writer.drain()
+            responses[path] = await reader.read()
+            writer.close()
+        assert responses["/metrics"].startswith(b"HTTP/1.0 200 OK")
+        assert b"# TYPE task_db_seconds histogram" in responses["/metrics"]
+        assert responses["/other"].startswith(b"HTTP/1.0 404")
+    finally:
+        await server.stop()
@@ -0,0 +1,39 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from src.async_task_manager.models import TaskOutbox
+from src.async_task_manager.workers.outbox_relay import OutboxRelay
+from tests.conftest import TestSessionLocal
+
+
+class RecordingBroker:
+    """Брокер-заглушка, запоминающий опубликованные задачи."""
+
+    def __init__(self):
+        self.published: list[tuple[str, str]] = []
+
+    async def publish_tasks(self, tasks):
+        self.published.extend((str(task_id), priority) for task_id, priority, _ in tasks)
+
+
+@pytest.mark.asyncio
+async def test_outbox_written_with_task_and_relayed(async_client: AsyncClient):
+    payload = {"title": "outbox", "description": "outbox desc", "priority": "MEDIUM"}
+    resp = await async_client.post("/api/v1/tasks/", json=payload)
+    assert resp.status_code == 201
+    task_id = resp.json()["id"]
+
+    async with TestSessionLocal() as session:
+        count = await session.scalar(select(func.count()).select_from(TaskOutbox))
+    assert count == 1
+
+    broker = RecordingBroker()
+    relay = OutboxRelay(session_maker=TestSessionLocal, broker=broker, batch_size=10)
+    assert await relay.relay_once() == 1
+    assert broker.published == [(task_id, "MEDIUM")]
+
+    async with TestSessionLocal() as session:
+        count = await session.scalar(select(func.count()).select_from(TaskOutbox))
+    assert count == 0
+    assert await relay.relay_once() == 0
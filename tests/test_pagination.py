@@ -0,0 +1,33 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_all_tasks(async_client: AsyncClient):
+    payload = {
+        "tasks": [{"title": f"page {i}", "description": "", "priority": "MEDIUM"} for i in range(5)]
+    }
+    resp = await async_client.post("/api/v1/tasks/batch", json=payload)
+    assert resp.status_code == 201
+
+    seen = []
+    resp = await async_client.get("/api/v1/tasks/", params={"limit": 2})
+    while True:
+        assert resp.status_code == 200
+        seen.extend(task["id"] for task in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        resp = await async_client.get("/api/v1/tasks/", params={"limit": 2, "cursor": cursor})
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+    offset_ids = [t["id"] for t in (await async_client.get("/api/v1/tasks/")).json()]
+    assert offset_ids == seen
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor(async_client: AsyncClient):
+    resp = await async_client.get("/api/v1/tasks/", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
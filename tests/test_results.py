@@ -0,0 +1,75 @@
+import pytest
+from httpx import AsyncClient
+
+from async_task_manager.core.results import FileResultBackend, ResultNotFoundError
+from async_task_manager.services import task_service
+from src.async_task_manager.repositories import create_task, get_task
+from src.async_task_manager.schemas import TaskCreate
+from src.async_task_manager.workers import TaskContext, handler_registry
+from src.async_task_manager.workers.task_worker import TaskWorker
+from tests.conftest import TestSessionLocal
+
+LARGE_RESULT = "данные " * 20_000
+
+
+@handler_registry.register("test.large_result")
+async def large_result_handler(task: TaskContext) -> str:
+    return LARGE_RESULT
+
+
+@handler_registry.register("test.small_result")
+async def small_result_handler(task: TaskContext) -> str:
+    return f"small:{task.title}"
+
+
+async def _run(task_type: str, backend: FileResultBackend):
+    async with TestSessionLocal() as session:
+        task = await create_task(
+            session, TaskCreate(title="result", description="", priority="LOW", type=task_type)
+        )
+    await TaskWorker(session_maker=TestSessionLocal, result_backend=backend)._execute_task(task.id)
+    async with TestSessionLocal() as session:
+        return await get_task(session, task.id)
+
+
+@pytest.mark.asyncio
+async def test_file_backend_is_content_addressed(tmp_path):
+    backend = FileResultBackend(tmp_path)
+    ref = await backend.put(b"payload")
+
+    assert await backend.put(b"payload") == ref
+    assert b"".join([chunk async for chunk in backend.open(ref)]) == b"payload"
+    assert await backend.size(ref) == len(b"payload")
+    with pytest.raises(ResultNotFoundError):
+        await backend.size("sha256:../../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_large_result_offloaded_and_streamed(
+    async_client: AsyncClient, tmp_path, monkeypatch
+):
+    backend = FileResultBackend(tmp_path)
+    monkeypatch.setattr(task_service, "result_backend", backend)
+
+    task = await _run("test.large_result", backend)
+    assert task.result is None
+    assert task.result_ref.startswith("sha256:")
+
+    resp = await async_client.get(f"/api/v1/tasks/{task.id}")
+    assert resp.json()["result"] is None
+    assert resp.json()["result_ref"] == task.result_ref
+
+    resp = await async_client.get(f"/api/v1/tasks/{task.id}/result")
+    assert resp.status_code == 200
+    assert resp.text == LARGE_RESULT
+    assert int(resp.headers["content-length"]) == len(LARGE_RESULT.encode())
+
+
+@pytest.mark.asyncio
+async def test_small_result_kept_inline(async_client: AsyncClient, tmp_path):
+    task = await _run("test.small_result", FileResultBackend(tmp_path))
+    assert task.result == "small:result"
+    assert task.result_ref is None
+
+    resp = await async_client.get(f"/api/v1/tasks/{task.id}/result")
+    assert resp.text == "small:result"
@@ -0,0 +1,53 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from async_task_manager.models import Task, TaskOutbox
+from async_task_manager.workers.scheduler import TaskScheduler
+from tests.conftest import TestSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_scheduled_task_released_when_due(async_client: AsyncClient):
+    run_at = datetime.now(UTC) + timedelta(hours=1)
+    resp = await async_client.post(
+        "/api/v1/tasks/",
+        json={
+            "title": "later",
+            "description": "",
+            "priority": "HIGH",
+            "run_at": run_at.isoformat(),
+        },
+    )
+    assert resp.status_code == 201
+    task_id = resp.json()["id"]
+    assert resp.json()["status"] == "SCHEDULED"
+
+    scheduler = TaskScheduler(session_maker=TestSessionLocal, batch_size=10, poll_interval=5)
+    assert await scheduler.release_once() == 0
+    assert await scheduler.seconds_until_next() == 5
+
+    async with TestSessionLocal() as session:
+        assert (await session.scalars(select(TaskOutbox))).all() == []
+        await session.execute(update(Task).values(run_at=datetime.now(UTC) - timedelta(seconds=1)))
+        await session.commit()
+
+    assert await scheduler.release_once() == 1
+    assert await scheduler.release_once() == 0
+
+    resp = await async_client.get(f"/api/v1/tasks/{task_id}")
+    assert resp.json()["status"] == "PENDING"
+    async with TestSessionLocal() as session:
+        outbox = (await session.scalars(select(TaskOutbox))).all()
+    assert [str(message.task_id) for message in outbox] == [task_id]
+
+
+@pytest.mark.asyncio
+async def test_run_at_requires_timezone(async_client: AsyncClient):
+    resp = await async_client.post(
+        "/api/v1/tasks/",
+        json={"title": "t", "description": "", "priority": "LOW", "run_at": "2030-01-01T00:00:00"},
+    )
+    assert resp.status_code == 422
@@ -0,0 +1,63 @@
+import random
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from async_task_manager.core.sketch import LogBucketSketch
+from async_task_manager.core.stats import task_stats
+from async_task_manager.workers.stats_flusher import StatsFlusher
+from src.async_task_manager.workers import TaskContext, handler_registry
+from src.async_task_manager.workers.task_worker import TaskWorker
+from tests.conftest import TestSessionLocal
+
+
+@handler_registry.register("test.stats")
+async def stats_handler(task: TaskContext) -> str:
+    return "ok"
+
+
+def test_sketch_quantiles_are_accurate_and_mergeable():
+    rng = random.Random(42)
+    values = [rng.lognormvariate(0, 1.5) for _ in range(20_000)]
+    left, right, whole = LogBucketSketch(0.01), LogBucketSketch(0.01), LogBucketSketch(0.01)
+    for i, value in enumerate(values):
+        (left if i % 2 else right).add(value)
+        whole.add(value)
+
+    left.merge(right)
+    assert left.buckets == whole.buckets
+
+    values.sort()
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert abs(left.quantile(q) - exact) / exact <= 0.02
+    assert LogBucketSketch().quantile(0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_stats_follow_transitions(async_client: AsyncClient):
+    task_stats.drain()
+    ids = []
+    for _ in range(3):
+        resp = await async_client.post(
+            "/api/v1/tasks/",
+            json={"title": "s", "description": "", "priority": "LOW", "type": "test.stats"},
+        )
+        ids.append(resp.json()["id"])
+
+    await async_client.delete(f"/api/v1/tasks/{ids[0]}")
+    worker = TaskWorker(session_maker=TestSessionLocal)
+    await worker._execute_task(uuid.UUID(ids[1]))
+
+    flusher = StatsFlusher(session_maker=TestSessionLocal)
+    assert await flusher.flush_once()
+    assert not await flusher.flush_once()
+
+    stats = (await async_client.get("/api/v1/tasks/stats")).json()
+    assert stats["total"] == 3
+    assert stats["by_status"] == {"PENDING": 1, "COMPLETED": 1, "CANCELLED": 1}
+    low = stats["by_priority"]["LOW"]
+    assert low["queue_wait"]["count"] == 1
+    assert low["run_time"]["count"] == 1 and low["run_time"]["p50"] is not None
+    assert stats["by_priority"]["HIGH"]["by_status"] == {}
@@ -0,0 +1,55 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from src.async_task_manager.core.cache import TaskStatusCache
+
+
+def test_cache_ignores_read_started_before_invalidate():
+    cache = TaskStatusCache(max_size=10, ttl=60)
+    task_id = uuid.uuid4()
+
+    stamp = cache.stamp()
+    cache.invalidate(task_id)
+    cache.set(task_id, "PENDING", stamp=stamp)
+    assert cache.get(task_id) is None
+
+    cache.set(task_id, "COMPLETED", stamp=cache.stamp())
+    assert cache.get(task_id) == "COMPLETED"
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TaskStatusCache(max_size=2, ttl=60)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    cache.set(first, "PENDING")
+    cache.set(second, "PENDING")
+    cache.get(first)
+    cache.set(third, "PENDING")
+
+    assert cache.get(first) == "PENDING"
+    assert cache.get(second) is None
+
+
+@pytest.mark.asyncio
+async def test_status_not_stale_after_cancel(async_client: AsyncClient):
+    resp = await async_client.post(
+        "/api/v1/tasks/", json={"title": "cached", "description": "", "priority": "LOW"}
+    )
+    task_id = resp.json()["id"]
+
+    resp = await async_client.get(f"/api/v1/tasks/{task_id}/status")
+    assert resp.status_code == 200
+
+    resp = await async_client.delete(f"/api/v1/tasks/{task_id}")
+    assert resp.status_code == 200
+
+    resp = await async_client.get(f"/api/v1/tasks/{task_id}/status")
+    assert resp.json()["status"] == "CANCELLED"
+
+
+@pytest.mark.asyncio
+async def test_status_not_found(async_client: AsyncClient):
+    resp = await async_client.get(f"/api/v1/tasks/{uuid.uuid4()}/status")
+    assert resp.status_code == 404
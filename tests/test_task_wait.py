@@ -0,0 +1,67 @@
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _create_task(
+    async_client: AsyncClient, priority: str = "HIGH", task_type: str = "test.quick"
+) -> str:
+    resp = await async_client.post(
+        "/api/v1/tasks/",
+        json={"title": "wait", "description": "", "priority": priority, "type": task_type},
+    )
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("task_pipeline")
+async def test_wait_returns_when_task_completes(async_client: AsyncClient):
+    task_id = await _create_task(async_client)
+
+    resp = await async_client.get(f"/api/v1/tasks/{task_id}/wait", params={"timeout": 5})
+
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "COMPLETED"
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_with_current_status(async_client: AsyncClient):
+    task_id = await _create_task(async_client, priority="LOW")
+
+    resp = await async_client.get(f"/api/v1/tasks/{task_id}/wait", params={"timeout": 0.05})
+
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "PENDING"
+
+
+@pytest.mark.asyncio
+async def test_wait_unknown_task(async_client: AsyncClient):
+    resp = await async_client.get(f"/api/v1/tasks/{uuid.uuid4()}/wait", params={"timeout": 0.05})
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("task_pipeline")
+async def test_events_stream_until_all_tasks_finish(async_client: AsyncClient):
+    # Задача выполняется дольше, чем открывается поток: COMPLETED придёт событием
+    completed_id = await _create_task(async_client, task_type="test.delayed")
+    cancelled_id = await _create_task(async_client, priority="LOW", task_type="test.delayed")
+    await async_client.delete(f"/api/v1/tasks/{cancelled_id}")
+
+    resp = await async_client.get(
+        "/api/v1/tasks/events", params={"ids": [completed_id, cancelled_id]}
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(line.removeprefix("data: "))
+        for line in resp.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [event["id"] for event in events[:2]] == [completed_id, cancelled_id]
+    assert events[1]["status"] == "CANCELLED"
+    assert events[-1] == {"id": completed_id, "status": "COMPLETED"}
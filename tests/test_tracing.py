@@ -0,0 +1,122 @@
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from async_task_manager.core.tracing import (
+    FileSpanExporter,
+    SpanContext,
+    SpanExporter,
+    Tracer,
+    parse_traceparent,
+    tracer,
+)
+from src.async_task_manager.core.rabbitmq import RabbitMQManager
+from src.async_task_manager.models import TaskOutbox
+from src.async_task_manager.workers import TaskContext, handler_registry
+from src.async_task_manager.workers.outbox_relay import OutboxRelay
+from src.async_task_manager.workers.task_worker import TaskWorker
+from tests.conftest import TestSessionLocal
+from tests.test_worker import FakeMessage
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+@handler_registry.register("test.traced")
+async def traced_handler(task: TaskContext) -> str:
+    return "ok"
+
+
+class CollectingExporter(SpanExporter):
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(span.to_dict() for span in spans)
+
+
+class RecordingExchange:
+    """Exchange-заглушка, запоминающая опубликованные сообщения."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def publish(self, message, routing_key):
+        self.messages.append(message)
+
+
+@pytest.fixture
+def traced(tmp_path):
+    exporter, ratio = tracer.exporter, tracer.sample_ratio
+    path = tmp_path / "traces.jsonl"
+    tracer.configure(FileSpanExporter(path), sample_ratio=1.0)
+    yield path
+    tracer.configure(exporter, sample_ratio=ratio)
+
+
+def test_traceparent_roundtrip():
+    context = parse_traceparent(TRACEPARENT)
+    assert context == SpanContext(TRACE_ID, "00f067aa0ba902b7", True)
+    assert context.to_traceparent() == TRACEPARENT
+    assert not parse_traceparent(f"00-{TRACE_ID}-00f067aa0ba902b7-00").sampled
+    for invalid in (None, "", "garbage", f"00-{'0' * 32}-00f067aa0ba902b7-01"):
+        assert parse_traceparent(invalid) is None
+
+
+def test_sampling_follows_parent_decision():
+    exporter = CollectingExporter()
+    local = Tracer(exporter, sample_ratio=0.0, batch_size=1)
+
+    with local.start_span("root") as root:
+        assert not root.is_recording
+        assert local.begin_span("db", require_parent=True) is None
+    assert local.begin_span("db", require_parent=True) is None
+
+    with local.start_span("remote", parent=parse_traceparent(TRACEPARENT)) as span:
+        with local.start_span("child", require_parent=True) as child:
+            child.set_attribute("k", "v")
+
+    assert [s["name"] for s in exporter.spans] == ["child", "remote"]
+    assert exporter.spans[0]["parent_id"] == span.context.span_id
+    assert exporter.spans[1]["parent_id"] == "00f067aa0ba902b7"
+    assert {s["trace_id"] for s in exporter.spans} == {TRACE_ID}
+    assert Tracer(None).begin_span("off") is None
+
+
+@pytest.mark.asyncio
+async def test_trace_spans_http_broker_and_worker(async_client: AsyncClient, traced):
+    resp = await async_client.post(
+        "/api/v1/tasks/",
+        json={"title": "t", "description": "", "priority": "LOW", "type": "test.traced"},
+        headers={"traceparent": TRACEPARENT},
+    )
+    task_id = resp.json()["id"]
+
+    async with TestSessionLocal() as session:
+        stored = await session.scalar(select(TaskOutbox.traceparent))
+    assert parse_traceparent(stored).trace_id == TRACE_ID
+
+    rabbitmq = RabbitMQManager()
+    rabbitmq.task_exchange = RecordingExchange()
+    relay = OutboxRelay(session_maker=TestSessionLocal, broker=rabbitmq)
+    assert await relay.relay_once() == 1
+    published = rabbitmq.task_exchange.messages[0]
+
+    message = FakeMessage(uuid.UUID(task_id), "LOW")
+    message.headers = published.headers
+    worker = TaskWorker(session_maker=TestSessionLocal)
+    await worker._process_message(message, "LOW")
+    tracer.flush()
+
+    spans = {s["name"]: s for s in map(json.loads, traced.read_text().splitlines())}
+    assert {s["trace_id"] for s in spans.values()} == {TRACE_ID}
+    assert spans["POST /api/v1/tasks/"]["parent_id"] == "00f067aa0ba902b7"
+    assert spans["db.create_task"]["parent_id"] == spans["POST /api/v1/tasks/"]["span_id"]
+    assert spans["task.publish"]["parent_id"] == spans["db.create_task"]["span_id"]
+    assert spans["task.process"]["parent_id"] == spans["task.publish"]["span_id"]
+    assert spans["db.claim_task"]["parent_id"] == spans["task.process"]["span_id"]
+    assert spans["task.handler"]["parent_id"] == spans["task.process"]["span_id"]
+    assert spans["task.process"]["attributes"]["task.id"] == task_id
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.async_task_manager.workers.dispatcher import PriorityDispatcher
+from src.async_task_manager.workers.task_worker import TaskWorker
+
+
+class FakeMessage:
+    """Минимальная замена входящего сообщения aio_pika."""
+
+    def __init__(self, task_id: uuid.UUID, priority: str):
+        self.body = json.dumps({"task_id": str(task_id), "priority": priority}).encode()
+        self.acked = False
+        self.rejected = False
+
+    @asynccontextmanager
+    async def process(self):
+        try:
+            yield
+        except Exception:
+            self.rejected = True
+            raise
+        else:
+            self.acked = True
+
+
+@pytest.mark.asyncio
+async def test_worker_limits_in_flight_tasks(monkeypatch):
+    worker = TaskWorker(scheduling_mode="independent")
+    worker._slots["LOW"] = asyncio.BoundedSemaphore(3)
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_execute(task_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    monkeypatch.setattr(worker, "_execute_task", fake_execute)
+
+    messages = [FakeMessage(uuid.uuid4(), "LOW") for _ in range(10)]
+    await asyncio.gather(*(worker._on_message(m, "LOW") for m in messages))
+
+    assert peak == 3
+    assert all(m.acked for m in messages)
+
+
+async def _dispatch_order(weights, submitted, starvation_timeout=None):
+    order = []
+    done = asyncio.Event()
+
+    async def handler(message, priority):
+        order.append(priority)
+        if len(order) == len(submitted):
+            done.set()
+
+    dispatcher = PriorityDispatcher(
+        handler, weights=weights, concurrency=1, starvation_timeout=starvation_timeout
+    )
+    for priority in submitted:
+        dispatcher.submit(priority, object())
+
+    run_task = asyncio.create_task(dispatcher.run())
+    await asyncio.wait_for(done.wait(), timeout=1)
+    dispatcher.stop()
+    await run_task
+    return order
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_weighted_order():
+    submitted = ["LOW"] * 10 + ["MEDIUM"] * 10 + ["HIGH"] * 10
+    order = await _dispatch_order({"HIGH": 6, "MEDIUM": 3, "LOW": 1}, submitted)
+
+    first_round = order[:10]
+    assert first_round.count("HIGH") == 6
+    assert first_round.count("MEDIUM") == 3
+    assert first_round.count("LOW") == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_starvation_protection():
+    submitted = ["LOW"] * 3 + ["HIGH"] * 3
+    order = await _dispatch_order({"HIGH": 100, "LOW": 1}, submitted, starvation_timeout=0)
+
+    assert order == submitted
+
+
+class FakeBroker:
+    """Брокер-заглушка для проверки остановки воркера."""
+
+    def __init__(self):
+        self.consumers_cancelled = False
+        self.closed = False
+
+    async def cancel_consumers(self):
+        self.consumers_cancelled = True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_worker_stop_drains_in_flight_tasks(monkeypatch):
+    worker = TaskWorker(scheduling_mode="independent")
+    worker.broker = FakeBroker()
+
+    async def slow_execute(task_id):
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(worker, "_execute_task", slow_execute)
+
+    message = FakeMessage(uuid.uuid4(), "HIGH")
+    processing = asyncio.create_task(worker._on_message(message, "HIGH"))
+    await asyncio.sleep(0)
+
+    await worker.stop(timeout=1)
+
+    assert processing.done()
+    assert message.acked
+    assert worker.broker.consumers_cancelled and worker.broker.closed
+
+
+@pytest.mark.asyncio
+async def test_worker_run_cpu_bound():
+    worker = TaskWorker()
+    assert await worker.run_cpu_bound(sum, [1, 2, 3]) == 6
@@ -0,0 +1,209 @@
+import asyncio
+
+import pytest
+
+from async_task_manager.models import TaskStatus
+from async_task_manager.repositories import StatusTransition
+from src.async_task_manager.repositories import cancel_task, claim_task, create_task, get_task
+from src.async_task_manager.schemas import TaskCreate
+from src.async_task_manager.workers import TaskContext, handler_registry
+from src.async_task_manager.workers.status_buffer import StatusWriteBuffer
+from src.async_task_manager.workers.task_worker import TaskWorker
+from tests.conftest import TestSessionLocal
+from tests.test_worker import FakeMessage
+
+handler_started = asyncio.Event()
+handler_release = asyncio.Event()
+
+
+@handler_registry.register("test.echo")
+async def echo_handler(task: TaskContext) -> str:
+    return f"echo:{task.title}"
+
+
+@handler_registry.register("test.blocking")
+async def blocking_handler(task: TaskContext) -> str:
+    handler_started.set()
+    await handler_release.wait()
+    return "done"
+
+
+@handler_registry.register("test.failing")
+async def failing_handler(task: TaskContext) -> str:
+    raise RuntimeError("временная ошибка")
+
+
+class RetryBroker:
+    """Брокер-заглушка, запоминающий повторы и мёртвые задачи."""
+
+    connected = True
+
+    def __init__(self):
+        self.retries = []
+        self.dead = []
+
+    async def publish_retry(self, task_id, priority, attempt):
+        self.retries.append((task_id, attempt))
+        return 1.0
+
+    async def publish_dead_letter(self, task_id, priority, error):
+        self.dead.append((task_id, error))
+
+    async def publish_status_event(self, event):
+        pass
+
+
+def _reset_blocking_handler() -> None:
+    """События привязываются к event loop, а у каждого теста он свой."""
+    global handler_started, handler_release
+    handler_started = asyncio.Event()
+    handler_release = asyncio.Event()
+
+
+async def _create(task_type: str, max_retries: int = 3):
+    async with TestSessionLocal() as session:
+        return await create_task(
+            session,
+            TaskCreate(
+                title="worker",
+                description="d",
+                priority="HIGH",
+                type=task_type,
+                max_retries=max_retries,
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_execute_task_completes():
+    task = await _create("test.echo")
+    worker = TaskWorker(session_maker=TestSessionLocal)
+
+    await worker._execute_task(task.id)
+
+    async with TestSessionLocal() as session:
+        stored = await get_task(session, task.id)
+    assert stored.status.value == "COMPLETED"
+    assert stored.result == "echo:worker"
+    assert stored.started_at is not None and stored.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_claim_task_only_once():
+    task = await _create("test.echo")
+
+    async with TestSessionLocal() as session:
+        assert (await claim_task(session, task.id)).status.value == "IN_PROGRESS"
+        assert await claim_task(session, task.id) is None
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_execution_wins():
+    _reset_blocking_handler()
+    task = await _create("test.blocking")
+    worker = TaskWorker(session_maker=TestSessionLocal)
+
+    execution = asyncio.create_task(worker._execute_task(task.id))
+    await asyncio.wait_for(handler_started.wait(), timeout=1)
+
+    async with TestSessionLocal() as session:
+        cancelled, previous = await cancel_task(session, task.id)
+    assert cancelled.status.value == "CANCELLED"
+    assert previous.value == "IN_PROGRESS"
+
+    handler_release.set()
+    await execution
+
+    async with TestSessionLocal() as session:
+        stored = await get_task(session, task.id)
+    assert stored.status.value == "CANCELLED"
+    assert stored.result is None
+
+
+@pytest.mark.asyncio
+async def test_status_buffer_batches_and_acks_after_commit():
+    claimed = [await _create("test.echo") for _ in range(2)]
+    unclaimed = await _create("test.echo")
+    async with TestSessionLocal() as session:
+        for task in claimed:
+            await claim_task(session, task.id)
+
+    buffer = StatusWriteBuffer(session_maker=TestSessionLocal, flush_interval=60, max_batch_size=3)
+    buffer.start()
+
+    transitions = [
+        StatusTransition(
+            task_id=task.id,
+            status=TaskStatus.COMPLETED,
+            expected_status=TaskStatus.IN_PROGRESS,
+            result="batched",
+        )
+        for task in [*claimed, unclaimed]
+    ]
+    applied = await asyncio.wait_for(
+        asyncio.gather(*(buffer.submit(t) for t in transitions)), timeout=1
+    )
+    await buffer.stop()
+
+    assert applied == [True, True, False]
+    async with TestSessionLocal() as session:
+        statuses = [(await get_task(session, t.id)).status.value for t in [*claimed, unclaimed]]
+    assert statuses == ["COMPLETED", "COMPLETED", "PENDING"]
+
+
+@pytest.mark.asyncio
+async def test_cancellation_interrupts_running_task():
+    _reset_blocking_handler()
+    task = await _create("test.blocking")
+    worker = TaskWorker(session_maker=TestSessionLocal)
+    message = FakeMessage(task.id, "HIGH")
+
+    processing = asyncio.create_task(worker._process_message(message, "HIGH"))
+    await asyncio.wait_for(handler_started.wait(), timeout=1)
+
+    async with TestSessionLocal() as session:
+        await cancel_task(session, task.id)
+    await worker._on_cancellation(task.id)
+    await asyncio.wait_for(processing, timeout=1)
+
+    assert message.acked
+    async with TestSessionLocal() as session:
+        assert (await get_task(session, task.id)).status.value == "CANCELLED"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_message_dropped_on_receipt():
+    task = await _create("test.echo")
+    worker = TaskWorker(session_maker=TestSessionLocal)
+    await worker._on_cancellation(task.id)
+
+    message = FakeMessage(task.id, "HIGH")
+    await worker._process_message(message, "HIGH")
+
+    assert message.acked
+    async with TestSessionLocal() as session:
+        assert (await get_task(session, task.id)).status.value == "PENDING"
+
+
+@pytest.mark.asyncio
+async def test_failed_task_retried_then_dead_lettered():
+    task = await _create("test.failing", max_retries=1)
+    worker = TaskWorker(session_maker=TestSessionLocal)
+    worker.broker = RetryBroker()
+
+    await worker._execute_task(task.id)
+
+    async with TestSessionLocal() as session:
+        stored = await get_task(session, task.id)
+    assert stored.status.value == "PENDING"
+    assert stored.retry_count == 1
+    assert worker.broker.retries == [(task.id, 1)]
+
+    with pytest.raises(RuntimeError):
+        await worker._execute_task(task.id)
+
+    async with TestSessionLocal() as session:
+        stored = await get_task(session, task.id)
+    assert stored.status.value == "FAILED"
+    assert stored.error == "временная ошибка"
+    assert worker.broker.dead == [(task.id, "временная ошибка")]
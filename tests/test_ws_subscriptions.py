@@ -0,0 +1,57 @@
+import uuid
+
+from fastapi.testclient import TestClient
+
+from async_task_manager.core.events import TaskStatusEvent
+from async_task_manager.schemas import TaskSubscriptionMessage
+from async_task_manager.services.task_subscriptions import TaskSubscriptionHub
+from src.async_task_manager.main import app
+
+
+def _subscribe(hub, subscriber, **kwargs):
+    hub.apply(subscriber, TaskSubscriptionMessage(action="subscribe", **kwargs))
+
+
+def test_hub_routes_events_by_task_id_and_filter():
+    hub = TaskSubscriptionHub(max_subscribers=10, queue_size=10, max_task_ids=10)
+    task_id = uuid.uuid4()
+    by_id, by_priority, by_status = hub.connect(), hub.connect(), hub.connect()
+    _subscribe(hub, by_id, task_ids=[task_id])
+    _subscribe(hub, by_priority, filter={"priority": "HIGH"})
+    _subscribe(hub, by_status, filter={"priority": "LOW", "status": "COMPLETED"})
+
+    hub.publish(TaskStatusEvent(task_id=task_id, status="COMPLETED", priority="HIGH"))
+
+    assert by_id.queue.qsize() == 1
+    assert by_priority.queue.qsize() == 1
+    assert by_status.queue.qsize() == 0
+
+    hub.apply(by_id, TaskSubscriptionMessage(action="unsubscribe", task_ids=[task_id]))
+    hub.publish(TaskStatusEvent(task_id=task_id, status="FAILED", priority="LOW"))
+    assert by_id.queue.qsize() == 1
+
+
+def test_hub_drops_slow_subscriber():
+    hub = TaskSubscriptionHub(max_subscribers=10, queue_size=2, max_task_ids=10)
+    slow, fast = hub.connect(), hub.connect()
+    _subscribe(hub, slow, filter={"priority": "HIGH"})
+    _subscribe(hub, fast, filter={"priority": "HIGH"})
+
+    for _ in range(3):
+        hub.publish(TaskStatusEvent(task_id=uuid.uuid4(), status="COMPLETED", priority="HIGH"))
+        fast.queue.get_nowait()
+
+    assert slow.dropped
+    assert slow.queue.get_nowait() is None
+    assert len(hub) == 1
+    assert hub.dropped_total == 1
+
+
+def test_ws_subscribe_acknowledged_and_invalid_message_rejected():
+    client = TestClient(app)
+    with client.websocket_connect("/ws/tasks") as websocket:
+        websocket.send_json({"action": "subscribe", "filter": {"priority": "HIGH"}})
+        assert websocket.receive_json() == {"type": "subscribed", "task_ids": 0, "filters": 1}
+
+        websocket.send_json({"action": "subscribe"})
+        assert websocket.receive_json()["type"] == "error"